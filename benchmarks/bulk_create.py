@@ -0,0 +1,69 @@
+"""Compare inserting rows in a single statement against chunked bulk creation on sqlite (aiosqlite).
+
+Usage: python benchmarks/bulk_create.py [--rows 1000 100000 1000000] [--chunk-size N]
+"""
+import argparse
+import asyncio
+import time
+
+import sqlalchemy
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from flama.ddd.repositories.sqlalchemy import SQLAlchemyTableManager
+
+metadata = sqlalchemy.MetaData()
+
+table = sqlalchemy.Table(
+    "puppy",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True, autoincrement=True),
+    sqlalchemy.Column("name", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("age", sqlalchemy.Integer, nullable=False),
+)
+
+
+async def single_statement(table_manager: SQLAlchemyTableManager, rows: list[dict]) -> None:
+    await table_manager._connection.execute(sqlalchemy.insert(table).values(rows).returning(table))
+
+
+async def measure(name: str, number: int, func) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.connect() as connection:
+        await connection.run_sync(metadata.create_all)
+        table_manager = SQLAlchemyTableManager(table, connection)
+        rows = [{"name": f"Puppy {i}", "age": i % 15} for i in range(number)]
+
+        start = time.perf_counter()
+        try:
+            await func(table_manager, rows)
+        except Exception as e:
+            result = f"{type(e).__name__}"
+        else:
+            result = f"{(time.perf_counter() - start) * 1000:.1f}"
+
+    await engine.dispose()
+    print(f"{number:<10}{name:<28}{result:>16}")  # noqa: T201
+
+
+async def main(numbers: list[int], chunk_size: int) -> None:
+    print(f"{'rows':<10}{'method':<28}{'time (ms)':>16}")  # noqa: T201
+    for number in numbers:
+        await measure(number=number, name="single statement", func=single_statement)
+        await measure(
+            number=number,
+            name="bulk_create returning",
+            func=lambda m, r: m.bulk_create(r, chunk_size=chunk_size, returning=True),
+        )
+        await measure(
+            number=number,
+            name="bulk_create no returning",
+            func=lambda m, r: m.bulk_create(r, chunk_size=chunk_size, returning=False),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000], help="Rows to insert")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows inserted by each statement")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.chunk_size))
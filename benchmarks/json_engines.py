@@ -0,0 +1,70 @@
+"""Compare the JSON engines available in Flama encoding and decoding representative payloads.
+
+Usage: python benchmarks/json_engines.py [--number N]
+"""
+import argparse
+import dataclasses
+import datetime
+import enum
+import timeit
+import uuid
+
+from flama import json_engines
+
+
+class Status(enum.Enum):
+    active = "active"
+    inactive = "inactive"
+
+
+@dataclasses.dataclass
+class Item:
+    id: uuid.UUID
+    name: str
+    price: float
+    tags: list[str]
+
+
+PAYLOADS = {
+    "small": {"id": 1, "name": "Canna", "active": True, "score": 0.95},
+    "resource_list": [
+        {
+            "id": i,
+            "name": f"Puppy {i}",
+            "age": i % 15,
+            "owner": {"name": "Perdy", "email": "perdy@perdy.io"},
+            "tags": ["good", "boy"],
+        }
+        for i in range(1000)
+    ],
+    "enhanced_types": [
+        {
+            "id": uuid.uuid4(),
+            "created": datetime.datetime(2023, 9, 20, 11, 30, 0),
+            "duration": datetime.timedelta(minutes=i),
+            "status": Status.active if i % 2 else Status.inactive,
+            "labels": {"foo", "bar"},
+            "item": Item(uuid.uuid4(), f"Item {i}", i * 1.5, ["foo"]),
+        }
+        for i in range(1000)
+    ],
+    "predictions": {"output": [[float(i * j) / 7 for j in range(32)] for i in range(256)]},
+}
+
+
+def main(number: int) -> None:
+    engines = [cls() for cls in json_engines.ENGINES.values() if cls.installed()]
+
+    print(f"{'payload':<16}{'engine':<10}{'dumps (ms)':>14}{'loads (ms)':>14}")  # noqa: T201
+    for name, payload in PAYLOADS.items():
+        encoded = json_engines.StdlibJSONEngine().dumps(payload)
+        for engine in engines:
+            dumps = timeit.timeit(lambda: engine.dumps(payload), number=number) / number * 1000
+            loads = timeit.timeit(lambda: engine.loads(encoded), number=number) / number * 1000
+            print(f"{name:<16}{engine.name:<10}{dumps:>14.4f}{loads:>14.4f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100, help="Iterations per measurement")
+    main(parser.parse_args().number)
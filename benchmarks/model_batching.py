@@ -0,0 +1,81 @@
+"""Compare the throughput and latency of model predictions with and without micro-batching.
+
+Concurrent clients request predictions of a single row. By default the model is synthetic, with a fixed cost for each
+call and a small cost for each row, as vectorized backends have. A scikit-learn model is used instead with
+`--framework sklearn`, if it is installed.
+
+Usage: python benchmarks/model_batching.py [--clients 1 16 64] [--requests N] [--max-batch-size N] [--max-wait-ms N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from flama.models import BatchingModelExecutor, Model, ModelExecutor
+
+
+class SyntheticModel(Model):
+    def predict(self, x):
+        time.sleep(0.001 + 0.00001 * len(x))
+        return [sum(row) for row in x]
+
+
+def sklearn_model() -> Model:
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+
+    from flama.models.models.sklearn import SKLearnModel
+
+    rng = np.random.default_rng(0)
+    x = rng.random((1000, 16))
+    estimator = LogisticRegression().fit(x, (x.sum(axis=1) > 8).astype(int))
+    return SKLearnModel(estimator, None, None)
+
+
+async def client(executor: ModelExecutor, model: Model, requests: int, latencies: list[float]) -> None:
+    for i in range(requests):
+        start = time.perf_counter()
+        await executor.predict(model, [[float(i % 2)] * 16])
+        latencies.append(time.perf_counter() - start)
+
+
+async def measure(name: str, executor: ModelExecutor, model: Model, clients: int, requests: int) -> None:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*[client(executor, model, requests, latencies) for _ in range(clients)])
+    elapsed = time.perf_counter() - start
+    executor.shutdown()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(  # noqa: T201
+        f"{clients:<10}{name:<12}{len(latencies) / elapsed:>14.0f}{quantiles[49] * 1000:>12.2f}"
+        f"{quantiles[98] * 1000:>12.2f}{executor.metrics.predictions:>12}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    model = sklearn_model() if args.framework == "sklearn" else SyntheticModel(None, None, None)
+
+    print(f"{'clients':<10}{'executor':<12}{'req/s':>14}{'p50 (ms)':>12}{'p99 (ms)':>12}{'calls':>12}")  # noqa: T201
+    for clients in args.clients:
+        await measure("single", ModelExecutor(max_workers=args.workers), model, clients, args.requests)
+        await measure(
+            "batching",
+            BatchingModelExecutor(
+                max_workers=args.workers, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+            ),
+            model,
+            clients,
+            args.requests,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--framework", choices=["synthetic", "sklearn"], default="synthetic", help="Model to use")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 64], help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="Requests of each client")
+    parser.add_argument("--workers", type=int, default=4, help="Size of the executor pool")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Rows that close a batch")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Time a batch is kept open")
+    asyncio.run(main(parser.parse_args()))
@@ -2,7 +2,7 @@ from flama.applications import *  # noqa
 from flama.background import *  # noqa
 from flama.cli import *  # noqa
 from flama.endpoints import *  # noqa
-from flama.injection.components import Component  # noqa
+from flama.injection.components import Component, Lifetime  # noqa
 from flama.modules import Module  # noqa
 from flama.routing import *  # noqa
 from flama.serialize import *  # noqa
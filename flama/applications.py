@@ -3,7 +3,7 @@ import logging
 import threading
 import typing as t
 
-from flama import asgi, exceptions, http, injection, types, url, validation, websockets
+from flama import asgi, exceptions, http, injection, json_engines, types, url, validation, websockets
 from flama.ddd.components import WorkerComponent
 from flama.events import Events
 from flama.middleware import MiddlewareStack
@@ -46,6 +46,9 @@ class Flama:
         schema: t.Optional[str] = "/schema/",
         docs: t.Optional[str] = "/docs/",
         schema_library: t.Optional[str] = None,
+        compiled_router: bool = False,
+        concurrent_injection: bool = False,
+        json_engine: t.Optional[str] = None,
     ) -> None:
         """Flama application.
 
@@ -62,6 +65,11 @@ class Flama:
         :param schema: OpenAPI schema endpoint path.
         :param docs: Docs endpoint path.
         :param schema_library: Schema library to use.
+        :param compiled_router: Resolve routes using a routes index built at startup instead of checking every route.
+        :param concurrent_injection: Resolve independent async components of a handler concurrently.
+        :param json_engine: JSON engine used by this application: 'orjson', 'msgspec' or 'json'. If not given, the one
+            of the application it is mounted in, or the one set in the 'FLAMA_JSON_ENGINE' environment variable, or
+            'json' by default.
         """
         self._debug = debug
         self._status = types.AppStatus.NOT_STARTED
@@ -83,7 +91,8 @@ class Flama:
                 "websocket_message": types.Message,
                 "websocket_encoding": types.Encoding,
                 "websocket_code": types.Code,
-            }
+            },
+            concurrent=concurrent_injection,
         )
 
         # Initialise components
@@ -103,7 +112,10 @@ class Flama:
 
         # Initialize router
         self.app = self.router = Router(
-            routes=routes, components=[*default_components, *(components or [])], lifespan=lifespan
+            routes=routes,
+            components=[*default_components, *(components or [])],
+            lifespan=lifespan,
+            compiled=compiled_router,
         )
 
         # Build middleware stack
@@ -112,6 +124,9 @@ class Flama:
         # Setup schema library
         self.schema.schema_library = schema_library
 
+        # Setup JSON engine
+        self.json_engine = json_engines.load(json_engine) if json_engine is not None else None
+
         # Add schema routes
         self.schema.add_routes()
 
@@ -152,7 +167,16 @@ class Flama:
 
         scope["app"] = self
         scope.setdefault("root_app", self)
-        await self.middleware(scope, receive, send)
+
+        if self.json_engine is None:
+            await self.middleware(scope, receive, send)
+            return
+
+        token = json_engines.current.set(self.json_engine)
+        try:
+            await self.middleware(scope, receive, send)
+        finally:
+            json_engines.current.reset(token)
 
     @property
     def status(self) -> types.AppStatus:
@@ -92,6 +92,8 @@ class CookiesComponent(Component):
 
 
 class BodyComponent(Component):
+    sequential = True  # Consumes the request stream
+
     async def resolve(self, receive: types.Receive) -> types.Body:
         body = b""
         while True:
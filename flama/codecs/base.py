@@ -19,6 +19,26 @@ class HTTPCodec(Codec):
         ...
 
 
+class ArrayCodec(HTTPCodec):
+    """Codec for binary bodies that hold an array, decoded without intermediate Python objects."""
+
+    @abc.abstractmethod
+    async def decode(self, item: "http.Request", **options) -> t.Any:
+        ...
+
+    @abc.abstractmethod
+    def encode(self, item: t.Any, **options) -> bytes:
+        ...
+
+    def content_type(self, item: t.Any) -> str:
+        """Media type of the encoded array, along with any parameter needed to decode it.
+
+        :param item: Array to encode.
+        :return: Media type.
+        """
+        return t.cast(str, self.media_type)
+
+
 class WebsocketsCodec(Codec):
     encoding: t.Optional[str] = None
 
@@ -1,3 +1,6 @@
+from flama.codecs.http.arrow import ArrowCodec  # noqa
+from flama.codecs.http.float32 import Float32Codec  # noqa
 from flama.codecs.http.jsondata import JSONDataCodec  # noqa
 from flama.codecs.http.multipart import MultiPartCodec  # noqa
+from flama.codecs.http.npy import NPYCodec  # noqa
 from flama.codecs.http.urlencoded import URLEncodedCodec  # noqa
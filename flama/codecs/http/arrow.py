@@ -0,0 +1,75 @@
+import typing as t
+
+from flama import exceptions
+from flama.codecs.base import ArrayCodec
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+try:
+    import pyarrow as pa  # type: ignore
+except Exception:  # pragma: no cover
+    pa = None  # type: ignore
+
+if t.TYPE_CHECKING:
+    from flama import http
+
+__all__ = ["ArrowCodec"]
+
+
+class ArrowCodec(ArrayCodec):
+    """Codec for arrays in Apache Arrow IPC stream format.
+
+    Each column of the table is a column of the array. A table with a single column of fixed size lists is read as an
+    array with a row for each list. Columns are read over the buffer of the request body, so they are not copied unless
+    they have nulls or several of them are stacked.
+    """
+
+    media_type = "application/vnd.apache.arrow.stream"
+    format = "arrow"
+
+    @staticmethod
+    def _check_dependencies() -> None:
+        if np is None:  # noqa
+            raise exceptions.DependencyNotInstalled(
+                dependency=exceptions.DependencyNotInstalled.Dependency.numpy, dependant=__name__
+            )
+
+        if pa is None:  # noqa
+            raise exceptions.DependencyNotInstalled(
+                dependency=exceptions.DependencyNotInstalled.Dependency.pyarrow, dependant=__name__
+            )
+
+    async def decode(self, item: "http.Request", **options) -> t.Any:
+        self._check_dependencies()
+
+        body = await item.body()
+        try:
+            table = pa.ipc.open_stream(pa.py_buffer(body)).read_all().combine_chunks()
+        except (pa.ArrowInvalid, ValueError) as exc:
+            raise exceptions.DecodeError(f"Malformed Arrow IPC stream. {exc}") from None
+
+        if table.num_rows == 0:
+            raise exceptions.DecodeError("Malformed Arrow IPC stream. It has no rows")
+
+        columns = [column.chunk(0) for column in table.columns]
+        if len(columns) == 1 and pa.types.is_fixed_size_list(columns[0].type):
+            column = columns[0]
+            return column.flatten().to_numpy(zero_copy_only=False).reshape(len(column), column.type.list_size)
+
+        arrays = [column.to_numpy(zero_copy_only=False) for column in columns]
+        return arrays[0].reshape(-1, 1) if len(arrays) == 1 else np.column_stack(arrays)
+
+    def encode(self, item: t.Any, **options) -> bytes:
+        self._check_dependencies()
+        array = np.asarray(item)
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+
+        table = pa.table({str(i): array[:, i] for i in range(array.shape[1])})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
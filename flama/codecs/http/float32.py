@@ -0,0 +1,61 @@
+import typing as t
+
+from flama import exceptions
+from flama.codecs.base import ArrayCodec
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+if t.TYPE_CHECKING:
+    from flama import http
+
+__all__ = ["Float32Codec"]
+
+
+class Float32Codec(ArrayCodec):
+    """Codec for arrays of raw little-endian float32 values, in row-major order.
+
+    The number of columns is given by the `columns` parameter of the media type, and a single row is assumed if it is
+    missing, e.g. `application/x-float32; columns=16`. The array is built over the buffer of the request body, so its
+    data is not copied.
+    """
+
+    media_type = "application/x-float32"
+    format = "float32"
+
+    @staticmethod
+    def _columns(content_type: t.Optional[str]) -> t.Optional[int]:
+        for param in (content_type or "").split(";")[1:]:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "columns":
+                return int(value.strip())
+
+        return None
+
+    @staticmethod
+    def _check_dependencies() -> None:
+        if np is None:  # noqa
+            raise exceptions.DependencyNotInstalled(
+                dependency=exceptions.DependencyNotInstalled.Dependency.numpy, dependant=__name__
+            )
+
+    async def decode(self, item: "http.Request", **options) -> t.Any:
+        self._check_dependencies()
+
+        body = await item.body()
+        try:
+            columns = self._columns(item.headers.get("Content-Type"))
+            array = np.frombuffer(body, dtype="<f4")
+            return array.reshape(-1, columns) if columns else array.reshape(1, -1)
+        except ValueError as exc:
+            raise exceptions.DecodeError(f"Malformed float32 array. {exc}") from None
+
+    def encode(self, item: t.Any, **options) -> bytes:
+        self._check_dependencies()
+        return np.ascontiguousarray(item, dtype="<f4").tobytes()
+
+    def content_type(self, item: t.Any) -> str:
+        shape = np.shape(item)
+        return f"{self.media_type}; columns={shape[1] if len(shape) > 1 else 1}"
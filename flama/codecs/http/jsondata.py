@@ -1,6 +1,6 @@
 import typing as t
 
-from flama import exceptions
+from flama import exceptions, json_engines
 from flama.codecs.base import HTTPCodec
 
 if t.TYPE_CHECKING:
@@ -15,9 +15,9 @@ class JSONDataCodec(HTTPCodec):
 
     async def decode(self, item: "http.Request", **options):
         try:
-            if await item.body() == b"":
+            if (body := await item.body()) == b"":
                 return None
 
-            return await item.json()
+            return json_engines.get().loads(body)
         except ValueError as exc:
             raise exceptions.DecodeError(f"Malformed JSON. {exc}") from None
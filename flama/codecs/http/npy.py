@@ -0,0 +1,59 @@
+import io
+import typing as t
+
+from flama import exceptions
+from flama.codecs.base import ArrayCodec
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+if t.TYPE_CHECKING:
+    from flama import http
+
+__all__ = ["NPYCodec"]
+
+
+class NPYCodec(ArrayCodec):
+    """Codec for arrays in NumPy's .npy format.
+
+    The array is built over the buffer of the request body, so its data is not copied.
+    """
+
+    media_type = "application/x-npy"
+    format = "npy"
+
+    @staticmethod
+    def _check_dependencies() -> None:
+        if np is None:  # noqa
+            raise exceptions.DependencyNotInstalled(
+                dependency=exceptions.DependencyNotInstalled.Dependency.numpy, dependant=__name__
+            )
+
+    async def decode(self, item: "http.Request", **options) -> t.Any:
+        self._check_dependencies()
+
+        body = await item.body()
+        stream = io.BytesIO(body)
+        try:
+            version = np.lib.format.read_magic(stream)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+
+            if dtype.hasobject:
+                raise ValueError("Arrays of objects are not supported")
+
+            array = np.frombuffer(body, dtype=dtype, count=int(np.prod(shape)), offset=stream.tell())
+        except ValueError as exc:
+            raise exceptions.DecodeError(f"Malformed NPY. {exc}") from None
+
+        return array.reshape(shape, order="F" if fortran_order else "C")
+
+    def encode(self, item: t.Any, **options) -> bytes:
+        self._check_dependencies()
+        stream = io.BytesIO()
+        np.save(stream, np.asarray(item), allow_pickle=False)
+        return stream.getvalue()
@@ -12,12 +12,21 @@ __all__ = ["WorkerComponent"]
 
 
 class WorkerComponent(Component):
-    def __init__(self, worker: AbstractWorker):
+    def __init__(self, worker: AbstractWorker, *, read_only_methods: t.Sequence[str] = ()):
+        """Component that injects an isolated clone of a worker.
+
+        :param worker: Worker to be injected.
+        :param read_only_methods: HTTP methods whose units of work are read only by default, e.g. GET and HEAD.
+        """
         self.worker = worker
+        self.read_only_methods = frozenset(method.upper() for method in read_only_methods)
 
     def can_handle_parameter(self, parameter: "Parameter") -> bool:
         return parameter.annotation is self.worker.__class__
 
     def resolve(self, scope: types.Scope):
         self.worker.app = scope["root_app"]
-        return self.worker
+        worker = self.worker.clone()  # Isolate the units of work of each injection
+        if scope.get("method") in self.read_only_methods:
+            worker.read_only = True
+        return worker
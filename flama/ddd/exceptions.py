@@ -7,6 +7,7 @@ __all__ = [
     "NotFoundError",
     "AlreadyExistsError",
     "MultipleRecordsError",
+    "KeysetError",
 ]
 
 
@@ -18,6 +19,12 @@ class RepositoryException(Exception):
     ...
 
 
+class KeysetError(RepositoryException, ValueError):
+    """The keyset given for listing the elements after it does not match the sorting columns."""
+
+    ...
+
+
 class ResourceException(RepositoryException):
     _error_message: t.ClassVar[str] = "exception"
 
@@ -1,3 +1,7 @@
+import datetime
+import decimal
+import inspect
+import itertools
 import typing as t
 
 from flama import exceptions
@@ -16,6 +20,8 @@ except Exception:  # pragma: no cover
 
 __all__ = ["SQLAlchemyRepository", "SQLAlchemyTableManager", "SQLAlchemyTableRepository"]
 
+_NO_DEFAULT = object()
+
 
 class SQLAlchemyRepository(BaseRepository):
     """Base class for SQLAlchemy repositories. It provides a connection to the database."""
@@ -51,11 +57,58 @@ class SQLAlchemyTableManager:
         :return: The created elements.
         :raises IntegrityError: If the element already exists or cannot be inserted.
         """
+        return t.cast(list[dict[str, t.Any]], await self.bulk_create(data))
+
+    async def bulk_create(
+        self,
+        data: t.Iterable[dict[str, t.Any]],
+        *,
+        chunk_size: int = 1000,
+        returning: bool = True,
+        copy: bool = False,
+    ) -> t.Optional[list[dict[str, t.Any]]]:
+        """Creates new elements in the table in chunks.
+
+        Elements are consumed lazily from the given iterable and inserted in chunks, each of them executed as a single
+        batched statement, so big collections do not hit the limit of parameters of a statement nor are held in
+        memory at once. All the elements must define the same columns, and the created elements are returned in the same
+        order as they are given.
+
+        If the created elements are not needed, `returning` can be disabled to avoid fetching them back. In that case,
+        `copy` enables the use of `COPY` to insert the elements when the database driver supports it, currently only
+        asyncpg, falling back to batched statements otherwise. Column defaults defined in Python are not applied by
+        `COPY`.
+
+        :param data: The data to create the elements.
+        :param chunk_size: Number of elements inserted by each statement.
+        :param returning: If the created elements should be returned.
+        :param copy: If `COPY` should be used when supported.
+        :return: The created elements, or None if they are not returned.
+        :raises IntegrityError: If any element already exists or cannot be inserted.
+        :raises ValueError: If the chunk size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer")
+
+        query = sqlalchemy.insert(self.table)
+        if returning:
+            query = query.returning(self.table, sort_by_parameter_order=True)
+
+        elements: list[dict[str, t.Any]] = []
+        iterator = iter(data)
+
         try:
-            result = await self._connection.execute(sqlalchemy.insert(self.table).values(data).returning(self.table))
+            while chunk := list(itertools.islice(iterator, chunk_size)):
+                if not returning and copy and self._connection.dialect.driver == "asyncpg":
+                    await self._copy(chunk)
+                else:
+                    result = await self._connection.execute(query, chunk)
+                    if returning:
+                        elements += [dict[str, t.Any](element._asdict()) for element in result]
         except sqlalchemy_exceptions.IntegrityError:
             raise ddd_exceptions.IntegrityError(resource=self.resource)
-        return [dict[str, t.Any](element._asdict()) for element in result]
+
+        return elements if returning else None
 
     async def retrieve(self, *clauses, **filters) -> dict[str, t.Any]:
         """Retrieves an element from the table.
@@ -105,9 +158,62 @@ class SQLAlchemyTableManager:
 
         return [dict[str, t.Any](element._asdict()) for element in result]
 
+    async def replace(self, data: dict[str, t.Any], *clauses, **filters) -> dict[str, t.Any]:
+        """Replaces an element in the table.
+
+        The element is replaced using a single `UPDATE ... RETURNING` statement. Columns not given in the data are reset
+        to their default values, or to null if they do not define one, while primary keys and columns whose default
+        depends on the insert context or is generated by the database keep their current values. If the element does
+        not exist, it raises a `NotFoundError`. If more than one element is found, it raises a
+        `MultipleRecordsError` and the changes should be rolled back.
+
+        Clauses are used to filter the elements using sqlalchemy clauses. Filters are used to filter the elements
+        using exact values to specific columns. Clauses and filters can be combined.
+
+        Clause example: `table.c["id"].in_((1, 2, 3))`
+        Filter example: `id=1`
+
+        :param data: The data of the element.
+        :param clauses: Clauses to filter the elements.
+        :param filters: Filters to filter the elements.
+        :return: The replaced element.
+        :raises NotFoundError: If the element does not exist.
+        :raises MultipleRecordsError: If more than one element is found.
+        :raises IntegrityError: If the element cannot be replaced.
+        """
+        values = {
+            column.name: default
+            for column in self.table.columns
+            if column.name not in data
+            and not column.primary_key
+            and (default := self._column_default(column)) is not _NO_DEFAULT
+        }
+        query = (
+            self._filter_query(sqlalchemy.update(self.table), *clauses, **filters)
+            .values(**values, **data)
+            .returning(self.table)
+        )
+
+        try:
+            elements = (await self._connection.execute(query)).all()
+        except sqlalchemy_exceptions.IntegrityError:
+            raise ddd_exceptions.IntegrityError(resource=self.resource)
+
+        if not elements:
+            raise ddd_exceptions.NotFoundError(resource=self.resource)
+
+        if len(elements) > 1:
+            raise ddd_exceptions.MultipleRecordsError(resource=self.resource)
+
+        return dict[str, t.Any](elements[0]._asdict())
+
     async def delete(self, *clauses, **filters) -> None:
         """Delete an element from the table.
 
+        The element is deleted using a single statement, and the number of deleted rows is used to detect missing or
+        multiple elements. If more than one element is found, they are already deleted when `MultipleRecordsError` is
+        raised, so the changes should be rolled back.
+
         Clauses are used to filter the elements using sqlalchemy clauses. Filters are used to filter the elements using
         exact values to specific columns. Clauses and filters can be combined.
 
@@ -119,14 +225,26 @@ class SQLAlchemyTableManager:
         :raises NotFoundError: If the element does not exist.
         :raises MultipleRecordsError: If more than one element is found.
         """
-        await self.retrieve(*clauses, **filters)
-
         query = self._filter_query(sqlalchemy.delete(self.table), *clauses, **filters)
 
-        await self._connection.execute(query)
+        result = await self._connection.execute(query)
+
+        if result.rowcount == 0:
+            raise ddd_exceptions.NotFoundError(resource=self.resource)
+
+        if result.rowcount > 1:
+            raise ddd_exceptions.MultipleRecordsError(resource=self.resource)
 
     async def list(
-        self, *clauses, order_by: t.Optional[str] = None, order_direction: str = "asc", **filters
+        self,
+        *clauses,
+        order_by: t.Optional[str] = None,
+        order_direction: str = "asc",
+        limit: t.Optional[int] = None,
+        offset: t.Optional[int] = None,
+        keyset: t.Optional[t.Sequence[t.Any]] = None,
+        yield_per: t.Optional[int] = None,
+        **filters,
     ) -> t.AsyncIterable[dict[str, t.Any]]:
         """Lists all the elements in the table.
 
@@ -138,26 +256,75 @@ class SQLAlchemyTableManager:
 
         Clause example: `table.c["id"].in_((1, 2, 3))`
         Order example: `order_by="id", order_direction="desc"`
+        Slice example: `limit=10, offset=20`
+        Keyset example: `order_by="name", keyset=("foo", 1)`, sorting by the order column followed by the primary key
+        Batch example: `yield_per=1000`, fetching rows from the database cursor in batches of 1000
         Filter example: `id=1`
 
         :param clauses: Clauses to filter the elements.
         :param order_by: Column to order the elements.
         :param order_direction: Direction to order the elements, either `asc` or `desc`.
+        :param limit: Maximum number of elements to return.
+        :param offset: Number of elements to skip.
+        :param keyset: Values of the sorting columns of the element after which the elements are returned.
+        :param yield_per: Number of rows fetched from the database cursor at once, all of them if not given.
         :param filters: Filters to filter the elements.
         :return: Async iterable of the elements.
+        :raises KeysetError: If the keyset does not match the sorting columns.
         """
         query = self._filter_query(sqlalchemy.select(self.table), *clauses, **filters)
 
-        if order_by:
-            query = query.order_by(
-                self.table.c[order_by].desc() if order_direction == "desc" else self.table.c[order_by]
-            )
+        columns = [self.table.c[order_by]] if order_by else []
+
+        if limit is not None or offset is not None or keyset is not None:
+            # Slices must be stable between queries, so the primary key breaks ties
+            columns += [column for column in self.table.primary_key.columns if column.name != order_by]
+
+        if keyset is not None:
+            query = query.where(self._keyset_clause(columns, keyset, order_direction))
+
+        if columns:
+            query = query.order_by(*[column.desc() if order_direction == "desc" else column for column in columns])
 
-        result = await self._connection.stream(query)
+        if limit is not None:
+            query = query.limit(limit)
+
+        if offset is not None:
+            query = query.offset(offset)
+
+        if yield_per is None:
+            for row in await self._connection.execute(query):
+                yield dict[str, t.Any](row._asdict())
+            return
+
+        # Rows are only streamed from a server side cursor when they are fetched in batches
+        result = await self._connection.stream(query.execution_options(yield_per=yield_per))
 
         async for row in result:
             yield dict[str, t.Any](row._asdict())
 
+    async def count(self, *clauses, **filters) -> int:
+        """Counts the elements in the table.
+
+        If no clauses or filters are given, it counts all the elements in the table. The elements are counted by the
+        database without fetching them.
+
+        Clauses are used to filter the elements using sqlalchemy clauses. Filters are used to filter the elements using
+        exact values to specific columns. Clauses and filters can be combined.
+
+        Clause example: `table.c["id"].in_((1, 2, 3))`
+        Filter example: `id=1`
+
+        :param clauses: Clauses to filter the elements.
+        :param filters: Filters to filter the elements.
+        :return: The number of elements.
+        """
+        query = self._filter_query(
+            sqlalchemy.select(sqlalchemy.func.count()).select_from(self.table), *clauses, **filters
+        )
+
+        return (await self._connection.execute(query)).scalar_one()
+
     async def drop(self, *clauses, **filters) -> int:
         """Drops elements in the table.
 
@@ -180,6 +347,130 @@ class SQLAlchemyTableManager:
 
         return result.rowcount
 
+    async def _copy(self, data: t.Sequence[dict[str, t.Any]]) -> None:
+        """Inserts elements in the table using `COPY` through the asyncpg connection.
+
+        :param data: The data to create the elements.
+        :raises IntegrityError: If any element already exists or cannot be inserted.
+        """
+        from asyncpg.exceptions import IntegrityConstraintViolationError
+
+        columns = list(data[0].keys())
+        raw_connection = await self._connection.get_raw_connection()
+
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+                self.table.name,
+                records=[tuple(element[column] for column in columns) for element in data],
+                columns=columns,
+                schema_name=self.table.schema,
+            )
+        except IntegrityConstraintViolationError:
+            raise ddd_exceptions.IntegrityError(resource=self.resource)
+
+    @staticmethod
+    def _keyset_value(column: sqlalchemy.Column, value: t.Any) -> t.Any:  # type: ignore
+        """Convert a keyset value back to the type of its column, checking that it matches that type.
+
+        :param column: Sorting column.
+        :param value: Value of the sorting column.
+        :return: The converted value.
+        :raises ValueError: If the value does not match the type of the column.
+        """
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:  # pragma: no cover
+            return value
+
+        if value is None or python_type is object:
+            return value
+
+        if isinstance(value, str) and python_type is not str:
+            return (
+                python_type.fromisoformat(value)
+                if python_type in (datetime.datetime, datetime.date, datetime.time)
+                else python_type(value)
+            )
+
+        if isinstance(value, bool) and python_type is not bool:
+            raise ValueError(f"Wrong value for column '{column.name}'")
+
+        if not isinstance(value, python_type) and not (
+            python_type in (float, decimal.Decimal) and isinstance(value, (int, float))
+        ):
+            raise ValueError(f"Wrong value for column '{column.name}'")
+
+        return value
+
+    @classmethod
+    def _keyset_clause(
+        cls, columns: t.Sequence[sqlalchemy.Column], keyset: t.Sequence[t.Any], order_direction: str  # type: ignore
+    ) -> t.Any:
+        """Build the clause for filtering the elements after a keyset.
+
+        Keyset values that come from an encoded cursor, such as dates or UUIDs, are converted back to the type of their
+        column.
+
+        :param columns: Sorting columns.
+        :param keyset: Values of the sorting columns.
+        :param order_direction: Direction to order the elements, either `asc` or `desc`.
+        :return: The clause.
+        :raises KeysetError: If the keyset does not match the sorting columns.
+        """
+        if not isinstance(keyset, (list, tuple)) or len(keyset) != len(columns):
+            raise ddd_exceptions.KeysetError(
+                f"Keyset must contain {len(columns)} values, the order column followed by the primary key"
+            )
+
+        try:
+            values = [
+                sqlalchemy.literal(cls._keyset_value(column, value), column.type)
+                for column, value in zip(columns, keyset)
+            ]
+        except (TypeError, ValueError, ArithmeticError) as e:
+            raise ddd_exceptions.KeysetError(f"Malformed keyset ({e})")
+
+        left, right = sqlalchemy.tuple_(*columns), sqlalchemy.tuple_(*values)
+        return left < right if order_direction == "desc" else left > right
+
+    @staticmethod
+    def _column_default(column: sqlalchemy.Column) -> t.Any:  # type: ignore
+        """Value that a column gets when it is not given in an insert.
+
+        Only defaults that do not depend on the statement can be reused in an update: scalars, SQL expressions and
+        functions without arguments for Python defaults, and literal or SQL expressions for server defaults. Columns
+        whose default depends on the insert context, or is generated by the database, such as sequences, identities or
+        computed columns, cannot be reset in an update, so they have no default.
+
+        :param column: The column.
+        :return: The default value, or a sentinel if the column cannot be reset.
+        """
+        if column.default is not None:
+            if column.default.is_scalar or column.default.is_clause_element:
+                return column.default.arg
+            if column.default.is_callable and (function := getattr(column.default.arg, "__wrapped__", None)):
+                # Functions without arguments are wrapped by SQLAlchemy, the rest of them receive the insert context
+                try:
+                    parameters = inspect.signature(function).parameters.values()
+                except (TypeError, ValueError):  # pragma: no cover
+                    parameters = []
+                if not any(
+                    x.default is x.empty and x.kind in (x.POSITIONAL_ONLY, x.POSITIONAL_OR_KEYWORD) for x in parameters
+                ):
+                    return function()
+            return _NO_DEFAULT
+
+        if isinstance(column.server_default, sqlalchemy.DefaultClause):
+            if isinstance(column.server_default.arg, str):
+                # Rendered as a string literal, as in the column definition, so the database casts it to the column type
+                return sqlalchemy.literal_column("'{}'".format(column.server_default.arg.replace("'", "''")))
+            return column.server_default.arg
+
+        if column.server_default is not None:
+            return _NO_DEFAULT
+
+        return None
+
     def _filter_query(self, query, *clauses, **filters):
         """Filters a query using clauses and filters.
 
@@ -227,6 +518,30 @@ class SQLAlchemyTableRepository(SQLAlchemyRepository):
         """
         return await self._table_manager.create(*data)
 
+    async def bulk_create(
+        self,
+        data: t.Iterable[dict[str, t.Any]],
+        *,
+        chunk_size: int = 1000,
+        returning: bool = True,
+        copy: bool = False,
+    ) -> t.Optional[list[dict[str, t.Any]]]:
+        """Creates new elements in the repository in chunks.
+
+        Elements are inserted in chunks of the given size, so big collections can be ingested without building a single
+        huge statement. If the created elements are not needed, `returning` can be disabled to avoid fetching them
+        back, and `copy` enables the use of `COPY` when the database driver supports it.
+
+        :param data: The data to create the elements.
+        :param chunk_size: Number of elements inserted by each statement.
+        :param returning: If the created elements should be returned.
+        :param copy: If `COPY` should be used when supported.
+        :return: The created elements, or None if they are not returned.
+        :raises IntegrityError: If any element already exists or cannot be inserted.
+        :raises ValueError: If the chunk size is not positive.
+        """
+        return await self._table_manager.bulk_create(data, chunk_size=chunk_size, returning=returning, copy=copy)
+
     async def retrieve(self, *clauses, **filters) -> dict[str, t.Any]:
         """Retrieves an element from the repository.
 
@@ -261,6 +576,28 @@ class SQLAlchemyTableRepository(SQLAlchemyRepository):
         """
         return await self._table_manager.update(data, *clauses, **filters)
 
+    async def replace(self, data: dict[str, t.Any], *clauses, **filters) -> dict[str, t.Any]:
+        """Replaces an element in the repository.
+
+        Columns not given in the data are reset to their default values. If the element does not exist, it raises a
+        `NotFoundError`. If more than one element is found, it raises a `MultipleRecordsError`.
+
+        Clauses are used to filter the elements using sqlalchemy clauses. Filters are used to filter the elements
+        using exact values to specific columns. Clauses and filters can be combined.
+
+        Clause example: `table.c["id"].in_((1, 2, 3))`
+        Filter example: `id=1`
+
+        :param data: The data of the element.
+        :param clauses: Clauses to filter the elements.
+        :param filters: Filters to filter the elements.
+        :return: The replaced element.
+        :raises NotFoundError: If the element does not exist.
+        :raises MultipleRecordsError: If more than one element is found.
+        :raises IntegrityError: If the element cannot be replaced.
+        """
+        return await self._table_manager.replace(data, *clauses, **filters)
+
     async def delete(self, *clauses, **filters) -> None:
         """Deletes an element from the repository.
 
@@ -279,7 +616,15 @@ class SQLAlchemyTableRepository(SQLAlchemyRepository):
         return await self._table_manager.delete(*clauses, **filters)
 
     def list(
-        self, *clauses, order_by: t.Optional[str] = None, order_direction: str = "asc", **filters
+        self,
+        *clauses,
+        order_by: t.Optional[str] = None,
+        order_direction: str = "asc",
+        limit: t.Optional[int] = None,
+        offset: t.Optional[int] = None,
+        keyset: t.Optional[t.Sequence[t.Any]] = None,
+        yield_per: t.Optional[int] = None,
+        **filters,
     ) -> t.AsyncIterable[dict[str, t.Any]]:
         """Lists all the elements in the repository.
 
@@ -291,15 +636,49 @@ class SQLAlchemyTableRepository(SQLAlchemyRepository):
 
         Clause example: `table.c["id"].in_((1, 2, 3))`
         Order example: `order_by="id", order_direction="desc"`
+        Slice example: `limit=10, offset=20`
+        Keyset example: `order_by="name", keyset=("foo", 1)`, sorting by the order column followed by the primary key
+        Batch example: `yield_per=1000`, fetching rows from the database cursor in batches of 1000
         Filter example: `id=1`
 
         :param clauses: Clauses to filter the elements.
         :param order_by: Column to order the elements.
         :param order_direction: Direction to order the elements, either `asc` or `desc`.
+        :param limit: Maximum number of elements to return.
+        :param offset: Number of elements to skip.
+        :param keyset: Values of the sorting columns of the element after which the elements are returned.
+        :param yield_per: Number of rows fetched from the database cursor at once, all of them if not given.
         :param filters: Filters to filter the elements.
         :return: Async iterable of the elements.
+        :raises KeysetError: If the keyset does not match the sorting columns.
+        """
+        return self._table_manager.list(
+            *clauses,
+            order_by=order_by,
+            order_direction=order_direction,
+            limit=limit,
+            offset=offset,
+            keyset=keyset,
+            yield_per=yield_per,
+            **filters,
+        )
+
+    async def count(self, *clauses, **filters) -> int:
+        """Counts the elements in the repository.
+
+        If no clauses or filters are given, it counts all the elements in the repository.
+
+        Clauses are used to filter the elements using sqlalchemy clauses. Filters are used to filter the elements using
+        exact values to specific columns. Clauses and filters can be combined.
+
+        Clause example: `table.c["id"].in_((1, 2, 3))`
+        Filter example: `id=1`
+
+        :param clauses: Clauses to filter the elements.
+        :param filters: Filters to filter the elements.
+        :return: The number of elements.
         """
-        return self._table_manager.list(*clauses, order_by=order_by, order_direction=order_direction, **filters)
+        return await self._table_manager.count(*clauses, **filters)
 
     async def drop(self, *clauses, **filters) -> int:
         """Drops elements in the repository.
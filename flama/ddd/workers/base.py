@@ -1,5 +1,6 @@
 import abc
 import asyncio
+import copy
 import logging
 import typing as t
 
@@ -22,17 +23,29 @@ class AbstractWorker(abc.ABC):
 
     It will be used to define the workers for the application. A worker must provide a mechanism to isolate a single
     unit of work that will be used to interact with the repositories and entities of the application.
+
+    A worker runs a single unit of work at a time, so concurrent units of work must run in different workers created
+    using `clone`. Units of work only wait for each other when the worker is explicitly created with a lock, which is
+    shared by all its clones.
+
+    The intent of a unit of work is declared with `read_only`, so workers can route units of work that only read data,
+    e.g. to a read replica. It is not declared by default, which is handled as a unit of work that may write data, and
+    it must be enabled explicitly before starting a unit of work that only reads data. Setting it to `False` explicitly
+    keeps the unit of work on the primary database even where reads are routed by default, e.g. for reading your own
+    writes.
     """
 
-    def __init__(self, app: t.Optional["Flama"] = None):
+    def __init__(self, app: t.Optional["Flama"] = None, *, lock: bool = False):
         """Initialize the worker.
 
         It will receive the application instance as a parameter.
 
         :param app: Application instance.
+        :param lock: If the units of work of this worker and its clones must run one at a time.
         """
         self._app = app
-        self._lock = asyncio.Lock()
+        self._lock = asyncio.Lock() if lock else None
+        self.read_only: t.Optional[bool] = None
 
     @property
     def app(self) -> "Flama":
@@ -58,6 +71,16 @@ class AbstractWorker(abc.ABC):
         """Delete the application instance."""
         self._app = None
 
+    def clone(self) -> "AbstractWorker":
+        """Create a worker for running an isolated unit of work.
+
+        The new worker shares the configuration of this one, including the application and the lock, but not the state
+        of any unit of work in progress.
+
+        :return: New worker.
+        """
+        return copy.copy(self)
+
     @abc.abstractmethod
     async def begin(self) -> None:
         """Start a unit of work."""
@@ -73,7 +96,8 @@ class AbstractWorker(abc.ABC):
 
     async def __aenter__(self) -> "AbstractWorker":
         """Start a unit of work."""
-        await self._lock.acquire()
+        if self._lock:
+            await self._lock.acquire()
         logger.debug("Start unit of work")
         await self.begin()
         return self
@@ -82,7 +106,8 @@ class AbstractWorker(abc.ABC):
         """End a unit of work."""
         await self.end(rollback=exc_type is not None)
         logger.debug("End unit of work")
-        self._lock.release()
+        if self._lock:
+            self._lock.release()
 
     @abc.abstractmethod
     async def commit(self) -> None:
@@ -138,6 +163,19 @@ class BaseWorker(AbstractWorker, metaclass=WorkerType):
 
     _repositories: t.ClassVar[dict[str, type[BaseRepository]]]
 
+    def clone(self) -> "BaseWorker":
+        """Create a worker for running an isolated unit of work.
+
+        The new worker shares the configuration of this one, including the application and the lock, but not the state
+        of any unit of work in progress.
+
+        :return: New worker.
+        """
+        worker = t.cast(BaseWorker, super().clone())
+        for repository in self._repositories.keys():
+            worker.__dict__.pop(repository, None)
+        return worker
+
     @abc.abstractmethod
     async def set_up(self) -> None:
         """First step in starting a unit of work."""
@@ -17,8 +17,15 @@ class HTTPWorker(BaseWorker):
 
     _client: "Client"
 
-    def __init__(self, url: t.Union[str, t.Callable[[], str]], app: t.Optional["Flama"] = None, **client_kwargs: t.Any):
-        super().__init__(app=app)
+    def __init__(
+        self,
+        url: t.Union[str, t.Callable[[], str]],
+        app: t.Optional["Flama"] = None,
+        *,
+        lock: bool = False,
+        **client_kwargs: t.Any,
+    ):
+        super().__init__(app=app, lock=lock)
         self._url = url
         self._client_kwargs = client_kwargs
 
@@ -51,6 +58,17 @@ class HTTPWorker(BaseWorker):
         """Delete the client."""
         del self._client
 
+    def clone(self) -> "HTTPWorker":
+        """Create a worker for running an isolated unit of work.
+
+        The new worker opens its own client, so it can run concurrently with this one.
+
+        :return: New worker.
+        """
+        worker = t.cast(HTTPWorker, super().clone())
+        worker.__dict__.pop("_client", None)
+        return worker
+
     async def set_up(self) -> None:
         """Initialize the client with the URL."""
         from flama.client import Client
@@ -1,9 +1,15 @@
+import asyncio
+import dataclasses
+import inspect
 import logging
 import typing as t
 
 from flama import exceptions
 from flama.ddd.workers.base import BaseWorker
 
+if t.TYPE_CHECKING:
+    from flama import Flama
+
 try:
     from sqlalchemy.ext.asyncio import AsyncConnection, AsyncTransaction
 except Exception:  # pragma: no cover
@@ -12,29 +18,121 @@ except Exception:  # pragma: no cover
     )
 
 
-__all__ = ["SQLAlchemyWorker"]
+__all__ = ["SQLAlchemyWorker", "LazyConnection", "UnitsOfWork"]
 
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass
+class UnitsOfWork:
+    """Counters of the units of work run by a worker and all its clones."""
+
+    total: int = 0
+    untouched: int = 0
+
+
+class LazyConnection:
+    """Connection of a unit of work that is opened, and its transaction begun, when the first statement is executed.
+
+    Awaiting any async method of :class:`AsyncConnection`, such as `execute`, `stream` or `scalar`, opens the connection
+    before calling it. Any other attribute, such as `begin_nested`, `in_transaction` or `info`, is taken from the opened
+    connection, so it is only available once the connection is opened, which can be forced with `await
+    worker.acquire()`. The dialect of the database is available without opening the connection.
+    """
+
+    STREAMS = frozenset(("stream", "stream_scalars"))
+
+    # The lifecycle of the connection belongs to the worker
+    DEFERRED = (
+        frozenset(
+            name
+            for name, _ in inspect.getmembers(AsyncConnection, inspect.iscoroutinefunction)
+            if not name.startswith("_")
+        )
+        | STREAMS
+    ) - {"start", "close", "aclose", "invalidate"}
+
+    def __init__(self, worker: "SQLAlchemyWorker") -> None:
+        """Initialize the connection.
+
+        :param worker: Worker running the unit of work.
+        """
+        self._worker = worker
+
+    @property
+    def dialect(self) -> t.Any:
+        """Dialect of the database.
+
+        :return: Dialect.
+        """
+        return self._worker.app.sqlalchemy.engine.dialect
+
+    def __getattr__(self, name: str) -> t.Any:
+        if name.startswith("_"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        if name not in self.DEFERRED:
+            if "_connection" in self._worker.__dict__:
+                return getattr(self._worker._connection, name)
+
+            if not hasattr(AsyncConnection, name):
+                raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+            raise AttributeError(f"'{name}' needs an opened connection, open it with 'await worker.acquire()'")
+
+        async def method(*args, **kwargs):
+            connection = await self._worker.acquire(stream=name in self.STREAMS)
+            return await getattr(connection, name)(*args, **kwargs)
+
+        return method
+
+
 class SQLAlchemyWorker(BaseWorker):
     """Worker for SQLAlchemy.
 
     It will provide a connection and a transaction to the database and create the repositories for the entities.
+
+    The connection is not opened, nor the transaction begun, until a repository executes its first statement, so units
+    of work that end before touching the database don't hold a connection. These units of work are counted in
+    `units_of_work`, shared by the worker and all its clones.
+
+    Read only units of work don't begin a transaction if their connection runs in autocommit mode, which saves the
+    BEGIN and COMMIT round trips, but each statement is isolated from the others. A transaction is still begun when
+    they stream results, as server side cursors need one.
+
+    Code that needs the :class:`AsyncConnection` itself, e.g. for beginning a savepoint, can open it explicitly with
+    `await worker.acquire()`.
     """
 
     _connection: AsyncConnection
     _transaction: AsyncTransaction
+    _lazy_connection: LazyConnection
+
+    def __init__(self, app: t.Optional["Flama"] = None, *, lock: bool = False):
+        """Initialize the worker.
+
+        :param app: Application instance.
+        :param lock: If the units of work of this worker and its clones must run one at a time.
+        """
+        super().__init__(app, lock=lock)
+        self.units_of_work = UnitsOfWork()
 
     @property
-    def connection(self) -> AsyncConnection:
+    def connection(self) -> t.Union[AsyncConnection, LazyConnection]:
         """Connection to the database.
 
+        If the unit of work has not executed any statement yet, it is a connection that will be opened on first use.
+
         :return: Connection to the database.
         :raises AttributeError: If the connection is not initialized.
         """
         try:
             return self._connection
+        except AttributeError:
+            pass
+
+        try:
+            return self._lazy_connection
         except AttributeError:
             raise AttributeError("Connection not initialized")
 
@@ -76,22 +174,69 @@ class SQLAlchemyWorker(BaseWorker):
         """Delete the transaction."""
         del self._transaction
 
-    async def set_up(self) -> None:
-        """Open a connection and begin a transaction."""
+    def clone(self) -> "SQLAlchemyWorker":
+        """Create a worker for running an isolated unit of work.
+
+        The new worker opens its own connection and transaction, so it can run concurrently with this one.
 
-        self.connection = await self.app.sqlalchemy.open_connection()
-        self.transaction = await self.app.sqlalchemy.begin_transaction(self._connection)
+        :return: New worker.
+        """
+        worker = t.cast(SQLAlchemyWorker, super().clone())
+        for attribute in ("_connection", "_transaction", "_lazy_connection", "_acquire_lock"):
+            worker.__dict__.pop(attribute, None)
+        return worker
+
+    async def acquire(self, *, stream: bool = False) -> AsyncConnection:
+        """Open a connection and begin a transaction, unless they are already opened.
+
+        It is called when the unit of work executes its first statement, but it can be awaited explicitly inside a unit
+        of work for getting the connection, which is closed when the unit of work ends.
+
+        Read only units of work use a read only connection, to a read replica if any, and they only begin a transaction
+        if the connection doesn't run in autocommit mode or if results are streamed.
+
+        :param stream: If the connection will stream results from a server side cursor, which needs a transaction.
+        :return: Connection to the database.
+        """
+        async with self._acquire_lock:
+            if "_connection" not in self.__dict__:
+                connection = await self.app.sqlalchemy.open_connection(read_only=bool(self.read_only))
+                if stream or not self.app.sqlalchemy.autocommit(connection):
+                    try:
+                        self.transaction = await self.app.sqlalchemy.begin_transaction(connection)
+                    except Exception:
+                        await self.app.sqlalchemy.close_connection(connection)
+                        raise
+                self.connection = connection
+            elif stream and "_transaction" not in self.__dict__:
+                self.transaction = await self.app.sqlalchemy.begin_transaction(self._connection)
+
+        return self._connection
+
+    async def set_up(self) -> None:
+        """Prepare a connection that is opened, and its transaction begun, when the first statement is executed."""
+        self._acquire_lock = asyncio.Lock()
+        self._lazy_connection = LazyConnection(self)
+        self.units_of_work.total += 1
 
     async def tear_down(self, *, rollback: bool = False) -> None:
-        """End a transaction and close the connection.
+        """End the transaction and close the connection, if they were opened.
 
         :param rollback: If the transaction should be rolled back.
-        :raises AttributeError: If the connection is not initialized or the transaction is not started.
+        :raises AttributeError: If the unit of work is not started.
         """
-        await self.app.sqlalchemy.end_transaction(self.transaction, rollback=rollback)
-        del self.transaction
+        del self._lazy_connection
+
+        if "_connection" not in self.__dict__:
+            self.units_of_work.untouched += 1
+            logger.debug("Unit of work ended without touching the database")
+            return
+
+        if "_transaction" in self.__dict__:
+            await self.app.sqlalchemy.end_transaction(self.transaction, rollback=rollback)
+            del self.transaction
 
-        await self.app.sqlalchemy.close_connection(self.connection)
+        await self.app.sqlalchemy.close_connection(self._connection)
         del self.connection
 
     async def repository_params(self) -> tuple[list[t.Any], dict[str, t.Any]]:
@@ -102,9 +247,11 @@ class SQLAlchemyWorker(BaseWorker):
         return [self.connection], {}
 
     async def commit(self):
-        """Commit the unit of work."""
-        await self.connection.commit()
+        """Commit the unit of work, if it touched the database."""
+        if "_connection" in self.__dict__:
+            await self._connection.commit()
 
     async def rollback(self):
-        """Rollback the unit of work."""
-        await self.connection.rollback()
+        """Rollback the unit of work, if it touched the database."""
+        if "_connection" in self.__dict__:
+            await self._connection.rollback()
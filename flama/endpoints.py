@@ -15,11 +15,11 @@ class HTTPEndpoint(types.HTTPEndpointProtocol):
         :param receive: ASGI receive function.
         :param send: ASGI send function.
         """
+        from flama.routing import RouteResolution
+
         assert scope["type"] == "http"
         app = scope["app"]
-        scope["path"] = scope.get("root_path", "").rstrip("/") + scope["path"]
-        scope["root_path"] = ""
-        route, route_scope = app.router.resolve_route(scope)
+        route, route_scope = RouteResolution.resolve(scope, self.__class__)
         self.state = {
             "scope": route_scope,
             "receive": receive,
@@ -83,11 +83,11 @@ class WebSocketEndpoint(types.WebSocketEndpointProtocol):
         :param receive: ASGI receive function.
         :param send: ASGI send function.
         """
+        from flama.routing import RouteResolution
+
         assert scope["type"] == "websocket"
         app = scope["app"]
-        scope["path"] = scope.get("root_path", "").rstrip("/") + scope["path"]
-        scope["root_path"] = ""
-        route, route_scope = app.router.resolve_route(scope)
+        route, route_scope = RouteResolution.resolve(scope, self.__class__)
         self.state = {
             "scope": route_scope,
             "receive": receive,
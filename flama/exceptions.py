@@ -35,6 +35,11 @@ class DependencyNotInstalled(ApplicationError):
         sqlalchemy = "sqlalchemy[asyncio]"
         httpx = "httpx"
         tomli = "tomli"
+        orjson = "orjson"
+        msgspec = "msgspec"
+        numpy = "numpy"
+        pyarrow = "pyarrow"
+        zstandard = "zstandard"
 
     def __init__(
         self,
@@ -1,14 +1,9 @@
-import dataclasses
-import datetime
-import enum
 import html
 import importlib.util
-import inspect
 import json
 import os
 import pathlib
 import typing as t
-import uuid
 import warnings
 
 import jinja2
@@ -16,7 +11,7 @@ import starlette.requests
 import starlette.responses
 import starlette.schemas
 
-from flama import compat, exceptions, schemas, types
+from flama import compat, exceptions, json_engines, schemas, types
 
 __all__ = [
     "Method",
@@ -30,6 +25,7 @@ __all__ = [
     "FileResponse",
     "APIResponse",
     "APIErrorResponse",
+    "APIStreamingResponse",
     "HTMLFileResponse",
     "HTMLTemplatesEnvironment",
     "HTMLTemplateResponse",
@@ -65,40 +61,7 @@ class PlainTextResponse(starlette.responses.PlainTextResponse, Response):
 
 class EnhancedJSONEncoder(json.JSONEncoder):
     def default(self, o):
-        if isinstance(o, (pathlib.Path, os.PathLike, uuid.UUID)):
-            return str(o)
-        if isinstance(o, (bytes, bytearray)):
-            return o.decode("utf-8")
-        if isinstance(o, enum.Enum):
-            return o.value
-        if isinstance(o, (set, frozenset)):
-            return list(o)
-        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
-            return o.isoformat()
-        if isinstance(o, datetime.timedelta):
-            # split seconds to larger units
-            seconds = o.total_seconds()
-            minutes, seconds = divmod(seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            days, hours = divmod(hours, 24)
-            days, hours, minutes = map(int, (days, hours, minutes))
-            seconds = round(seconds, 6)
-
-            formatted_units = (
-                (days, f"{days:02d}".lstrip("0") + "D"),
-                (hours, f"{hours:02d}".lstrip("0") + "H"),
-                (minutes, f"{minutes:02d}".lstrip("0") + "M"),
-                (seconds, f"{seconds:.6f}".strip("0") + "S"),
-            )
-
-            return "P" + "".join([formatted_value for value, formatted_value in formatted_units if value])
-        if inspect.isclass(o) and issubclass(o, BaseException):
-            return o.__name__
-        if isinstance(o, BaseException):
-            return repr(o)
-        if dataclasses.is_dataclass(o) and not isinstance(o, type):
-            return dataclasses.asdict(o)
-        return super().default(o)
+        return json_engines.default(o)
 
 
 class JSONResponse(starlette.responses.JSONResponse, Response):
@@ -108,9 +71,7 @@ class JSONResponse(starlette.responses.JSONResponse, Response):
         await super().__call__(scope, receive, send)  # type: ignore[arg-type]
 
     def render(self, content: t.Any) -> bytes:
-        return json.dumps(
-            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), cls=EnhancedJSONEncoder
-        ).encode("utf-8")
+        return json_engines.get().dumps(content)
 
 
 class RedirectResponse(starlette.responses.RedirectResponse, Response):
@@ -144,7 +105,10 @@ class APIResponse(JSONResponse):
     def render(self, content: t.Any):
         if self.schema is not None:
             try:
-                content = schemas.Schema.from_type(self.schema).dump(content)
+                schema = (
+                    self.schema if isinstance(self.schema, schemas.Schema) else schemas.Schema.from_type(self.schema)
+                )
+                content = schema.dump(content)
             except schemas.SchemaValidationError as e:
                 raise exceptions.SerializationError(status_code=500, detail=e.errors)
 
@@ -183,6 +147,71 @@ class APIErrorResponse(APIResponse):
         self.exception = exception
 
 
+class APIStreamingResponse(StreamingResponse):
+    """Stream a collection as a JSON array, or as newline delimited JSON if the media type is 'application/x-ndjson'.
+
+    Elements are dumped through the schema and encoded one by one while the response is sent, and they are grouped in
+    chunks of at least `chunk_size` bytes, so the whole collection is never held in memory.
+    """
+
+    media_type = "application/json"
+    ndjson_media_type = "application/x-ndjson"
+
+    def __init__(
+        self,
+        content: t.Union[t.Iterable[t.Any], t.AsyncIterable[t.Any]],
+        schema: t.Any = None,
+        *args,
+        chunk_size: int = 65536,
+        **kwargs,
+    ):
+        self.schema = schema
+        self.chunk_size = chunk_size
+        super().__init__(self._render(content), *args, **kwargs)
+
+    @staticmethod
+    async def _iterate(content: t.Union[t.Iterable[t.Any], t.AsyncIterable[t.Any]]) -> t.AsyncIterator[t.Any]:
+        if isinstance(content, t.AsyncIterable):
+            async for element in content:
+                yield element
+        else:
+            for element in content:
+                yield element
+
+    async def _render(self, content: t.Union[t.Iterable[t.Any], t.AsyncIterable[t.Any]]) -> t.AsyncIterator[bytes]:
+        schema = (
+            self.schema
+            if self.schema is None or isinstance(self.schema, schemas.Schema)
+            else schemas.Schema.from_type(self.schema)
+        )
+        ndjson = self.media_type == self.ndjson_media_type
+        buffer = bytearray() if ndjson else bytearray(b"[")
+        empty = True
+
+        async for element in self._iterate(content):
+            if schema is not None:
+                try:
+                    element = schema.dump(element)
+                except schemas.SchemaValidationError as e:
+                    raise exceptions.SerializationError(status_code=500, detail=e.errors)
+
+            if ndjson:
+                buffer += json_engines.get().dumps(element) + b"\n"
+            else:
+                buffer += (b"" if empty else b",") + json_engines.get().dumps(element)
+            empty = False
+
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if not ndjson:
+            buffer += b"]"
+
+        if buffer:
+            yield bytes(buffer)
+
+
 class HTMLFileResponse(HTMLResponse):
     def __init__(self, path: str, *args, **kwargs):
         try:
@@ -1,4 +1,5 @@
 from flama.injection.components import *  # noqa
 from flama.injection.exceptions import *  # noqa
 from flama.injection.injector import *  # noqa
+from flama.injection.plan import *  # noqa
 from flama.injection.resolver import *  # noqa
@@ -1,15 +1,27 @@
 import abc
 import asyncio
+import enum
 import inspect
 import typing as t
 
+from flama import compat
 from flama.injection.exceptions import ComponentError, ComponentNotFound
 from flama.injection.resolver import Parameter
 
-__all__ = ["Component", "Components"]
+__all__ = ["Component", "Components", "Lifetime"]
+
+
+class Lifetime(compat.StrEnum):  # PORT: Replace compat when stop supporting 3.10
+    transient = enum.auto()  # Resolved every time it is needed
+    request = enum.auto()  # Resolved once per injection
+    app = enum.auto()  # Resolved once and cached until the app shuts down
 
 
 class Component(metaclass=abc.ABCMeta):
+    lifetime: t.ClassVar[Lifetime] = Lifetime.request
+    memoize: t.ClassVar[bool] = True  # Disabling it is the same as a transient lifetime
+    sequential: t.ClassVar[bool] = False  # Never evaluate it concurrently with other components
+
     def identity(self, parameter: Parameter) -> str:
         """Each component needs a unique identifier string that we use for lookups from the `state` dictionary when we
         run the dependency injection.
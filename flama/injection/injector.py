@@ -1,9 +1,11 @@
 import functools
 import inspect
 import typing as t
+import weakref
 
 from flama.injection.components import Component, Components
 from flama.injection.exceptions import ComponentNotFound
+from flama.injection.plan import InjectionPlan, InjectionStats
 from flama.injection.resolver import EMPTY, ROOT_NAME, Parameter, Resolver
 
 if t.TYPE_CHECKING:
@@ -17,6 +19,7 @@ class Injector:
         self,
         context_types: t.Optional[dict[str, type]] = None,
         components: t.Optional[t.Union[t.Sequence[Component], Components]] = None,
+        concurrent: bool = False,
     ):
         """Functions dependency injector.
 
@@ -24,7 +27,12 @@ class Injector:
 
         :param context_types: A mapping of names into types for injection contexts.
         :param components: List of components.
+        :param concurrent: Evaluate independent async components concurrently.
         """
+        self.concurrent = concurrent
+        self.stats = InjectionStats()
+        self._cache: dict[tuple[int, str], t.Any] = {}
+        self._plans: weakref.WeakKeyDictionary[t.Callable, InjectionPlan] = weakref.WeakKeyDictionary()
         self.context_types = context_types or {}
         self.components = Components(components or [])
         self._resolver: t.Optional[Resolver] = None
@@ -67,6 +75,8 @@ class Injector:
     @resolver.deleter
     def resolver(self):
         self._resolver = None
+        self._plans.clear()
+        self._cache.clear()
 
     @t.overload
     def resolve(self, annotation: t.Any) -> "ResolutionTree":
@@ -113,12 +123,39 @@ class Injector:
 
         return parameters
 
+    def compile_function(self, func: t.Callable) -> InjectionPlan:
+        """Generate an injection plan for a given function.
+
+        The plan is built from the dependencies trees of the function, and it is cached until components or context
+        types change, so any further call for the same function just returns it. Bound methods share the plan of their
+        function.
+
+        :param func: Function to be compiled.
+        :return: Injection plan.
+        """
+        key = getattr(func, "__func__", func)
+
+        try:
+            return self._plans[key]
+        except (KeyError, TypeError):
+            ...
+
+        plan = InjectionPlan(self.resolve_function(func))
+
+        try:
+            self._plans[key] = plan
+        except TypeError:  # The function cannot be weak referenced, so it is not cached
+            ...
+
+        return plan
+
     async def inject(self, func: t.Callable, context: t.Optional[dict[str, t.Any]] = None) -> t.Callable:
         """Inject dependencies into a given function.
 
-        It analyses the function signature, look for type annotations and try to resolve them. Once all dependencies
-        trees are resolved for every single parameter, it uses the given context to evaluate those trees and calculate
-        a final value for each parameter. Finally, it returns a partialised function with all dependencies injected.
+        It uses the injection plan of the function, built from the dependencies trees of every single parameter, and
+        evaluates it with the given context to calculate a final value for each parameter. Finally, it returns a
+        partialised function with all dependencies injected. Memoization hits and misses are accumulated in `stats`, and
+        values of app-scoped components are cached until released.
 
         :param func: Function to be partialised.
         :param context: Mapping of names and values used to gather injection values.
@@ -127,6 +164,11 @@ class Injector:
         if context is None:
             context = {}
 
-        return functools.partial(
-            func, **{name: await resolution.value(context) for name, resolution in self.resolve_function(func).items()}
-        )
+        plan = self.compile_function(func)
+        values = await plan.values(context, concurrent=self.concurrent, cache=self._cache, stats=self.stats)
+
+        return functools.partial(func, **values)
+
+    def release(self) -> None:
+        """Release all cached values of app-scoped components, so they are resolved again when needed."""
+        self._cache.clear()
@@ -0,0 +1,251 @@
+import abc
+import dataclasses
+import typing as t
+
+from flama import concurrency
+from flama.injection.components import Lifetime
+from flama.injection.resolver import ComponentNode, ContextNode, ParameterNode
+
+if t.TYPE_CHECKING:
+    from flama.injection.components import Component
+    from flama.injection.resolver import ResolutionNode, ResolutionTree
+
+__all__ = ["InjectionPlan", "InjectionStats"]
+
+
+class Source(abc.ABC):
+    """Where the value of an argument is taken from when evaluating an injection plan."""
+
+    @abc.abstractmethod
+    def value(self, context: dict[str, t.Any], values: list[t.Any]) -> t.Any:
+        ...
+
+
+@dataclasses.dataclass(frozen=True)
+class ContextSource(Source):
+    """A value looked up in the injection context."""
+
+    name: str
+
+    def value(self, context: dict[str, t.Any], values: list[t.Any]) -> t.Any:
+        return context[self.name]
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstantSource(Source):
+    """A value known when the plan is built, such as the parameter being resolved."""
+
+    constant: t.Any
+
+    def value(self, context: dict[str, t.Any], values: list[t.Any]) -> t.Any:
+        return self.constant
+
+
+@dataclasses.dataclass(frozen=True)
+class StepSource(Source):
+    """A value calculated by a previous step of the plan."""
+
+    step: int
+
+    def value(self, context: dict[str, t.Any], values: list[t.Any]) -> t.Any:
+        return values[self.step]
+
+
+@dataclasses.dataclass
+class InjectionStats:
+    """Component values reused while evaluating injection plans, either memoized in the plan or taken from the app
+    cache (hits), and component calls made for calculating them (misses)."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclasses.dataclass(frozen=True)
+class Step:
+    """A single component call, with the sources of its arguments. App-scoped steps include the key used for storing
+    their values in the app cache."""
+
+    component: "Component"
+    arguments: tuple[tuple[str, Source], ...]
+    key: t.Optional[tuple[int, str]] = None
+
+    async def value(
+        self,
+        context: dict[str, t.Any],
+        values: list[t.Any],
+        cache: t.Optional[dict[t.Any, t.Any]] = None,
+        stats: t.Optional[InjectionStats] = None,
+    ) -> t.Any:
+        if self.key is not None and cache is not None:
+            try:
+                value = cache[self.key]
+            except KeyError:
+                ...
+            else:
+                if stats is not None:
+                    stats.hits += 1
+                return value
+
+        if stats is not None:
+            stats.misses += 1
+
+        value = await self.component(**{name: source.value(context, values) for name, source in self.arguments})
+
+        if self.key is not None and cache is not None:
+            cache[self.key] = value
+
+        return value
+
+
+class InjectionPlan:
+    def __init__(self, resolutions: dict[str, "ResolutionTree"]):
+        """A flat version of the dependencies trees of a function.
+
+        Every component call is converted into a step, and steps are sorted so that the dependencies of each step are
+        calculated before it. Context lookups and parameters are not steps but sources of the arguments of the steps,
+        so evaluating a plan only needs to call the components in order, without inspecting or walking any tree.
+
+        Component values are memoized depending on the lifetime of the component. Request-scoped components resolving
+        the same parameter identity in different branches of the trees are called only once, because every other branch
+        reuses the same step. App-scoped components are memoized in the same way, and their values are also stored in
+        the app cache given when evaluating the plan. Transient components are called every time they are needed.
+
+        Steps are also grouped in stages, where every step only depends on steps of previous stages, so independent
+        async components of the same stage can be evaluated concurrently. Sync components and components declared as
+        `sequential` are always evaluated one at a time, before the concurrent ones of their stage.
+
+        Once the values of app-scoped components are cached, the steps only needed for calculating them are pruned, so
+        they are not evaluated again. Pruned versions of the plan are built once for each combination of cached
+        app-scoped steps.
+
+        :param resolutions: Mapping of parameter names and dependencies trees.
+        """
+        self.steps: list[Step] = []
+        self.hits = 0
+        self._memoized: dict[tuple[int, str], StepSource] = {}
+        self.arguments = {name: self._add(resolution.root) for name, resolution in resolutions.items()}
+        self.stages = self._build_stages(list(range(len(self.steps))))
+        self._app_steps = [i for i, step in enumerate(self.steps) if step.key is not None]
+        self._pruned: dict[tuple[bool, ...], tuple[list[int], list[tuple[list[int], list[int]]]]] = {}
+
+    def _add(self, node: "ResolutionNode") -> Source:
+        if isinstance(node, ContextNode):
+            return ContextSource(node.parameter.name)
+
+        if isinstance(node, ParameterNode):
+            return ConstantSource(node.parameter)
+
+        assert isinstance(node, ComponentNode), f"Unknown resolution node '{node.__class__.__name__}'"
+
+        lifetime = node.component.lifetime if node.component.memoize else Lifetime.transient
+        key = (id(node.component), node.component.identity(node.parameter)) if lifetime != Lifetime.transient else None
+        if key in self._memoized:
+            self.hits += 1
+            return self._memoized[key]
+
+        arguments = tuple((child.name, self._add(child)) for child in node.nodes)
+        self.steps.append(Step(node.component, arguments, key if lifetime == Lifetime.app else None))
+        source = StepSource(len(self.steps) - 1)
+
+        if key is not None:
+            self._memoized[key] = source
+
+        return source
+
+    def _build_stages(self, steps: list[int]) -> list[tuple[list[int], list[int]]]:
+        depths: dict[int, int] = {}
+        for i in steps:
+            depths[i] = max(
+                (
+                    depths[s.step] + 1
+                    for _, s in self.steps[i].arguments
+                    if isinstance(s, StepSource) and s.step in depths
+                ),
+                default=0,
+            )
+
+        stages: list[tuple[list[int], list[int]]] = []
+        for depth in range(max(depths.values(), default=-1) + 1):
+            steps = [i for i, d in depths.items() if d == depth]
+            concurrent = [
+                i
+                for i in steps
+                if not self.steps[i].component.sequential and concurrency.is_async(self.steps[i].component.resolve)
+            ]
+            if len(concurrent) < 2:
+                concurrent = []
+            stages.append(([i for i in steps if i not in concurrent], concurrent))
+
+        return stages
+
+    def _prune(self, cache: dict[t.Any, t.Any]) -> tuple[list[int], list[tuple[list[int], list[int]]]]:
+        """Steps and stages needed for evaluating the plan, given the values already cached.
+
+        :param cache: Values of app-scoped components.
+        :return: Steps and stages needed.
+        """
+        cached = tuple(self.steps[i].key in cache for i in self._app_steps)
+
+        try:
+            return self._pruned[cached]
+        except KeyError:
+            ...
+
+        needed: set[int] = set()
+        pending = [s.step for s in self.arguments.values() if isinstance(s, StepSource)]
+        while pending:
+            if (i := pending.pop()) not in needed:
+                needed.add(i)
+                if self.steps[i].key not in cache:
+                    pending += [s.step for _, s in self.steps[i].arguments if isinstance(s, StepSource)]
+
+        steps = sorted(needed)
+        self._pruned[cached] = (steps, self._build_stages(steps))
+        return self._pruned[cached]
+
+    async def values(
+        self,
+        context: dict[str, t.Any],
+        *,
+        concurrent: bool = False,
+        cache: t.Optional[dict[t.Any, t.Any]] = None,
+        stats: t.Optional[InjectionStats] = None,
+    ) -> dict[str, t.Any]:
+        """Evaluate the plan using given context.
+
+        :param context: Mapping of names and values used to gather injection values.
+        :param concurrent: Evaluate independent async components concurrently.
+        :param cache: Values of app-scoped components, filled with the ones calculated in this evaluation.
+        :param stats: Stats updated with the values reused and the components called in this evaluation.
+        :return: Mapping of parameter names and values.
+        """
+        values: list[t.Any] = [None] * len(self.steps)
+
+        if stats is not None:
+            stats.hits += self.hits
+
+        if self._app_steps and cache:
+            steps, stages = self._prune(cache)
+        else:
+            steps, stages = range(len(self.steps)), self.stages
+
+        if not concurrent:
+            for i in steps:
+                values[i] = await self.steps[i].value(context, values, cache, stats)
+        else:
+            for sequential_steps, concurrent_steps in stages:
+                for i in sequential_steps:
+                    values[i] = await self.steps[i].value(context, values, cache, stats)
+
+                if concurrent_steps:
+                    try:
+                        tasks = await concurrency.run_task_group(
+                            *(self.steps[i].value(context, values, cache, stats) for i in concurrent_steps)
+                        )
+                    except Exception as e:  # Task groups wrap errors, so the first one is raised as it is
+                        raise getattr(e, "exceptions", [e])[0]
+
+                    for i, task in zip(concurrent_steps, tasks):
+                        values[i] = task.result()
+
+        return {name: source.value(context, values) for name, source in self.arguments.items()}
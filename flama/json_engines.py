@@ -0,0 +1,233 @@
+import abc
+import contextvars
+import dataclasses
+import datetime
+import enum
+import importlib.util
+import inspect
+import json
+import os
+import pathlib
+import typing as t
+import uuid
+
+from flama import exceptions
+
+__all__ = [
+    "JSONEngine",
+    "StdlibJSONEngine",
+    "OrjsonJSONEngine",
+    "MsgspecJSONEngine",
+    "default",
+    "engine",
+    "current",
+    "load",
+    "setup",
+    "get",
+]
+
+
+def _format_timedelta(o: datetime.timedelta) -> str:
+    # split seconds to larger units
+    seconds = o.total_seconds()
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    days, hours, minutes = map(int, (days, hours, minutes))
+    seconds = round(seconds, 6)
+
+    formatted_units = (
+        (days, f"{days:02d}".lstrip("0") + "D"),
+        (hours, f"{hours:02d}".lstrip("0") + "H"),
+        (minutes, f"{minutes:02d}".lstrip("0") + "M"),
+        (seconds, f"{seconds:.6f}".strip("0") + "S"),
+    )
+
+    return "P" + "".join([formatted_value for value, formatted_value in formatted_units if value])
+
+
+def default(o: t.Any) -> t.Any:
+    """Convert objects that are not natively supported by JSON into a serializable value.
+
+    :param o: Object to convert.
+    :return: Serializable value.
+    :raises TypeError: If the object cannot be converted.
+    """
+    if isinstance(o, (pathlib.Path, os.PathLike, uuid.UUID)):
+        return str(o)
+    if isinstance(o, (bytes, bytearray)):
+        return o.decode("utf-8")
+    if isinstance(o, enum.Enum):
+        return o.value
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+        return o.isoformat()
+    if isinstance(o, datetime.timedelta):
+        return _format_timedelta(o)
+    if inspect.isclass(o) and issubclass(o, BaseException):
+        return o.__name__
+    if isinstance(o, BaseException):
+        return repr(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+class JSONEngine(abc.ABC):
+    name: t.ClassVar[str]
+    dependency: t.ClassVar[t.Optional[str]] = None
+
+    @classmethod
+    def installed(cls) -> bool:
+        """Check if the library used by this engine is installed.
+
+        :return: True if it is installed.
+        """
+        return cls.dependency is None or importlib.util.find_spec(cls.dependency) is not None
+
+    @abc.abstractmethod
+    def dumps(self, obj: t.Any) -> bytes:
+        """Encode an object into compact UTF-8 JSON.
+
+        :param obj: Object to encode.
+        :return: Encoded object.
+        :raises TypeError: If the object cannot be encoded.
+        """
+        ...
+
+    @abc.abstractmethod
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        """Decode a JSON document.
+
+        :param data: JSON document.
+        :return: Decoded object.
+        :raises ValueError: If the document is malformed.
+        """
+        ...
+
+
+class StdlibJSONEngine(JSONEngine):
+    name = "json"
+
+    def dumps(self, obj: t.Any) -> bytes:
+        return json.dumps(
+            obj, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"), default=default
+        ).encode("utf-8")
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return json.loads(data)
+
+
+class OrjsonJSONEngine(JSONEngine):
+    """JSON engine using orjson.
+
+    Types supported natively by orjson are encoded in the same way as the stdlib engine. The exception is NaN and
+    infinity, which are encoded as null instead of raising an error. Objects that orjson cannot encode, such as integers
+    bigger than 64 bits, fall back to the stdlib engine.
+    """
+
+    name = "orjson"
+    dependency = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._fallback = StdlibJSONEngine()
+
+    def dumps(self, obj: t.Any) -> bytes:
+        try:
+            return self._orjson.dumps(obj, default=default, option=self._orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONEngine(JSONEngine):
+    """JSON engine using msgspec.
+
+    Types supported natively by msgspec follow its own encoding. Datetimes in UTC are encoded with a 'Z' suffix, and
+    bytes are encoded as base64. Objects that msgspec cannot encode fall back to the stdlib engine.
+    """
+
+    name = "msgspec"
+    dependency = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=default)
+        self._decoder = msgspec.json.Decoder()
+        self._fallback = StdlibJSONEngine()
+
+    def dumps(self, obj: t.Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError, self._msgspec.EncodeError):
+            return self._fallback.dumps(obj)
+
+    def loads(self, data: t.Union[bytes, str]) -> t.Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from None
+
+
+ENGINES: dict[str, type[JSONEngine]] = {x.name: x for x in (OrjsonJSONEngine, MsgspecJSONEngine, StdlibJSONEngine)}
+
+engine: t.Optional[JSONEngine] = None  # Global engine, set up on first use if not set explicitly
+current: contextvars.ContextVar[t.Optional[JSONEngine]] = contextvars.ContextVar("json_engine", default=None)
+
+
+def load(name: t.Optional[str] = None) -> JSONEngine:
+    """Create a JSON engine.
+
+    The stdlib engine is used by default, as the other ones encode some values differently. A faster engine must be
+    enabled explicitly, either by its name or through the 'FLAMA_JSON_ENGINE' environment variable.
+
+    :param name: Name of the engine, if not given the one from the environment or the stdlib engine.
+    :return: JSON engine.
+    :raises ValueError: If the engine is unknown.
+    :raises DependencyNotInstalled: If the library used by the engine is not installed.
+    """
+    if name is None:
+        name = os.environ.get("FLAMA_JSON_ENGINE") or StdlibJSONEngine.name
+
+    try:
+        engine_cls = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON engine '{name}', available engines are: {', '.join(ENGINES)}")
+
+    if not engine_cls.installed():
+        raise exceptions.DependencyNotInstalled(
+            dependency=engine_cls.dependency, dependant=f"{engine_cls.name} JSON engine"
+        )
+
+    return engine if isinstance(engine, engine_cls) else engine_cls()
+
+
+def setup(name: t.Optional[str] = None) -> JSONEngine:
+    """Globally set the JSON engine, used wherever an application doesn't set its own one.
+
+    :param name: Name of the engine to use, if not given the one from the environment or the stdlib engine.
+    :return: JSON engine.
+    :raises ValueError: If the engine is unknown.
+    :raises DependencyNotInstalled: If the library used by the engine is not installed.
+    """
+    global engine
+
+    engine = load(name)
+
+    return engine
+
+
+def get() -> JSONEngine:
+    """Get the JSON engine in use, the one of the application handling the current request or the global one.
+
+    :return: JSON engine.
+    """
+    return current.get() or engine or setup()
@@ -91,6 +91,8 @@ class Lifespan(types.AppClass):
         if app.events.shutdown:
             await concurrency.run_task_group(*(f() for f in app.events.shutdown))
 
+        app.injector.release()
+
     async def _child_propagation(self, app: "Flama", scope: types.Scope, message: types.Message) -> None:
         async def child_receive() -> types.Message:
             return message
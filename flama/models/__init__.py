@@ -1,4 +1,6 @@
 from flama.models.base import *  # noqa
+from flama.models.cache import *  # noqa
 from flama.models.components import *  # noqa
+from flama.models.executor import *  # noqa
 from flama.models.modules import *  # noqa
 from flama.models.resource import *  # noqa
@@ -0,0 +1,174 @@
+import collections
+import dataclasses
+import hashlib
+import json
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from flama.models.base import Model
+
+__all__ = ["PredictionCache", "CacheMetrics"]
+
+
+@dataclasses.dataclass
+class CacheMetrics:
+    """Metrics of the rows looked up in a prediction cache."""
+
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of rows found in the cache.
+
+        :return: Hit rate.
+        """
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class PredictionCache:
+    """Least recently used cache of the predictions of a model, row by row.
+
+    Each input row is looked up by a stable hash of its content, so a prediction can mix cached and uncached rows, and
+    only the uncached ones are sent to the model. It works for models whose output has a row for each input row, as the
+    models of all supported frameworks do. Inputs that are not a list of rows or an array are not cached.
+
+    Entries are evicted when the cache is full or when they are older than `ttl` seconds, and all of them are
+    invalidated when the id in the metadata of the model changes. A cache of this kind must be used for a single model.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: t.Optional[float] = None):
+        """Initialize the cache.
+
+        :param max_size: Maximum number of rows cached.
+        :param ttl: Time an entry is valid, in seconds. Entries never expire if not given.
+        :raises ValueError: If the maximum size is lower than 1.
+        """
+        if max_size < 1:
+            raise ValueError("Max size must be greater than 0")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.metrics = CacheMetrics()
+        self._entries: collections.OrderedDict[str, tuple[t.Any, t.Optional[float]]] = collections.OrderedDict()
+        self._model_id: t.Any = None
+
+    @staticmethod
+    def key(row: t.Any) -> str:
+        """Stable hash of an input row.
+
+        :param row: Input row, a sequence of values or an array.
+        :return: Hash of the row.
+        """
+        if hasattr(row, "tobytes") and hasattr(row, "dtype"):
+            content = f"{row.dtype.str}:{row.shape}:".encode() + row.tobytes()
+        else:
+            content = json.dumps(row, sort_keys=True, separators=(",", ":"), default=repr).encode()
+
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, t.Any]:
+        """Look up an entry, marking it as the most recently used.
+
+        :param key: Hash of the input row.
+        :return: If the entry was found, along with its output row.
+        """
+        try:
+            value, expires_at = self._entries[key]
+        except KeyError:
+            self.metrics.misses += 1
+            return False, None
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            self.metrics.size = len(self._entries)
+            self.metrics.expirations += 1
+            self.metrics.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.metrics.hits += 1
+        return True, value
+
+    def set(self, key: str, value: t.Any) -> None:
+        """Store an entry, evicting the least recently used ones if the cache is full.
+
+        :param key: Hash of the input row.
+        :param value: Output row.
+        """
+        self._entries[key] = (value, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.metrics.evictions += 1
+
+        self.metrics.size = len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.metrics.size = 0
+
+    def _check_model(self, model: "Model") -> None:
+        model_id = getattr(model.meta, "id", None)
+        if model_id != self._model_id:
+            if self._entries:
+                self.clear()
+                self.metrics.invalidations += 1
+            self._model_id = model_id
+
+    async def predict(
+        self, model: "Model", x: t.Any, predict: t.Callable[["Model", t.Any], t.Awaitable[t.Any]]
+    ) -> t.Any:
+        """Generate a prediction, sending only the rows that are not cached to the model.
+
+        :param model: Model used for the prediction.
+        :param x: Input data, a list of rows or an array.
+        :param predict: Function that generates the prediction of the uncached rows.
+        :return: Prediction.
+        :raises ValueError: If some rows were cached and the model output does not have a row for each input row.
+        """
+        is_array = hasattr(x, "dtype") and getattr(x, "ndim", 0) > 0
+        if not (isinstance(x, list) or is_array) or not len(x):
+            return await predict(model, x)
+
+        self._check_model(model)
+
+        keys = [self.key(row) for row in x]
+        output: list[t.Any] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            found, output[i] = self.get(key)
+            if not found:
+                missing.append(i)
+
+        if missing:
+            result = await predict(model, x[missing] if is_array else [x[i] for i in missing])
+            if not isinstance(result, list) or len(result) != len(missing):
+                if len(missing) == len(keys):
+                    return result
+
+                raise ValueError("Model output must have a row for each input row")
+
+            for i, row in zip(missing, result):
+                output[i] = row
+                self.set(keys[i], row)
+
+        return output
@@ -0,0 +1,265 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import os
+import time
+import typing as t
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+if t.TYPE_CHECKING:
+    from flama.models.base import Model
+
+__all__ = ["ModelExecutor", "BatchingModelExecutor", "ExecutorMetrics"]
+
+_process_model: t.Optional["Model"] = None  # Model loaded in each process of a process pool
+
+
+def _load_process_model(model: "Model") -> None:
+    global _process_model
+    _process_model = model
+
+
+def _timed(func: t.Callable[..., t.Any], *args: t.Any) -> tuple[t.Any, float]:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _predict_process_model(x: t.Any) -> tuple[t.Any, float]:
+    return _timed(_process_model.predict, x)  # type: ignore[union-attr]
+
+
+def _is_array(x: t.Any) -> bool:
+    return hasattr(x, "dtype") and getattr(x, "ndim", 0) > 0
+
+
+@dataclasses.dataclass
+class ExecutorMetrics:
+    """Metrics of the predictions run by an executor."""
+
+    workers: int
+    in_flight: int = 0
+    predictions: int = 0
+    errors: int = 0
+    execution_time: float = 0.0
+    max_execution_time: float = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of predictions waiting for a free worker.
+
+        :return: Queue depth.
+        """
+        return max(self.in_flight - self.workers, 0)
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "predictions": self.predictions,
+            "errors": self.errors,
+            "execution_time": {
+                "total": self.execution_time,
+                "mean": self.execution_time / self.predictions if self.predictions else 0.0,
+                "max": self.max_execution_time,
+            },
+        }
+
+
+class ModelExecutor:
+    """Run the predictions of a model outside of the event loop.
+
+    Predictions run in a bounded pool of threads by default, which suits frameworks that release the GIL while running
+    inference. A pool of processes can be used instead, loading the model once in each process, so an executor of this
+    kind must be used for a single model.
+
+    The pool is created with the first prediction.
+    """
+
+    KINDS = ("thread", "process")
+
+    def __init__(self, kind: str = "thread", max_workers: t.Optional[int] = None):
+        """Initialize the executor.
+
+        :param kind: Kind of pool, either `thread` or `process`.
+        :param max_workers: Size of the pool, the number of CPUs if not given.
+        :raises ValueError: If the kind of pool is unknown.
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}', available kinds are: {', '.join(self.KINDS)}")
+
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.metrics = ExecutorMetrics(workers=self.max_workers)
+        self._executor: t.Optional[concurrent.futures.Executor] = None
+
+    def _pool(self, model: "Model") -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    self.max_workers, initializer=_load_process_model, initargs=(model,)
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="flama-model"
+                )
+
+        return self._executor
+
+    async def predict(self, model: "Model", x: t.Any) -> t.Any:
+        """Generate a prediction in the pool.
+
+        :param model: Model used for the prediction.
+        :param x: Input data.
+        :return: Prediction.
+        """
+        func = (
+            functools.partial(_predict_process_model, x)
+            if self.kind == "process"
+            else functools.partial(_timed, model.predict, x)
+        )
+
+        self.metrics.in_flight += 1
+        try:
+            result, elapsed = await asyncio.get_running_loop().run_in_executor(self._pool(model), func)
+        except Exception:
+            self.metrics.errors += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+
+        self.metrics.predictions += 1
+        self.metrics.execution_time += elapsed
+        self.metrics.max_execution_time = max(self.metrics.max_execution_time, elapsed)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the pool, if it was created.
+
+        :param wait: If it should wait for the pending predictions.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+class BatchingModelExecutor(ModelExecutor):
+    """Run the predictions of a model outside of the event loop, merging concurrent predictions into batches.
+
+    The input rows of the predictions requested while a batch is open are merged and sent to the model in a single
+    call, whose output rows are split back between the predictions. Arrays are concatenated if every input of the batch
+    is an array, otherwise they are merged as lists of rows. A batch is closed when it reaches `max_batch_size`
+    rows or after `max_wait_ms` milliseconds. It works for models whose output has a row for each input row, as the
+    models of all supported frameworks do.
+
+    If a batch fails, its predictions are retried one by one, so an invalid input only fails its own prediction. The
+    metrics count each call to the model as a single prediction. An executor of this kind must be used for a single
+    model.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: t.Optional[int] = None,
+        *,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ):
+        """Initialize the executor.
+
+        :param kind: Kind of pool, either `thread` or `process`.
+        :param max_workers: Size of the pool, the number of CPUs if not given.
+        :param max_batch_size: Number of rows that closes a batch.
+        :param max_wait_ms: Maximum time a batch is kept open, in milliseconds.
+        :raises ValueError: If the kind of pool is unknown or the maximum batch size is lower than 1.
+        """
+        if max_batch_size < 1:
+            raise ValueError("Max batch size must be greater than 0")
+
+        super().__init__(kind, max_workers)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._batch: list[tuple[t.Any, asyncio.Future]] = []
+        self._batch_rows = 0
+        self._timer: t.Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def predict(self, model: "Model", x: t.Any) -> t.Any:
+        """Generate a prediction as part of a batch.
+
+        :param model: Model used for the prediction.
+        :param x: Input data, a list of rows or an array.
+        :return: Prediction.
+        """
+        if not (isinstance(x, list) or _is_array(x)) or not len(x):
+            return await super().predict(model, x)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch.append((x, future))
+        self._batch_rows += len(x)
+
+        if self._batch_rows >= self.max_batch_size:
+            self._close_batch(model)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._close_batch, model)
+
+        return await future
+
+    def _close_batch(self, model: "Model") -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._batch, self._batch_rows = self._batch, [], 0
+        task = asyncio.create_task(self._predict_batch(model, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    def _merge(inputs: list[t.Any]) -> t.Any:
+        if len(inputs) == 1:
+            return inputs[0]
+
+        if np is not None and all(_is_array(x) for x in inputs):
+            return np.concatenate(inputs)
+
+        return [row for x in inputs for row in (x.tolist() if _is_array(x) else x)]
+
+    async def _predict_batch(self, model: "Model", batch: list[tuple[t.Any, asyncio.Future]]) -> None:
+        try:
+            output = await super().predict(model, self._merge([x for x, _ in batch]))
+            if not isinstance(output, list) or len(output) != sum(len(x) for x, _ in batch):
+                raise ValueError("Model output must have a row for each input row")
+        except Exception as e:
+            if len(batch) == 1:
+                self._set_exception(batch[0][1], e)
+            else:
+                await asyncio.gather(*[self._predict_single(model, x, future) for x, future in batch])
+            return
+
+        offset = 0
+        for x, future in batch:
+            if not future.done():
+                future.set_result(output[offset : offset + len(x)])
+            offset += len(x)
+
+    async def _predict_single(self, model: "Model", x: t.Any, future: asyncio.Future) -> None:
+        try:
+            result = await super().predict(model, x)
+        except Exception as e:
+            self._set_exception(future, e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+        if not future.done():
+            future.set_exception(exception)
@@ -15,6 +15,6 @@ class PyTorchModel(Model):
             raise exceptions.FrameworkNotInstalled("pytorch")
 
         try:
-            return self.model(torch.Tensor(x)).tolist()
+            return self.model(torch.as_tensor(x, dtype=torch.float)).tolist()
         except ValueError as e:
             raise exceptions.HTTPException(status_code=400, detail=str(e))
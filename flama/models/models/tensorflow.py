@@ -23,6 +23,6 @@ class TensorFlowModel(Model):
             raise exceptions.FrameworkNotInstalled("tensorflow")
 
         try:
-            return self.model.predict(np.array(x)).tolist()
+            return self.model.predict(np.asarray(x)).tolist()
         except (tf.errors.OpError, ValueError):  # type: ignore
             raise exceptions.HTTPException(status_code=400)
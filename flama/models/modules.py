@@ -1,7 +1,10 @@
 import os
 import typing as t
 
-from flama.models.resource import ModelResource, ModelResourceType
+from flama import concurrency
+from flama.models.cache import PredictionCache
+from flama.models.executor import ModelExecutor
+from flama.models.resource import MetricsModelResourceType, ModelResource, ModelResourceType
 from flama.modules import Module
 
 __all__ = ["ModelsModule"]
@@ -10,6 +13,19 @@ __all__ = ["ModelsModule"]
 class ModelsModule(Module):
     name = "models"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self.executors: list[ModelExecutor] = []
+
+    def _add_executor(self, resource: t.Union[ModelResource, type[ModelResource]]) -> None:
+        if (executor := getattr(resource, "executor", None)) is not None and executor not in self.executors:
+            self.executors.append(executor)
+
+    async def on_shutdown(self) -> None:
+        """Shut down the executors of the models, waiting for their pending predictions in a thread."""
+        for executor in self.executors:
+            await concurrency.run(executor.shutdown)
+
     def add_model(
         self,
         path: str,
@@ -17,6 +33,9 @@ class ModelsModule(Module):
         name: str,
         tags: t.Optional[dict[str, dict[str, t.Any]]] = None,
         *args,
+        executor: t.Optional[ModelExecutor] = None,
+        cache: t.Optional[PredictionCache] = None,
+        metrics: bool = False,
         **kwargs,
     ) -> ModelResource:
         """Adds a model to this application, setting its endpoints.
@@ -25,16 +44,24 @@ class ModelsModule(Module):
         :param model: Model path.
         :param name: Model name.
         :param tags: Tags to add to the model methods.
+        :param executor: Executor that runs the predictions, a pool of threads if not given.
+        :param cache: Cache of the predictions, predictions are not cached if not given.
+        :param metrics: If the metrics of the predictions are exposed in an endpoint.
         """
 
         name_ = name
         model_ = model
+        executor_ = executor or ModelExecutor()
+        cache_ = cache
 
-        class Resource(ModelResource, metaclass=ModelResourceType):
+        class Resource(ModelResource, metaclass=MetricsModelResourceType if metrics else ModelResourceType):
             name = name_
             model_path = model_
+            executor = executor_
+            cache = cache_
 
         resource = Resource()
+        self._add_executor(resource)
         self.app.add_component(resource.component)
         self.app.resources.add_resource(path, resource, tags=tags, *args, **kwargs)  # type: ignore[attr-defined]
         return resource
@@ -50,6 +77,7 @@ class ModelsModule(Module):
         """
 
         def decorator(resource: type[ModelResource]) -> type[ModelResource]:
+            self._add_executor(resource)
             self.app.add_component(resource.component)
             self.app.resources.add_resource(path, resource, tags=tags, *args, **kwargs)  # type: ignore[attr-defined]
             return resource
@@ -70,6 +98,7 @@ class ModelsModule(Module):
         :param resource: Resource class.
         :param tags: Tags to add to the model methods.
         """
+        self._add_executor(resource)
         self.app.add_component(resource.component)
         resource_instance: ModelResource = self.app.resources.add_resource(  # type: ignore[attr-defined]
             path, resource, tags=tags, *args, **kwargs
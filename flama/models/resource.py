@@ -2,8 +2,11 @@ import os
 import typing as t
 
 import flama.schemas
-from flama import schemas
+from flama import codecs, exceptions, http, schemas
+from flama.models.cache import PredictionCache
 from flama.models.components import ModelComponentBuilder
+from flama.models.executor import ModelExecutor
+from flama.negotiation import ContentTypeNegotiator
 from flama.resources import data_structures
 from flama.resources.exceptions import ResourceAttributeError
 from flama.resources.resource import Resource, ResourceType
@@ -13,7 +16,14 @@ if t.TYPE_CHECKING:
     from flama.models.base import Model
     from flama.models.components import ModelComponent
 
-__all__ = ["ModelResource", "InspectMixin", "PredictMixin", "ModelResourceType"]
+__all__ = [
+    "ModelResource",
+    "InspectMixin",
+    "PredictMixin",
+    "MetricsMixin",
+    "ModelResourceType",
+    "MetricsModelResourceType",
+]
 
 
 class InspectMixin:
@@ -40,15 +50,69 @@ class InspectMixin:
 
 
 class PredictMixin:
+    predict_negotiator = ContentTypeNegotiator(
+        [codecs.JSONDataCodec(), codecs.NPYCodec(), codecs.ArrowCodec(), codecs.Float32Codec()]
+    )
+
+    @classmethod
+    def _predict_output_codec(cls, accept: t.Optional[str]) -> t.Optional[codecs.ArrayCodec]:
+        for media_type in [x.split(";")[0].strip().lower() for x in (accept or "").split(",")]:
+            for codec in cls.predict_negotiator.codecs:
+                if isinstance(codec, codecs.ArrayCodec) and codec.media_type == media_type:
+                    return codec
+
+        return None
+
     @classmethod
-    def _add_predict(cls, name: str, verbose_name: str, model_model_type: type["Model"], **kwargs) -> dict[str, t.Any]:
+    def _add_predict(
+        cls,
+        name: str,
+        verbose_name: str,
+        model_model_type: type["Model"],
+        model_executor: ModelExecutor,
+        model_cache: t.Optional[PredictionCache] = None,
+        **kwargs,
+    ) -> dict[str, t.Any]:
+        input_schema = schemas.Schema(flama.schemas.schemas.MLModelInput)
+
         @resource_method("/predict/", methods=["POST"], name="predict")
         async def predict(
             self,
             model: model_model_type,  # type: ignore[valid-type]
-            data: t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(flama.schemas.schemas.MLModelInput)],
+            request: http.Request,
         ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(flama.schemas.schemas.MLModelOutput)]:
-            return {"output": model.predict(data["input"])}
+            try:
+                codec = cls.predict_negotiator.negotiate(request.headers.get("Content-Type"))
+            except exceptions.NoCodecAvailable:
+                raise exceptions.HTTPException(415)
+
+            try:
+                data = await codec.decode(request)
+            except exceptions.DependencyNotInstalled as exc:
+                raise exceptions.HTTPException(415, detail=str(exc))
+            except exceptions.DecodeError as exc:
+                raise exceptions.HTTPException(400, detail=str(exc))
+
+            if not isinstance(codec, codecs.ArrayCodec):
+                try:
+                    data = input_schema.validate(data)["input"]
+                except schemas.SchemaValidationError as exc:
+                    raise exceptions.ValidationError(detail=exc.errors)
+
+            if model_cache is not None:
+                output = await model_cache.predict(model, data, model_executor.predict)
+            else:
+                output = await model_executor.predict(model, data)
+
+            if (output_codec := cls._predict_output_codec(request.headers.get("Accept"))) is not None:
+                try:
+                    return http.Response(
+                        content=output_codec.encode(output), media_type=output_codec.content_type(output)
+                    )
+                except exceptions.DependencyNotInstalled:  # Fall back to a JSON document
+                    pass
+
+            return {"output": output}
 
         predict.__doc__ = f"""
             tags:
@@ -56,7 +120,26 @@ class PredictMixin:
             summary:
                 Generate a prediction
             description:
-                Generate a prediction using the model from this resource.
+                Generate a prediction using the model from this resource. Input rows are given as a JSON document or as
+                a binary array, in NPY, Arrow IPC stream or raw little-endian float32 format. The prediction is
+                returned in any of those binary formats if it is the one accepted by the client.
+            requestBody:
+                content:
+                    application/json:
+                        schema:
+                            $ref: "#/components/schemas/flama.MLModelInput"
+                    application/x-npy:
+                        schema:
+                            type: string
+                            format: binary
+                    application/vnd.apache.arrow.stream:
+                        schema:
+                            type: string
+                            format: binary
+                    application/x-float32:
+                        schema:
+                            type: string
+                            format: binary
             responses:
                 200:
                     description:
@@ -66,6 +149,40 @@ class PredictMixin:
         return {"_predict": predict}
 
 
+class MetricsMixin:
+    @classmethod
+    def _add_metrics(
+        cls,
+        name: str,
+        verbose_name: str,
+        model_executor: ModelExecutor,
+        model_cache: t.Optional[PredictionCache] = None,
+        **kwargs,
+    ) -> dict[str, t.Any]:
+        @resource_method("/metrics/", methods=["GET"], name="metrics")
+        async def metrics(self):
+            result = model_executor.metrics.to_dict()
+            if model_cache is not None:
+                result["cache"] = model_cache.metrics.to_dict()
+            return result
+
+        metrics.__doc__ = f"""
+            tags:
+                - {verbose_name}
+            summary:
+                Retrieve the prediction metrics
+            description:
+                Retrieve the queue depth and execution time of the predictions generated by the model from this
+                resource, along with the hit rate of its prediction cache.
+            responses:
+                200:
+                    description:
+                        The prediction metrics.
+        """
+
+        return {"_metrics": metrics}
+
+
 class ModelResourceType(ResourceType, InspectMixin, PredictMixin):
     METHODS = ("inspect", "predict")
 
@@ -73,6 +190,8 @@ class ModelResourceType(ResourceType, InspectMixin, PredictMixin):
         """Resource metaclass for defining basic behavior for ML resources:
         * Create _meta attribute containing some metadata (model...).
         * Adds methods related to ML resource (inspect, predict...) listed in METHODS class attribute.
+        * Create the executor that runs the predictions, unless it is given.
+        * Set the prediction cache, if it is given.
 
         :param name: Class name.
         :param bases: List of superclasses.
@@ -87,10 +206,24 @@ class ModelResourceType(ResourceType, InspectMixin, PredictMixin):
             except AttributeError as e:
                 raise ResourceAttributeError(str(e), name)
 
+            try:
+                executor = mcs._get_attribute("executor", bases, namespace, metadata_namespace="model")
+            except AttributeError:
+                executor = ModelExecutor()
+            namespace["executor"] = executor
+
+            try:
+                cache = mcs._get_attribute("cache", bases, namespace, metadata_namespace="model")
+            except AttributeError:
+                cache = None
+            namespace["cache"] = cache
+
             namespace.setdefault("_meta", data_structures.Metadata()).namespaces["model"] = {
                 "component": component,
                 "model": component.model,
                 "model_type": component.get_model_type(),
+                "executor": executor,
+                "cache": cache,
             }
 
         return super().__new__(mcs, name, bases, namespace)
@@ -119,6 +252,12 @@ class ModelResourceType(ResourceType, InspectMixin, PredictMixin):
         raise AttributeError(ResourceAttributeError.MODEL_NOT_FOUND)
 
 
+class MetricsModelResourceType(ModelResourceType, MetricsMixin):
+    METHODS = (*ModelResourceType.METHODS, "metrics")
+
+
 class ModelResource(Resource, metaclass=ModelResourceType):
     component: "ModelComponent"
     model_path: t.Union[str, os.PathLike]
+    executor: ModelExecutor
+    cache: t.Optional[PredictionCache]
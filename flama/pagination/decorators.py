@@ -2,10 +2,17 @@ import abc
 import asyncio
 import inspect
 import typing as t
+from http import HTTPStatus
+
+from flama import exceptions
+from flama.pagination.types import PaginationWindow
 
 
 class PaginationDecoratorFactory:
     PARAMETERS: list[inspect.Parameter]
+    WINDOW_PARAMETER = "pagination"
+    WINDOW: t.Callable[..., t.Any] = PaginationWindow
+    MINIMUMS: dict[str, int] = {}
 
     @classmethod
     def decorate(cls, func: t.Callable, schema: t.Any) -> t.Callable:
@@ -19,7 +26,7 @@ class PaginationDecoratorFactory:
 
         decorated_func.__signature__ = inspect.Signature(  # type: ignore
             parameters=[
-                *[v for k, v in func_signature.parameters.items() if k != "kwargs"],
+                *[v for k, v in func_signature.parameters.items() if k not in ("kwargs", cls.WINDOW_PARAMETER)],
                 *cls.PARAMETERS,
             ],
             return_annotation=schema,
@@ -27,6 +34,45 @@ class PaginationDecoratorFactory:
 
         return decorated_func
 
+    @classmethod
+    def _validate(cls, **kwargs) -> None:
+        """Check that the pagination params are not lower than their minimum values.
+
+        :param kwargs: Pagination params.
+        :raises HTTPException: If any param is lower than its minimum value.
+        """
+        for name, minimum in cls.MINIMUMS.items():
+            if (value := kwargs.get(name)) is not None and value < minimum:
+                raise exceptions.HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail=f"Param '{name}' must be greater than or equal to {minimum}",
+                )
+
+    @classmethod
+    def _window(cls, func: t.Callable) -> t.Callable[..., dict[str, t.Any]]:
+        """Build a function that generates the extra params given to the view for a pagination window.
+
+        Only views that define the window param receive it, so they can fetch only the requested slice of the
+        collection.
+
+        :param func: View function.
+        :return: Function that generates the extra params from the pagination params.
+        """
+        if cls.WINDOW_PARAMETER not in inspect.signature(func).parameters:
+            return lambda **kwargs: {}
+
+        return lambda **kwargs: {cls.WINDOW_PARAMETER: cls.WINDOW(**cls._window_params(**kwargs))}
+
+    @classmethod
+    @abc.abstractmethod
+    def _window_params(cls, **kwargs) -> dict[str, t.Any]:
+        """Convert the pagination params into the params of a pagination window.
+
+        :param kwargs: Pagination params.
+        :return: Window params.
+        """
+        ...
+
     @classmethod
     @abc.abstractmethod
     def _decorate_async(cls, func: t.Callable, schema: t.Any) -> t.Callable:
@@ -1,2 +1,3 @@
+from flama.pagination.mixins.cursor import *  # noqa
 from flama.pagination.mixins.limit_offset import *  # noqa
 from flama.pagination.mixins.page_number import *  # noqa
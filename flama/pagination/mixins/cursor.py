@@ -0,0 +1,188 @@
+import functools
+import inspect
+import typing as t
+from http import HTTPStatus
+
+from flama import exceptions, http, schemas
+from flama.ddd import exceptions as ddd_exceptions
+
+__all__ = ["CursorMixin", "CursorResponse"]
+
+from flama.pagination.decorators import PaginationDecoratorFactory
+from flama.pagination.types import Cursor, CursorWindow, Page
+
+
+class CursorResponse(http.APIResponse):
+    """
+    Response paginated based on a cursor pointing to a position in the collection and a limit of elements.
+
+    First 10 elements:
+        /resource?limit=10
+    Next 10 elements:
+        /resource?limit=10&cursor=<meta.next>
+    Previous 10 elements:
+        /resource?limit=10&cursor=<meta.prev>
+
+    Views that fetch their own page receive a :class:`CursorWindow` and return a :class:`Page` with the cursors built
+    from the values of the sorting columns, so deep pages have the same cost as the first one. Otherwise, the whole
+    collection is sliced and cursors point to positions in it.
+    """
+
+    default_limit = 10
+
+    def __init__(
+        self,
+        schema: t.Any,
+        limit: t.Optional[t.Union[int, str]] = None,
+        cursor: t.Optional[Cursor] = None,
+        count: t.Optional[bool] = True,
+        **kwargs,
+    ):
+        self.limit = int(limit) if limit is not None else self.default_limit
+        self.cursor = cursor
+        self.count = count
+        super().__init__(schema=schema, **kwargs)
+
+    def _slice(self, content: t.Sequence[t.Any]) -> Page:
+        try:
+            offset = int(self.cursor.values[0]) if self.cursor else 0
+        except (IndexError, TypeError, ValueError):
+            raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Malformed cursor")
+
+        end = offset + self.limit
+        return Page(
+            data=content[offset:end],
+            count=len(content),
+            next=Cursor((end,)) if end < len(content) else None,
+            prev=Cursor((max(offset - self.limit, 0),)) if offset > 0 else None,
+        )
+
+    def render(self, content: t.Union[t.Sequence[t.Any], Page]):
+        page = content if isinstance(content, Page) else self._slice(content)
+
+        return super().render(
+            {
+                "meta": {
+                    "limit": self.limit,
+                    "next": page.next.encode() if page.next else None,
+                    "prev": page.prev.encode() if page.prev else None,
+                    "count": page.count if self.count else None,
+                },
+                "data": page.data,
+            }
+        )
+
+
+class CursorDecoratorFactory(PaginationDecoratorFactory):
+    PARAMETERS = [
+        inspect.Parameter(
+            name="limit", default=None, annotation=t.Optional[int], kind=inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ),
+        inspect.Parameter(
+            name="cursor", default=None, annotation=t.Optional[str], kind=inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ),
+        inspect.Parameter(
+            name="count", default=False, annotation=t.Optional[bool], kind=inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ),
+    ]
+    WINDOW = CursorWindow
+    MINIMUMS = {"limit": 1}
+
+    @classmethod
+    def _window_params(
+        cls, limit: t.Optional[int] = None, cursor: t.Optional[Cursor] = None, count: t.Optional[bool] = False
+    ) -> dict[str, t.Any]:
+        return {
+            "limit": limit if limit is not None else CursorResponse.default_limit,
+            "cursor": cursor,
+            "count": bool(count),
+        }
+
+    @staticmethod
+    def _decode(cursor: t.Optional[str]) -> t.Optional[Cursor]:
+        try:
+            return Cursor.decode(cursor) if cursor is not None else None
+        except ValueError as e:
+            raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
+    @classmethod
+    def _decorate_async(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
+        @functools.wraps(func)
+        async def decorator(
+            *args,
+            limit: t.Optional[int] = None,
+            cursor: t.Optional[str] = None,
+            count: t.Optional[bool] = False,
+            **kwargs,
+        ):
+            cls._validate(limit=limit)
+            decoded_cursor = cls._decode(cursor)
+            try:
+                content = await func(*args, **kwargs, **window(limit=limit, cursor=decoded_cursor, count=count))
+            except ddd_exceptions.KeysetError as e:
+                raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
+            return CursorResponse(schema=schema, limit=limit, cursor=decoded_cursor, count=count, content=content)
+
+        return decorator
+
+    @classmethod
+    def _decorate_sync(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
+        @functools.wraps(func)
+        def decorator(
+            *args,
+            limit: t.Optional[int] = None,
+            cursor: t.Optional[str] = None,
+            count: t.Optional[bool] = False,
+            **kwargs,
+        ):
+            cls._validate(limit=limit)
+            decoded_cursor = cls._decode(cursor)
+            try:
+                content = func(*args, **kwargs, **window(limit=limit, cursor=decoded_cursor, count=count))
+            except ddd_exceptions.KeysetError as e:
+                raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
+
+            return CursorResponse(schema=schema, limit=limit, cursor=decoded_cursor, count=count, content=content)
+
+        return decorator
+
+
+class CursorMixin:
+    def _paginate_cursor(self, func: t.Callable) -> t.Callable:
+        """
+        Decorator for adding pagination behavior to a view. That decorator produces a view based on cursors and it adds
+        three query parameters to control the pagination: limit, cursor and count. Cursor has a default value of the
+        beginning of the collection, limit default value is defined in :class:`CursorResponse` and count defines if the
+        response will define the total number of elements.
+
+        The output field is also modified by :class:`CursorSchema`, creating a new field based on it but using the old
+        output field as the content of its data field.
+
+        :param schema_name: Name used for output field.
+        :return: Decorated view.
+        """
+        schema_wrapped = schemas.Schema.from_type(inspect.signature(func).return_annotation)
+        resource_schema = schema_wrapped.unique_schema
+        schema_name = schema_wrapped.name
+
+        try:
+            schema_module, schema_class = schema_name.rsplit(".", 1)
+            paginated_schema_name = f"{schema_module}.CursorPaginated{schema_class}"
+        except ValueError:  # pragma: no cover
+            paginated_schema_name = f"CursorPaginated{schema_name}"
+        schema = schemas.Schema.build(
+            paginated_schema_name,
+            schema=schemas.schemas.Cursor,
+            fields=[schemas.Field("data", resource_schema, multiple=True)],
+        ).unique_schema
+
+        decorator = CursorDecoratorFactory.decorate(func, schema)
+
+        self.schemas.update({schema_name: resource_schema, paginated_schema_name: schema})  # type: ignore[attr-defined]
+
+        return decorator
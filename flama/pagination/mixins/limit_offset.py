@@ -7,6 +7,7 @@ from flama import http, schemas
 __all__ = ["LimitOffsetMixin", "LimitOffsetResponse"]
 
 from flama.pagination.decorators import PaginationDecoratorFactory
+from flama.pagination.types import Page
 
 
 class LimitOffsetResponse(http.APIResponse):
@@ -34,13 +35,18 @@ class LimitOffsetResponse(http.APIResponse):
         self.count = count
         super().__init__(schema=schema, **kwargs)
 
-    def render(self, content: t.Sequence[t.Any]):
-        init = self.offset
-        end = self.offset + self.limit
+    def render(self, content: t.Union[t.Sequence[t.Any], Page]):
+        if isinstance(content, Page):
+            data, count = content.data, content.count
+        else:
+            init = self.offset
+            end = self.offset + self.limit
+            data, count = content[init:end], len(content)
+
         return super().render(
             {
-                "meta": {"limit": self.limit, "offset": self.offset, "count": len(content) if self.count else None},
-                "data": content[init:end],
+                "meta": {"limit": self.limit, "offset": self.offset, "count": count if self.count else None},
+                "data": data,
             }
         )
 
@@ -57,9 +63,22 @@ class LimitOffsetDecoratorFactory(PaginationDecoratorFactory):
             name="count", default=False, annotation=t.Optional[bool], kind=inspect.Parameter.POSITIONAL_OR_KEYWORD
         ),
     ]
+    MINIMUMS = {"limit": 0, "offset": 0}
+
+    @classmethod
+    def _window_params(
+        cls, limit: t.Optional[int] = None, offset: t.Optional[int] = None, count: t.Optional[bool] = False
+    ) -> dict[str, t.Any]:
+        return {
+            "offset": offset if offset is not None else 0,
+            "limit": limit if limit is not None else LimitOffsetResponse.default_limit,
+            "count": bool(count),
+        }
 
     @classmethod
     def _decorate_async(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
         @functools.wraps(func)
         async def decorator(
             *args,
@@ -68,14 +87,21 @@ class LimitOffsetDecoratorFactory(PaginationDecoratorFactory):
             count: t.Optional[bool] = False,
             **kwargs,
         ):
+            cls._validate(limit=limit, offset=offset)
             return LimitOffsetResponse(
-                schema=schema, limit=limit, offset=offset, count=count, content=await func(*args, **kwargs)
+                schema=schema,
+                limit=limit,
+                offset=offset,
+                count=count,
+                content=await func(*args, **kwargs, **window(limit=limit, offset=offset, count=count)),
             )
 
         return decorator
 
     @classmethod
     def _decorate_sync(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
         @functools.wraps(func)
         def decorator(
             *args,
@@ -84,8 +110,13 @@ class LimitOffsetDecoratorFactory(PaginationDecoratorFactory):
             count: t.Optional[bool] = False,
             **kwargs,
         ):
+            cls._validate(limit=limit, offset=offset)
             return LimitOffsetResponse(
-                schema=schema, limit=limit, offset=offset, count=count, content=func(*args, **kwargs)
+                schema=schema,
+                limit=limit,
+                offset=offset,
+                count=count,
+                content=func(*args, **kwargs, **window(limit=limit, offset=offset, count=count)),
             )
 
         return decorator
@@ -7,6 +7,7 @@ from flama import http, schemas
 __all__ = ["PageNumberMixin", "PageNumberResponse"]
 
 from flama.pagination.decorators import PaginationDecoratorFactory
+from flama.pagination.types import Page
 
 
 class PageNumberResponse(http.APIResponse):
@@ -36,18 +37,22 @@ class PageNumberResponse(http.APIResponse):
         self.count = count
         super().__init__(schema=schema, **kwargs)
 
-    def render(self, content: t.Sequence[t.Any]):
-        init = (self.page_number - 1) * self.page_size
-        end = self.page_number * self.page_size
+    def render(self, content: t.Union[t.Sequence[t.Any], Page]):
+        if isinstance(content, Page):
+            data, count = content.data, content.count
+        else:
+            init = (self.page_number - 1) * self.page_size
+            end = self.page_number * self.page_size
+            data, count = content[init:end], len(content)
 
         return super().render(
             {
                 "meta": {
                     "page": self.page_number,
                     "page_size": self.page_size,
-                    "count": len(content) if self.count else None,
+                    "count": count if self.count else None,
                 },
-                "data": content[init:end],
+                "data": data,
             }
         )
 
@@ -64,9 +69,20 @@ class PageNumberDecoratorFactory(PaginationDecoratorFactory):
             name="count", default=False, annotation=t.Optional[bool], kind=inspect.Parameter.POSITIONAL_OR_KEYWORD
         ),
     ]
+    MINIMUMS = {"page": 1, "page_size": 1}
+
+    @classmethod
+    def _window_params(
+        cls, page: t.Optional[int] = None, page_size: t.Optional[int] = None, count: t.Optional[bool] = False
+    ) -> dict[str, t.Any]:
+        page = page if page is not None else 1
+        page_size = page_size if page_size is not None else PageNumberResponse.default_page_size
+        return {"offset": (page - 1) * page_size, "limit": page_size, "count": bool(count)}
 
     @classmethod
     def _decorate_async(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
         @functools.wraps(func)
         async def decorator(
             *args,
@@ -75,14 +91,21 @@ class PageNumberDecoratorFactory(PaginationDecoratorFactory):
             count: t.Optional[bool] = False,
             **kwargs,
         ):
+            cls._validate(page=page, page_size=page_size)
             return PageNumberResponse(
-                schema=schema, page=page, page_size=page_size, count=count, content=await func(*args, **kwargs)
+                schema=schema,
+                page=page,
+                page_size=page_size,
+                count=count,
+                content=await func(*args, **kwargs, **window(page=page, page_size=page_size, count=count)),
             )
 
         return decorator
 
     @classmethod
     def _decorate_sync(cls, func: t.Callable, schema: t.Any) -> t.Callable:
+        window = cls._window(func)
+
         @functools.wraps(func)
         def decorator(
             *args,
@@ -91,8 +114,13 @@ class PageNumberDecoratorFactory(PaginationDecoratorFactory):
             count: t.Optional[bool] = False,
             **kwargs,
         ):
+            cls._validate(page=page, page_size=page_size)
             return PageNumberResponse(
-                schema=schema, page=page, page_size=page_size, count=count, content=func(*args, **kwargs)
+                schema=schema,
+                page=page,
+                page_size=page_size,
+                count=count,
+                content=func(*args, **kwargs, **window(page=page, page_size=page_size, count=count)),
             )
 
         return decorator
@@ -5,7 +5,7 @@ from flama.pagination import mixins, types
 __all__ = ["paginator"]
 
 
-class Paginator(mixins.LimitOffsetMixin, mixins.PageNumberMixin):
+class Paginator(mixins.CursorMixin, mixins.LimitOffsetMixin, mixins.PageNumberMixin):
     def __init__(self):
         self.schemas = {}
 
@@ -13,6 +13,7 @@ class Paginator(mixins.LimitOffsetMixin, mixins.PageNumberMixin):
         return {
             types.PaginationType.limit_offset: self._paginate_limit_offset,
             types.PaginationType.page_number: self._paginate_page_number,
+            types.PaginationType.cursor: self._paginate_cursor,
         }[types.PaginationType[pagination]](func)
 
 
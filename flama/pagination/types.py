@@ -1,10 +1,148 @@
+import base64
+import binascii
+import dataclasses
 import enum
+import typing as t
 
-from flama import compat
+from flama import compat, json_engines
 
-__all__ = ["PaginationType"]
+__all__ = ["PaginationType", "PaginationWindow", "Page", "Cursor", "CursorWindow"]
 
 
 class PaginationType(compat.StrEnum):  # PORT: Replace compat when stop supporting 3.10
     page_number = enum.auto()
     limit_offset = enum.auto()
+    cursor = enum.auto()
+
+
+@dataclasses.dataclass(frozen=True)
+class Cursor:
+    """Position in a collection sorted by some columns.
+
+    The position is defined by the values of the sorting columns of the element where the cursor points to, so the
+    elements next to it can be fetched by a keyset query regardless of how deep in the collection it is. Backwards
+    cursors point to the elements before that position instead of after.
+    """
+
+    values: tuple[t.Any, ...]
+    backwards: bool = False
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque string.
+
+        :return: Encoded cursor.
+        """
+        return (
+            base64.urlsafe_b64encode(json_engines.get().dumps({"values": self.values, "backwards": self.backwards}))
+            .rstrip(b"=")
+            .decode()
+        )
+
+    @classmethod
+    def decode(cls, cursor: str) -> "Cursor":
+        """Decode a cursor from an opaque string.
+
+        :param cursor: Encoded cursor.
+        :return: Cursor.
+        :raises ValueError: If the cursor is malformed.
+        """
+        try:
+            data = json_engines.get().loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, ValueError, TypeError):
+            raise ValueError("Malformed cursor")
+
+        if (
+            not isinstance(data, dict)
+            or not isinstance(data.get("values"), list)
+            or not isinstance(data.get("backwards"), bool)
+            or any(isinstance(x, (list, dict)) for x in data["values"])
+        ):
+            raise ValueError("Malformed cursor")
+
+        return cls(values=tuple(data["values"]), backwards=data["backwards"])
+
+
+@dataclasses.dataclass(frozen=True)
+class PaginationWindow:
+    """Slice of the collection requested to a paginated view.
+
+    It is given to paginated views that define a `pagination` param, so they can fetch only the elements of the
+    requested slice instead of the whole collection.
+    """
+
+    offset: int
+    limit: int
+    count: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class Page:
+    """Elements of a collection already sliced by a paginated view.
+
+    Paginated views that fetch only the requested slice return a page, so the response does not slice it again. The
+    count is the total number of elements in the collection, and it is only required when the window requests it.
+    Views paginated by cursor also give the cursors pointing to the next and previous pages, if any.
+    """
+
+    data: t.Sequence[t.Any]
+    count: t.Optional[int] = None
+    next: t.Optional[Cursor] = None
+    prev: t.Optional[Cursor] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class CursorWindow:
+    """Page of the collection requested to a view paginated by cursor.
+
+    It is given to paginated views that define a `pagination` param, so they can fetch only the elements of the
+    requested page using a keyset query, with a cost that does not depend on how deep in the collection the page is.
+    """
+
+    limit: int
+    cursor: t.Optional[Cursor] = None
+    count: bool = False
+
+    @property
+    def backwards(self) -> bool:
+        return self.cursor is not None and self.cursor.backwards
+
+    def keyset_params(self, order_direction: str = "asc") -> dict[str, t.Any]:
+        """Params for listing the elements of this page from a SQLAlchemy table manager or repository.
+
+        Elements are listed in the direction of the cursor, and one more element than the page size is fetched to know
+        if there are more elements beyond this page.
+
+        :param order_direction: Direction of the collection, either `asc` or `desc`.
+        :return: Keyword params for `list`.
+        """
+        if self.backwards:
+            order_direction = "asc" if order_direction == "desc" else "desc"
+
+        return {
+            "order_direction": order_direction,
+            "limit": self.limit + 1,
+            "keyset": self.cursor.values if self.cursor else None,
+        }
+
+    def page(
+        self, elements: t.Sequence[t.Any], key: t.Callable[[t.Any], tuple[t.Any, ...]], count: t.Optional[int] = None
+    ) -> Page:
+        """Build a page from the elements listed using the keyset params of this window.
+
+        :param elements: Listed elements.
+        :param key: Function returning the values of the sorting columns of an element, as used by the keyset.
+        :param count: Total number of elements in the collection.
+        :return: Page with the cursors pointing to the next and previous pages.
+        """
+        more = len(elements) > self.limit
+        data = list(elements[: self.limit])
+
+        if self.backwards:
+            data.reverse()
+            next_ = Cursor(key(data[-1])) if data else None
+            prev = Cursor(key(data[0]), backwards=True) if data and more else None
+        else:
+            next_ = Cursor(key(data[-1])) if data and more else None
+            prev = Cursor(key(data[0]), backwards=True) if data and self.cursor is not None else None
+
+        return Page(data=data, count=count, next=next_, prev=prev)
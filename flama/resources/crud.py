@@ -3,12 +3,23 @@ from http import HTTPStatus
 
 from flama import exceptions, http, schemas
 from flama.ddd import exceptions as ddd_exceptions
+from flama.pagination.types import Page, PaginationWindow
 from flama.resources import data_structures
 from flama.resources.rest import RESTResource, RESTResourceType
 from flama.resources.routing import resource_method
 from flama.resources.workers import FlamaWorker
 
-__all__ = ["CreateMixin", "RetrieveMixin", "UpdateMixin", "DeleteMixin", "ListMixin", "DropMixin", "CRUDResourceType"]
+__all__ = [
+    "CreateMixin",
+    "RetrieveMixin",
+    "UpdateMixin",
+    "DeleteMixin",
+    "ListMixin",
+    "StreamMixin",
+    "DropMixin",
+    "CRUDResourceType",
+    "StreamCRUDResourceType",
+]
 
 
 class CreateMixin:
@@ -76,6 +87,8 @@ class RetrieveMixin:
             worker: FlamaWorker,
             resource_id: rest_model.primary_key.type,  # type: ignore
         ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(rest_schemas.output.schema)]:  # type: ignore
+            if self.read_replica and worker.read_only is None:
+                worker.read_only = True
             try:
                 async with worker:
                     repository = worker.repositories[self._meta.name]
@@ -121,19 +134,14 @@ class UpdateMixin:
         ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(rest_schemas.output.schema)]:
             resource[rest_model.primary_key.name] = resource_id
             async with worker:
+                repository = worker.repositories[self._meta.name]
                 try:
-                    repository = worker.repositories[self._meta.name]
-                    await repository.delete(**{rest_model.primary_key.name: resource_id})
+                    return await repository.replace(resource, **{rest_model.primary_key.name: resource_id})
                 except ddd_exceptions.NotFoundError as e:
                     raise exceptions.HTTPException(status_code=HTTPStatus.NOT_FOUND, detail=str(e))
-
-                try:
-                    result = await repository.create(resource)
                 except ddd_exceptions.IntegrityError as e:
                     raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
-            return result[0]
-
         update.__doc__ = f"""
             tags:
                 - {verbose_name}
@@ -253,13 +261,30 @@ class ListMixin:
             worker: FlamaWorker,
             order_by: t.Optional[str] = None,
             order_direction: str = "asc",
+            pagination: t.Optional[PaginationWindow] = None,
             **kwargs,
         ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(rest_schemas.output.schema)]:
+            if self.read_replica and worker.read_only is None:
+                worker.read_only = True
             async with worker:
                 repository = worker.repositories[self._meta.name]
-                return [  # type: ignore[return-value]
-                    x async for x in repository.list(order_by=order_by, order_direction=order_direction)
+                if pagination is None:
+                    return [  # type: ignore[return-value]
+                        x async for x in repository.list(order_by=order_by, order_direction=order_direction)
+                    ]
+
+                data = [
+                    x
+                    async for x in repository.list(
+                        order_by=order_by,
+                        order_direction=order_direction,
+                        limit=pagination.limit,
+                        offset=pagination.offset,
+                    )
                 ]
+                return Page(  # type: ignore[return-value]
+                    data=data, count=await repository.count() if pagination.count else None
+                )
 
         list.__doc__ = f"""
             tags:
@@ -277,6 +302,57 @@ class ListMixin:
         return {"_list": list}
 
 
+class StreamMixin:
+    stream_yield_per = 1000
+
+    @classmethod
+    def _add_stream(
+        cls, name: str, verbose_name: str, rest_schemas: data_structures.Schemas, **kwargs
+    ) -> dict[str, t.Any]:
+        @resource_method("/stream/", methods=["GET"], name="stream")
+        async def stream(
+            self,
+            worker: FlamaWorker,
+            request: http.Request,
+            order_by: t.Optional[str] = None,
+            order_direction: str = "asc",
+        ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(rest_schemas.output.schema)]:
+            if self.read_replica and worker.read_only is None:
+                worker.read_only = True
+
+            async def elements() -> t.AsyncIterator[dict[str, t.Any]]:
+                # The unit of work lasts until the whole response is sent
+                async with worker:
+                    repository = worker.repositories[self._meta.name]
+                    async for element in repository.list(
+                        order_by=order_by, order_direction=order_direction, yield_per=cls.stream_yield_per
+                    ):
+                        yield element
+
+            ndjson = http.APIStreamingResponse.ndjson_media_type in request.headers.get("accept", "")
+            return http.APIStreamingResponse(  # type: ignore[return-value]
+                elements(),
+                schema=rest_schemas.output.schema,
+                media_type=http.APIStreamingResponse.ndjson_media_type if ndjson else None,
+            )
+
+        stream.__doc__ = f"""
+            tags:
+                - {verbose_name}
+            summary:
+                Stream collection
+            description:
+                Stream all resources in this collection, fetching them from the database in batches. Resources are
+                sent as a JSON array, or as newline delimited JSON if 'application/x-ndjson' is accepted.
+            responses:
+                200:
+                    description:
+                        Resources stream.
+        """
+
+        return {"_stream": stream}
+
+
 class ReplaceMixin:
     @classmethod
     def _add_replace(
@@ -297,7 +373,7 @@ class ReplaceMixin:
                 repository = worker.repositories[self._meta.name]
                 await repository.drop()
                 try:
-                    return await repository.create(*resources)
+                    return await repository.bulk_create(resources)  # type: ignore[return-value]
                 except ddd_exceptions.IntegrityError as e:
                     raise exceptions.HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail=str(e))
 
@@ -410,12 +486,37 @@ class CRUDResourceType(
     PartialReplaceMixin,
     DropMixin,
 ):
-    METHODS = ("create", "retrieve", "update", "partial_update", "delete", "list", "replace", "partial_replace", "drop")
+    METHODS = (
+        "create",
+        "retrieve",
+        "update",
+        "partial_update",
+        "delete",
+        "list",
+        "replace",
+        "partial_replace",
+        "drop",
+    )
 
     @staticmethod
     def _is_abstract(namespace: dict[str, t.Any]) -> bool:
         return namespace.get("__module__") == "flama.resources.crud" and namespace.get("__qualname__") == "CRUDResource"
 
 
+class StreamCRUDResourceType(CRUDResourceType, StreamMixin):
+    METHODS = (
+        "create",
+        "stream",  # Before retrieve, so its path is not taken as a resource id
+        "retrieve",
+        "update",
+        "partial_update",
+        "delete",
+        "list",
+        "replace",
+        "partial_replace",
+        "drop",
+    )
+
+
 class CRUDResource(RESTResource, metaclass=CRUDResourceType):
     ...
@@ -148,3 +148,4 @@ class RESTResource(Resource, metaclass=RESTResourceType):
     schema: t.Any
     input_schema: t.Any
     output_schema: t.Any
+    read_replica: bool = True  # Read only methods route their units of work to a read replica, if not declared already
@@ -24,17 +24,29 @@ class Repositories:
 class FlamaWorker(SQLAlchemyWorker):
     """The worker used by Flama Resources."""
 
-    def __init__(self, app: t.Optional["Flama"] = None):
+    def __init__(self, app: t.Optional["Flama"] = None, *, lock: bool = False):
         """Initialize the worker.
 
         This special worker is used to handle the repositories created by Flama Resources.
 
         :param app: The application instance.
+        :param lock: If the units of work of this worker and its clones must run one at a time.
         """
 
-        super().__init__(app)
+        super().__init__(app, lock=lock)
         self._resources_repositories = Repositories()
 
+    def clone(self) -> "FlamaWorker":
+        """Create a worker for running an isolated unit of work.
+
+        The new worker shares the registered repositories with this one, but initializes its own instances of them.
+
+        :return: New worker.
+        """
+        worker = t.cast(FlamaWorker, super().clone())
+        worker._resources_repositories = Repositories(registered=self._resources_repositories.registered)
+        return worker
+
     def add_repository(self, name: str, repository: type["SQLAlchemyTableRepository"]) -> None:
         """Register a repository.
 
@@ -1,13 +1,15 @@
 import abc
 import builtins
+import dataclasses
 import enum
 import functools
 import inspect
 import logging
+import re
 import typing as t
 
 from flama import compat, concurrency, endpoints, exceptions, http, schemas, types, url, websockets
-from flama.injection import Component, Components
+from flama.injection import Component, ComponentError, Components
 from flama.lifespan import Lifespan
 from flama.pagination import paginator
 from flama.schemas.routing import RouteParametersMixin
@@ -32,6 +34,53 @@ class Match(enum.Enum):
     full = enum.auto()
 
 
+@dataclasses.dataclass(frozen=True)
+class RouteResolution:
+    """The route resolved for a request, stored in the ASGI scope so it is only resolved once."""
+
+    SCOPE_KEY: t.ClassVar[str] = "route_resolution"
+
+    router: "Router"
+    path: str
+    route: "BaseRoute"
+    scope: types.Scope
+
+    @classmethod
+    def from_scope(cls, scope: types.Scope) -> t.Optional["RouteResolution"]:
+        """Get the resolution stored in given scope, if any.
+
+        :param scope: ASGI scope.
+        :return: Route resolution.
+        """
+        return scope.get(cls.SCOPE_KEY)
+
+    @classmethod
+    def resolve(cls, scope: types.Scope, endpoint: t.Any) -> tuple["BaseRoute", types.Scope]:
+        """Get the route in charge of given endpoint and its scope.
+
+        The resolution stored in the scope is reused if it points to given endpoint, otherwise the route is resolved
+        again from the app.
+
+        :param scope: ASGI scope.
+        :param endpoint: Endpoint handling the request.
+        :return: Route and its scope.
+        """
+        if (resolution := cls.from_scope(scope)) is not None and resolution.route.endpoint is endpoint:
+            return resolution.route, scope
+
+        scope["path"] = scope.get("root_path", "").rstrip("/") + scope["path"]
+        scope["root_path"] = ""
+        return scope["app"].router.resolve_route(scope)
+
+    @property
+    def route_scope(self) -> types.Scope:
+        """Route scope including this resolution.
+
+        :return: Route scope.
+        """
+        return types.Scope({**self.scope, self.SCOPE_KEY: self})
+
+
 class EndpointWrapper:
     type = _EndpointType
 
@@ -51,6 +100,7 @@ class EndpointWrapper:
             handler = paginator.paginate(pagination, handler)
 
         self.handler = handler
+        self._response_schema: t.Optional[tuple[t.Any, t.Optional[schemas.Schema]]] = None
         functools.update_wrapper(self, handler)
         decorator_select: dict[tuple[_EndpointType, bool], types.App] = {
             (self.type.http, False): self._http_function,
@@ -75,9 +125,7 @@ class EndpointWrapper:
         :return: None.
         """
         app = scope["app"]
-        scope["path"] = scope.get("root_path", "").rstrip("/") + scope["path"]
-        scope["root_path"] = ""
-        route, route_scope = app.router.resolve_route(scope)
+        route, route_scope = RouteResolution.resolve(scope, self.handler)
         state = {
             "scope": route_scope,
             "receive": receive,
@@ -93,7 +141,7 @@ class EndpointWrapper:
         try:
             injected_func = await app.injector.inject(self.handler, state)
             response = await concurrency.run(injected_func)
-            response = self._build_api_response(self.handler, response)
+            response = self._build_api_response(response)
         except Exception:
             logger.exception("Error performing request")
             raise
@@ -109,7 +157,7 @@ class EndpointWrapper:
         :return: None.
         """
         response = await self.handler(scope, receive, send)
-        response = self._build_api_response(self.handler, response)
+        response = self._build_api_response(response)
 
         await response(scope, receive, send)
 
@@ -122,9 +170,7 @@ class EndpointWrapper:
         :return: None.
         """
         app = scope["app"]
-        scope["path"] = scope.get("root_path", "").rstrip("/") + scope["path"]
-        scope["root_path"] = ""
-        route, route_scope = app.router.resolve_route(scope)
+        route, route_scope = RouteResolution.resolve(scope, self.handler)
         state = {
             "scope": route_scope,
             "receive": receive,
@@ -153,22 +199,37 @@ class EndpointWrapper:
         """
         await self.handler(scope, receive, send)
 
-    def _build_api_response(self, handler: t.Callable, response: t.Union[http.Response, None]) -> http.Response:
-        """Build an API response given a handler and the current response.
+    @property
+    def response_schema(self) -> t.Optional[schemas.Schema]:
+        """Output schema inferred from the handler signature.
 
-        It infers the output schema from the handler signature or just wraps the response in a APIResponse object.
+        It is calculated only once for each schema library, so responses don't need to inspect the handler.
 
-        :param handler: The handler in charge of the request.
-        :param response: The current response.
-        :return: An API response.
+        :return: Output schema, or None if the handler doesn't declare one.
         """
-        if isinstance(response, (dict, list)):
+        if self._response_schema is None or self._response_schema[0] is not schemas.lib:
             try:
-                schema = schemas.Schema.from_type(inspect.signature(handler).return_annotation).unique_schema
+                schema: t.Optional[schemas.Schema] = schemas.Schema(
+                    schema=schemas.Schema.from_type(inspect.signature(self.handler).return_annotation).unique_schema
+                )
             except Exception:
                 schema = None
 
-            response = http.APIResponse(content=response, schema=schema)
+            self._response_schema = (schemas.lib, schema)
+
+        return self._response_schema[1]
+
+    def _build_api_response(self, response: t.Union[http.Response, None]) -> http.Response:
+        """Build an API response given the current response.
+
+        It uses the output schema inferred from the handler signature or just wraps the response in a APIResponse
+        object.
+
+        :param response: The current response.
+        :return: An API response.
+        """
+        if isinstance(response, (dict, list)):
+            response = http.APIResponse(content=response, schema=self.response_schema)
         elif isinstance(response, str):
             response = http.APIResponse(content=response)
         elif response is None:
@@ -224,13 +285,21 @@ class BaseRoute(abc.ABC, RouteParametersMixin):
     def build(self, app: t.Optional["Flama"] = None) -> None:
         """Build step for routes.
 
-        Just build the parameters' descriptor part of RouteParametersMixin.
+        Build the parameters' descriptor part of RouteParametersMixin, and the injection plan of every endpoint handler
+        so it is not calculated when serving requests. Handlers that cannot be resolved yet are skipped, and they will
+        fail when performing a request as usual.
 
         :param app: Flama app.
         """
         if app:
             self.parameters.build(app)
 
+            for handler in self.endpoint_handlers().values():
+                try:
+                    app.injector.compile_function(handler)
+                except ComponentError:
+                    ...
+
     def endpoint_handlers(self) -> dict[str, t.Callable]:
         """Return a mapping of all possible endpoints of this route.
 
@@ -270,6 +339,17 @@ class BaseRoute(abc.ABC, RouteParametersMixin):
             }
         )
 
+    def _resolved_scope(self, scope: types.Scope) -> types.Scope:
+        """Build the scope used for handling a request, reusing the route resolution if it points to this route.
+
+        :param scope: ASGI scope.
+        :return: Route scope.
+        """
+        if (resolution := RouteResolution.from_scope(scope)) is not None and resolution.route is self:
+            return scope
+
+        return types.Scope({**scope, **self.route_scope(scope)})
+
     def resolve_url(self, name: str, **params: t.Any) -> url.URL:
         """Builds URL path for given name and params.
 
@@ -337,7 +417,7 @@ class Route(BaseRoute):
 
     async def __call__(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
         if scope["type"] == "http":
-            await self.handle(types.Scope({**scope, **self.route_scope(scope)}), receive, send)
+            await self.handle(self._resolved_scope(scope), receive, send)
 
     def __eq__(self, other: t.Any) -> bool:
         return super().__eq__(other) and isinstance(other, Route) and self.methods == other.methods
@@ -422,7 +502,7 @@ class WebSocketRoute(BaseRoute):
 
     async def __call__(self, scope: types.Scope, receive: types.Receive, send: types.Send) -> None:
         if scope["type"] == "websocket":
-            await self.handle(types.Scope({**scope, **self.route_scope(scope)}), receive, send)
+            await self.handle(self._resolved_scope(scope), receive, send)
 
     def __eq__(self, other: t.Any) -> bool:
         return super().__eq__(other) and isinstance(other, WebSocketRoute)
@@ -592,6 +672,186 @@ class Mount(BaseRoute):
         return getattr(self.app, "routes", [])
 
 
+class _RoutesIndexNode:
+    __slots__ = ("static", "params", "routes", "mounts")
+
+    def __init__(self) -> None:
+        """A node of the routes index, representing a single path segment."""
+        self.static: dict[str, "_RoutesIndexNode"] = {}
+        self.params: dict[str, tuple[re.Pattern, "_RoutesIndexNode"]] = {}
+        self.routes: list[int] = []
+        self.mounts: list[tuple[str, int]] = []
+
+    def child(self, segment: str) -> "_RoutesIndexNode":
+        """Get or create the child node for a given path template segment.
+
+        :param segment: Path template segment.
+        :return: Child node.
+        """
+        if (param := url.RegexPath.PARAM_REGEX.fullmatch(segment)) is None:
+            return self.static.setdefault(segment, _RoutesIndexNode())
+
+        regex = url.RegexPath.SERIALIZERS[param.group("type") or "str"].regex
+        if regex not in self.params:
+            self.params[regex] = (re.compile(regex), _RoutesIndexNode())
+        return self.params[regex][1]
+
+
+class RoutesIndex:
+    SEGMENT_SERIALIZERS: t.ClassVar[tuple[type[url.ParamSerializer], ...]] = (
+        url.StringParamSerializer,
+        url.IntegerParamSerializer,
+        url.UUIDParamSerializer,
+    )
+    REGEX_SPECIAL_CHARACTERS: t.ClassVar[frozenset[str]] = frozenset(".^$*+?{}[]\\|()")
+
+    def __init__(self, routes: t.Sequence[BaseRoute]):
+        """A segment tree of routes used for discarding routes that cannot match a given path without running their
+        regexes.
+
+        Static segments are looked up in a dict, and typed params are checked running their serializer regex against
+        its own segment only. Mount points are stored as prefixes in the node where their path ends. Any route that
+        cannot be represented as a sequence of segments (params in the middle of a segment, params that can span
+        several segments...) is kept as a fallback and always returned as candidate.
+
+        The index only discards routes, the final match is still done by each route, so the behavior is exactly the
+        same as iterating over all routes.
+
+        :param routes: Routes to be indexed.
+        """
+        self.routes = list(routes)
+        self._root = _RoutesIndexNode()
+        self._fallback: list[int] = []
+
+        for position, route in enumerate(self.routes):
+            if not self._add(position, route):
+                self._fallback.append(position)
+
+    def __len__(self) -> int:
+        return len(self.routes)
+
+    def _is_static(self, segment: str) -> bool:
+        return not any(x in self.REGEX_SPECIAL_CHARACTERS for x in segment)
+
+    def _is_segment(self, segment: str) -> bool:
+        if (param := url.RegexPath.PARAM_REGEX.fullmatch(segment)) is not None:
+            serializer = url.RegexPath.SERIALIZERS.get(param.group("type") or "str")
+            return type(serializer) in self.SEGMENT_SERIALIZERS
+
+        return self._is_static(segment)
+
+    def _add(self, position: int, route: BaseRoute) -> bool:
+        if isinstance(route, Mount):
+            if route.path.raw_path != route.path.path + "{path:path}":
+                return False
+
+            *segments, tail = route.path.path.split("/")
+            if not self._is_static(tail):
+                return False
+        else:
+            segments, tail = route.path.raw_path.split("/"), None
+
+        if not all(self._is_segment(x) for x in segments):
+            return False
+
+        node = self._root
+        for segment in segments:
+            node = node.child(segment)
+
+        if tail is None:
+            node.routes.append(position)
+        else:
+            node.mounts.append((tail, position))
+
+        return True
+
+    def _lookup(self, node: _RoutesIndexNode, segments: list[str], i: int, result: set[int]) -> None:
+        if i < len(segments):
+            result.update(position for tail, position in node.mounts if segments[i].startswith(tail))
+        else:
+            result.update(node.routes)
+            return
+
+        if (child := node.static.get(segments[i])) is not None:
+            self._lookup(child, segments, i + 1, result)
+
+        for regex, child in node.params.values():
+            if regex.fullmatch(segments[i]):
+                self._lookup(child, segments, i + 1, result)
+
+    def candidates(self, path: str) -> list[BaseRoute]:
+        """Look for all routes that could match given path, keeping the original order.
+
+        :param path: Request path.
+        :return: Candidate routes.
+        """
+        result = set(self._fallback)
+        self._lookup(self._root, path.split("/"), 0, result)
+        return [self.routes[x] for x in sorted(result)]
+
+
+class _RoutesList(list):
+    """List of the routes of a router that drops the routes index of the router whenever it is modified."""
+
+    def __init__(self, routes: t.Iterable[BaseRoute], router: "Router"):
+        super().__init__(routes)
+        self._router = router
+
+    def _changed(self) -> None:
+        del self._router.index
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, other):
+        result = super().__imul__(other)
+        self._changed()
+        return result
+
+    def append(self, route):
+        super().append(route)
+        self._changed()
+
+    def extend(self, routes):
+        super().extend(routes)
+        self._changed()
+
+    def insert(self, index, route):
+        super().insert(index, route)
+        self._changed()
+
+    def remove(self, route):
+        super().remove(route)
+        self._changed()
+
+    def pop(self, index=-1):
+        result = super().pop(index)
+        self._changed()
+        return result
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
 class Router:
     def __init__(
         self,
@@ -600,6 +860,7 @@ class Router:
         components: t.Optional[t.Union[t.Sequence["Component"], set["Component"]]] = None,
         lifespan: t.Optional[t.Callable[[t.Optional["Flama"]], t.AsyncContextManager]] = None,
         root: t.Optional["Flama"] = None,
+        compiled: bool = False,
     ):
         """A router for containing all routes and mount points.
 
@@ -607,10 +868,13 @@ class Router:
         :param components: Components registered in this router.
         :param lifespan: Lifespan function.
         :param root: Flama application.
+        :param compiled: Use a routes index for resolving routes instead of checking every route.
         """
+        self._index: t.Optional[RoutesIndex] = None
         self.routes = [] if routes is None else list(routes)
         self.components = Components(components if components else set())
         self.lifespan = Lifespan(lifespan)
+        self.compiled = compiled
 
         if root:
             self.build(root)
@@ -635,13 +899,48 @@ class Router:
     def build(self, app: "Flama") -> None:
         """Build step for routes.
 
-        Just build the parameters' descriptor part of RouteParametersMixin.
+        Build the parameters' descriptor part of RouteParametersMixin, and the routes index if this router is compiled.
+        Routers mounted under a compiled router are compiled too.
 
         :param app: Flama app.
         """
         for route in self.routes:
+            if self.compiled and isinstance(route, Mount) and isinstance(route.app, Router):
+                route.app.compiled = True
             route.build(app)
 
+        del self.index
+        if self.compiled:
+            self._index = RoutesIndex(self.routes)
+
+    @property
+    def routes(self) -> list[BaseRoute]:
+        """Get all routes registered in this router.
+
+        :return: List of routes.
+        """
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: t.Iterable[BaseRoute]):
+        self._routes = _RoutesList(routes, self)
+        del self.index
+
+    @property
+    def index(self) -> RoutesIndex:
+        """Routes index used for resolving routes, it's dropped whenever the routes change and rebuilt when needed.
+
+        :return: Routes index.
+        """
+        if self._index is None:
+            self._index = RoutesIndex(self.routes)
+
+        return self._index
+
+    @index.deleter
+    def index(self):
+        self._index = None
+
     def add_component(self, component: Component):
         """Register a new component.
 
@@ -815,6 +1114,9 @@ class Router:
 
         assert mount is not None, "Either 'path' and 'app' or 'mount' variables are needed"
 
+        if self.compiled and isinstance(mount.app, Router):
+            mount.app.compiled = True
+
         self.routes.append(mount)
 
         mount.build(root)
@@ -824,13 +1126,25 @@ class Router:
     def resolve_route(self, scope: types.Scope) -> tuple[BaseRoute, types.Scope]:
         """Look for a route that matches given ASGI scope.
 
+        The resolution is stored in the scope, so resolving the same scope again with this router reuses it instead of
+        matching all routes again.
+
         :param scope: ASGI scope.
         :return: Route and its scope.
         """
+        resolution = RouteResolution.from_scope(scope)
+        if resolution is None or resolution.router is not self or resolution.path != scope["path"]:
+            route, route_scope = self._match_route(scope)
+            resolution = RouteResolution(router=self, path=scope["path"], route=route, scope=route_scope)
+            scope[RouteResolution.SCOPE_KEY] = resolution
+
+        return resolution.route, resolution.route_scope
+
+    def _match_route(self, scope: types.Scope) -> tuple[BaseRoute, types.Scope]:
         partial = None
         partial_allowed_methods: set[str] = set()
 
-        for route in self.routes:
+        for route in self.index.candidates(scope["path"]) if self.compiled else self.routes:
             m = route.match(scope)
             if m == Match.full:
                 route_scope = types.Scope({**scope, **route.route_scope(scope)})
@@ -7,6 +7,8 @@ __all__ = [
     "LimitOffset",
     "PageNumberMeta",
     "PageNumber",
+    "CursorMeta",
+    "Cursor",
     "MLModelInput",
     "MLModelOutput",
     "SCHEMAS",
@@ -61,6 +63,28 @@ class PageNumber(marshmallow.Schema):
     )
 
 
+class CursorMeta(marshmallow.Schema):
+    limit = marshmallow.fields.Integer(metadata={"title": "limit", "description": "Number of retrieved items"})
+    next = marshmallow.fields.String(
+        metadata={"title": "next", "description": "Cursor pointing to the next page"}, allow_none=True
+    )
+    prev = marshmallow.fields.String(
+        metadata={"title": "prev", "description": "Cursor pointing to the previous page"}, allow_none=True
+    )
+    count = marshmallow.fields.Integer(
+        metadata={"title": "count", "description": "Total number of items"}, allow_none=True
+    )
+
+
+class Cursor(marshmallow.Schema):
+    meta = marshmallow.fields.Nested(
+        CursorMeta(), required=True, metadata={"title": "meta", "description": "Pagination metadata"}
+    )
+    data = marshmallow.fields.List(
+        marshmallow.fields.Dict(), required=True, metadata={"title": "data", "description": "Paginated data"}
+    )
+
+
 class MLModelInput(marshmallow.Schema):
     input = marshmallow.fields.List(
         marshmallow.fields.Raw(),
@@ -84,6 +108,8 @@ SCHEMAS = {
     "flama.LimitOffset": LimitOffset,
     "flama.PageNumberMeta": PageNumberMeta,
     "flama.PageNumber": PageNumber,
+    "flama.CursorMeta": CursorMeta,
+    "flama.Cursor": Cursor,
     "flama.MLModelInput": MLModelInput,
     "flama.MLModelOutput": MLModelOutput,
 }
@@ -9,6 +9,8 @@ __all__ = [
     "LimitOffset",
     "PageNumberMeta",
     "PageNumber",
+    "CursorMeta",
+    "Cursor",
     "MLModelInput",
     "MLModelOutput",
     "SCHEMAS",
@@ -47,6 +49,18 @@ class PageNumber(BaseModel):
     data: list[t.Any] = Field(title="data", description="Paginated data")
 
 
+class CursorMeta(BaseModel):
+    limit: int = Field(title="limit", description="Number of retrieved items")
+    next: t.Optional[str] = Field(title="next", description="Cursor pointing to the next page")
+    prev: t.Optional[str] = Field(title="prev", description="Cursor pointing to the previous page")
+    count: t.Optional[int] = Field(title="count", description="Total number of items")
+
+
+class Cursor(BaseModel):
+    meta: CursorMeta = Field(title="meta", description="Pagination metadata")
+    data: list[t.Any] = Field(title="data", description="Paginated data")
+
+
 class MLModelInput(BaseModel):
     input: list[t.Any] = Field(title="input", description="Model input")
 
@@ -62,6 +76,8 @@ SCHEMAS = {
     "flama.LimitOffset": LimitOffset,
     "flama.PageNumberMeta": PageNumberMeta,
     "flama.PageNumber": PageNumber,
+    "flama.CursorMeta": CursorMeta,
+    "flama.Cursor": Cursor,
     "flama.MLModelInput": MLModelInput,
     "flama.MLModelOutput": MLModelOutput,
 }
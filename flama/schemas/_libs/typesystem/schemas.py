@@ -7,6 +7,8 @@ __all__ = [
     "LimitOffset",
     "PageNumberMeta",
     "PageNumber",
+    "CursorMeta",
+    "Cursor",
     "MLModelInput",
     "MLModelOutput",
     "SCHEMAS",
@@ -74,6 +76,26 @@ PageNumber = Schema(
 )
 SCHEMAS["flama.PageNumber"] = PageNumber
 
+CursorMeta = Schema(
+    title="CursorMeta",
+    fields={
+        "limit": fields.Integer(title="limit", description="Number of retrieved items"),
+        "next": fields.String(title="next", description="Cursor pointing to the next page", allow_null=True),
+        "prev": fields.String(title="prev", description="Cursor pointing to the previous page", allow_null=True),
+        "count": fields.Integer(title="count", description="Total number of items", allow_null=True),
+    },
+)
+SCHEMAS["flama.CursorMeta"] = CursorMeta
+
+Cursor = Schema(
+    title="Cursor",
+    fields={
+        "meta": Reference(to="flama.CursorMeta", definitions=SCHEMAS, title="meta", description="Pagination metadata"),
+        "data": fields.Array(title="data", description="Paginated data"),
+    },
+)
+SCHEMAS["flama.Cursor"] = Cursor
+
 MLModelInput = Schema(
     title="MLModelInput",
     fields={
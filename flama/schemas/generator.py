@@ -370,7 +370,15 @@ class SchemaGenerator:
     def _build_endpoint_body(
         self, endpoint: EndpointInfo, metadata: dict[str, t.Any]
     ) -> t.Optional[openapi.RequestBody]:
-        content = {k: v for k, v in metadata.get("requestBody", {}).get("content", {}).items()}
+        content = {
+            mime: openapi.MediaType(
+                schema=media_type.get("schema"),
+                example=media_type.get("example"),
+                examples=media_type.get("examples"),
+                encoding=media_type.get("encoding"),
+            )
+            for mime, media_type in metadata.get("requestBody", {}).get("content", {}).items()
+        }
 
         if endpoint.body_parameter:
             if endpoint.body_parameter.schema.schema not in self.schemas:
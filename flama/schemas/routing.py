@@ -1,3 +1,4 @@
+import functools
 import inspect
 import typing as t
 
@@ -13,16 +14,52 @@ if t.TYPE_CHECKING:
 __all__ = ["RouteParametersMixin"]
 
 
+def _memoized(func: t.Callable[["ParametersDescriptor"], t.Any]) -> property:
+    """Property whose value is calculated once and stored in the descriptor until it is invalidated."""
+
+    @functools.wraps(func)
+    def _wrapper(self: "ParametersDescriptor") -> t.Any:
+        key = (self._app.components, schemas.lib)
+        if self._key is None or self._key[0] is not key[0] or self._key[1] is not key[1]:
+            self._cache.clear()
+            self._key = key
+
+        try:
+            return self._cache[func.__name__]
+        except KeyError:
+            value = self._cache[func.__name__] = func(self)
+            return value
+
+    return property(_wrapper)
+
+
 class ParametersDescriptor:
-    def __init__(self) -> None:
-        self._route: "BaseRoute"
+    def __init__(self, route: t.Optional["BaseRoute"] = None) -> None:
+        """Parameters of a route, calculated once per route and reused until the app components or the schema library
+        change.
+
+        The descriptor defined in the class creates a new one for each route the first time it is accessed, and stores
+        it in the route instance, so each route keeps its own values.
+
+        :param route: Route these parameters belongs to.
+        """
+        self._name = "parameters"
+        self._route = t.cast("BaseRoute", route)
         self._app: "Flama"
+        self._key: t.Optional[tuple[t.Any, t.Any]] = None
+        self._cache: dict[str, t.Any] = {}
+
+    def __set_name__(self, owner, name) -> None:
+        self._name = name
 
     def __get__(self, instance, owner) -> "ParametersDescriptor":
-        self._route = instance
-        return self
+        if instance is None:
+            return self
+
+        descriptor = instance.__dict__[self._name] = ParametersDescriptor(instance)
+        return descriptor
 
-    @property
+    @_memoized
     def _parameters(self) -> dict[str, list["InjectionParameter"]]:
         return {
             method: sorted(
@@ -36,14 +73,14 @@ class ParametersDescriptor:
             for method, handler in self._route.endpoint_handlers().items()
         }
 
-    @property
+    @_memoized
     def _return_values(self) -> dict[str, "InjectionParameter"]:
         return {
             method: Return.from_return_annotation(inspect.signature(handler).return_annotation)
             for method, handler in self._route.endpoint_handlers().items()
         }
 
-    @property
+    @_memoized
     def query(self) -> dict[str, Parameters]:
         return {
             method: {
@@ -54,14 +91,14 @@ class ParametersDescriptor:
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def path(self) -> dict[str, Parameters]:
         return {
             method: {p.name: Parameter.build("path", p) for p in parameters if p.name in self._route.path.parameters}
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def body(self) -> dict[str, t.Optional[Parameter]]:
         return {
             method: next(
@@ -76,7 +113,7 @@ class ParametersDescriptor:
             for method, parameters in self._parameters.items()
         }
 
-    @property
+    @_memoized
     def response(self) -> dict[str, Parameter]:
         return {
             method: Parameter.build("response", return_value) for method, return_value in self._return_values.items()
@@ -84,6 +121,7 @@ class ParametersDescriptor:
 
     def build(self, app: "Flama") -> "ParametersDescriptor":
         self._app = app
+        self._key = None
         return self
 
 
@@ -0,0 +1,169 @@
+import json
+import os
+import shutil
+import struct
+import typing as t
+from pathlib import Path
+
+from flama import exceptions
+
+try:
+    import zstandard  # type: ignore
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+__all__ = ["ModelContainer"]
+
+
+class ModelContainer:
+    """Seekable container of a model file in Flama format v2.
+
+    The file starts with a fixed preamble holding the magic bytes, the version of the format and the size of the header.
+    The header is a JSON document with the metadata of the model and the offset, size and compression of each member,
+    followed by the raw bytes of the members. Members are stored uncompressed, or compressed one by one with zstd, so
+    any of them can be read without reading the rest of the file.
+    """
+
+    MAGIC = b"\x89FLM\r\n\x1a\n"
+    VERSION = 2
+    CHUNK_SIZE = 1 << 20
+    _preamble = struct.Struct("<8sHQ")
+
+    def __init__(self, path: t.Union[str, os.PathLike]):
+        """Open a model file, reading its header.
+
+        :param path: Model file path.
+        :raises ValueError: If the file is not a model file in Flama format v2.
+        """
+        self.path = Path(path)
+
+        with open(self.path, "rb") as f:
+            magic, version, header_size = self._preamble.unpack(f.read(self._preamble.size).ljust(self._preamble.size))
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError(f"Model file '{self.path}' is not in Flama format v{self.VERSION}")
+
+            header = json.loads(f.read(header_size))
+
+        self.meta: dict[str, t.Any] = header["meta"]
+        self.members: dict[str, dict[str, t.Any]] = header["members"]
+        self._data_offset = self._preamble.size + header_size
+
+    @classmethod
+    def is_container(cls, path: t.Union[str, os.PathLike]) -> bool:
+        """Check if a file is a model file in Flama format v2.
+
+        :param path: Model file path.
+        :return: True if it is a model file in Flama format v2.
+        """
+        with open(path, "rb") as f:
+            return f.read(len(cls.MAGIC)) == cls.MAGIC
+
+    @staticmethod
+    def _zstandard() -> t.Any:
+        if zstandard is None:  # noqa
+            raise exceptions.DependencyNotInstalled(
+                dependency=exceptions.DependencyNotInstalled.Dependency.zstandard, dependant=__name__
+            )
+
+        return zstandard
+
+    @classmethod
+    def write(
+        cls,
+        path: t.Union[str, os.PathLike],
+        meta: dict[str, t.Any],
+        members: dict[str, t.Union[bytes, str, os.PathLike]],
+        compression_level: t.Optional[int] = None,
+    ) -> None:
+        """Write a model file.
+
+        :param path: Model file path.
+        :param meta: Model metadata.
+        :param members: Content of each member, either bytes or the path of a file.
+        :param compression_level: Level of zstd compression of the members, not compressed if not given.
+        """
+        compressor = cls._zstandard().ZstdCompressor(level=compression_level) if compression_level is not None else None
+
+        contents: dict[str, t.Union[bytes, Path]] = {}
+        header: dict[str, t.Any] = {"meta": meta, "members": {}}
+        offset = 0
+        for name, member in members.items():
+            if compressor is not None:
+                raw = member if isinstance(member, bytes) else Path(member).read_bytes()
+                compressed = compressor.compress(raw)
+                content: t.Union[bytes, Path] = compressed
+                size, raw_size = len(compressed), len(raw)
+            elif isinstance(member, bytes):
+                content = member
+                size = raw_size = len(member)
+            else:
+                content = Path(member)
+                size = raw_size = content.stat().st_size
+
+            contents[name] = content
+            header["members"][name] = {
+                "offset": offset,
+                "size": size,
+                "raw_size": raw_size,
+                "compression": "zstd" if compressor is not None else None,
+            }
+            offset += size
+
+        encoded_header = json.dumps(header).encode()
+
+        with open(path, "wb") as f:
+            f.write(cls._preamble.pack(cls.MAGIC, cls.VERSION, len(encoded_header)))
+            f.write(encoded_header)
+            for content in contents.values():
+                if isinstance(content, bytes):
+                    f.write(content)
+                else:
+                    with open(content, "rb") as src:
+                        shutil.copyfileobj(src, f, cls.CHUNK_SIZE)
+
+    def read(self, name: str) -> bytes:
+        """Read the content of a member.
+
+        :param name: Member name.
+        :return: Member content.
+        :raises KeyError: If the member does not exist.
+        :raises ValueError: If the model file is truncated.
+        """
+        member = self.members[name]
+
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset + member["offset"])
+            content = f.read(member["size"])
+
+        if len(content) != member["size"]:
+            raise ValueError(f"Model file '{self.path}' is truncated")
+
+        if member["compression"] == "zstd":
+            content = self._zstandard().ZstdDecompressor().decompress(content, max_output_size=member["raw_size"])
+
+        return content
+
+    def extract(self, name: str, path: t.Union[str, os.PathLike]) -> None:
+        """Write the content of a member into a file.
+
+        :param name: Member name.
+        :param path: File path.
+        :raises KeyError: If the member does not exist.
+        :raises ValueError: If the model file is truncated.
+        """
+        member = self.members[name]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        if member["compression"] is not None:
+            Path(path).write_bytes(self.read(name))
+            return
+
+        with open(self.path, "rb") as src, open(path, "wb") as dst:
+            src.seek(self._data_offset + member["offset"])
+            remaining = member["size"]
+            while remaining:
+                chunk = src.read(min(remaining, self.CHUNK_SIZE))
+                if not chunk:
+                    raise ValueError(f"Model file '{self.path}' is truncated")
+                dst.write(chunk)
+                remaining -= len(chunk)
@@ -18,6 +18,7 @@ from pathlib import Path
 
 from flama import compat, exceptions
 from flama.serialize.base import Serializer
+from flama.serialize.container import ModelContainer
 from flama.serialize.types import Framework
 
 if t.TYPE_CHECKING:
@@ -29,6 +30,7 @@ logger = logging.getLogger(__name__)
 
 
 class Compression(compat.StrEnum):  # PORT: Replace compat when stop supporting 3.10
+    none = enum.auto()
     fast = enum.auto()
     standard = enum.auto()
     high = enum.auto()
@@ -36,11 +38,21 @@ class Compression(compat.StrEnum):  # PORT: Replace compat when stop supporting
     @property
     def compression_format(self) -> str:
         return {
+            Compression.none: "",
             Compression.fast: "gz",
             Compression.standard: "bz2",
             Compression.high: "xz",
         }[self]
 
+    @property
+    def zstd_level(self) -> t.Optional[int]:
+        return {
+            Compression.none: None,
+            Compression.fast: 3,
+            Compression.standard: 9,
+            Compression.high: 19,
+        }[self]
+
 
 class FrameworkSerializers:
     @classmethod
@@ -192,28 +204,32 @@ Artifacts = dict[str, t.Union[str, os.PathLike]]
 class _ModelDirectory:
     def __init__(
         self,
-        model_file: t.Union[str, os.PathLike],
+        model_file: t.Optional[t.Union[str, os.PathLike]] = None,
         path: t.Optional[t.Union[str, os.PathLike]] = None,
         delete: bool = True,
     ):
-        """Generate a model directory from a model file.
+        """Generate a model directory, extracting a model file in Flama format v1 into it.
 
-        :param model_file: Model file path.
+        :param model_file: Model file path. Create an empty directory if None.
         :param path: Directory path. Create a temporary directory if None.
         :return: Model directory loaded.
         """
         self.directory = Path(path) if path else Path(tempfile.mkdtemp())
 
-        with tarfile.open(model_file, "r") as tar:
-            tar.extractall(self.directory)
+        if model_file is not None:
+            with tarfile.open(model_file, "r") as tar:
+                tar.extractall(self.directory)
 
-        self.model = self.directory / "model"
-        self.artifacts: Artifacts = {artifact.name: artifact for artifact in self.directory.glob("artifacts/*")}
+            logger.debug("Model '%s' extracted in directory '%s'", model_file, self.directory)
 
-        logger.debug("Model '%s' extracted in directory '%s'", model_file, self.directory)
+        self.model = self.directory / "model"
 
         self._finalizer = weakref.finalize(self, self._cleanup) if delete else None
 
+    @property
+    def artifacts(self) -> Artifacts:
+        return {artifact.name: artifact for artifact in self.directory.glob("artifacts/*")}
+
     def _cleanup(self):
         logger.debug("Model directory '%s' clean", self.directory)
         shutil.rmtree(self.directory)
@@ -266,10 +282,16 @@ class ModelArtifact:
             metadata = Metadata.from_dict(data["meta"])
             artifacts = data.get("artifacts")
             serializer = FrameworkSerializers.serializer(metadata.framework.lib)
-            model = serializer.load(data["model"].encode(), **kwargs)
+            model = serializer.load(codecs.decode(data["model"].encode(), "base64"), **kwargs)
         except KeyError:  # pragma: no cover
             raise ValueError("Wrong data")
 
+        cls._check_version(serializer, metadata)
+
+        return cls(model=model, meta=metadata, artifacts=artifacts)
+
+    @staticmethod
+    def _check_version(serializer: Serializer, metadata: Metadata) -> None:
         if serializer.version() != metadata.framework.version:  # noqa
             warnings.warn(
                 f"Model was built using {metadata.framework.lib.value} '{metadata.framework.version}' but detected "
@@ -277,8 +299,6 @@ class ModelArtifact:
                 exceptions.FrameworkVersionWarning,
             )
 
-        return cls(model=model, meta=metadata, artifacts=artifacts)
-
     @classmethod
     def from_json(cls, data: str, **kwargs) -> "ModelArtifact":
         return cls.from_dict(json.loads(data), **kwargs)
@@ -289,7 +309,9 @@ class ModelArtifact:
 
     def to_dict(self, *, artifacts: bool = True, **kwargs) -> dict[str, t.Any]:
         result: dict[str, t.Any] = {
-            "model": FrameworkSerializers.serializer(self.meta.framework.lib).dump(self.model, **kwargs).decode(),
+            "model": codecs.encode(
+                FrameworkSerializers.serializer(self.meta.framework.lib).dump(self.model, **kwargs), "base64"
+            ).decode(),
             "meta": self.meta.to_dict(),
         }
 
@@ -307,34 +329,64 @@ class ModelArtifact:
     def dump(
         self,
         path: t.Union[str, os.PathLike] = "model.flm",
-        compression: t.Union[str, Compression] = Compression.standard,
+        compression: t.Optional[t.Union[str, Compression]] = None,
+        *,
+        format_version: int = 1,
         **kwargs,
     ) -> None:
         """Serialize model artifact into a file.
 
+        Flama format v1, used by default, stores a tar archive, compressed using gz, bz2 or xz, that contains the model
+        encoded as a JSON document. Flama format v2 stores the raw bytes of the model and artifacts in a seekable
+        container, with the metadata in a separate header, compressing each of them with zstd only if a compression is
+        given.
+
         :param path: Model file path.
-        :param compression: Compression type.
+        :param compression: Compression type, standard for format v1 and none for format v2 if not given.
+        :param format_version: Version of Flama format, either 1 or 2. Version 2 must be requested explicitly.
         :param kwargs: Keyword arguments passed to library dump method.
+        :raises ValueError: If the version of Flama format is unknown.
         """
         logger.info("Dump model '%s'", path)
-        with tarfile.open(path, f"w:{Compression[compression].compression_format}") as tar:  # type: ignore
-            if self.artifacts:
-                for name, path in self.artifacts.items():
-                    tar.add(path, f"artifacts/{name}")
-
-            with tempfile.NamedTemporaryFile("wb") as model:
-                model.write(self.to_bytes(artifacts=False, **kwargs))
-                tar.add(model.name, "model")
+        if compression is None:
+            compression = Compression.none if format_version == ModelContainer.VERSION else Compression.standard
+        compression_type = Compression[compression]
+
+        if format_version == ModelContainer.VERSION:
+            members: dict[str, t.Union[bytes, str, os.PathLike]] = {
+                "model": FrameworkSerializers.serializer(self.meta.framework.lib).dump(self.model, **kwargs)
+            }
+            for name, artifact_path in (self.artifacts or {}).items():
+                members[f"artifacts/{name}"] = artifact_path
+
+            ModelContainer.write(path, self.meta.to_dict(), members, compression_type.zstd_level)
+        elif format_version == 1:
+            with tarfile.open(path, f"w:{compression_type.compression_format}") as tar:  # type: ignore
+                if self.artifacts:
+                    for name, artifact_path in self.artifacts.items():
+                        tar.add(artifact_path, f"artifacts/{name}")
+
+                with tempfile.NamedTemporaryFile("wb") as model:
+                    model.write(self.to_bytes(artifacts=False, **kwargs))
+                    model.flush()
+                    tar.add(model.name, "model")
+        else:
+            raise ValueError(f"Unknown Flama format version '{format_version}'")
 
     @classmethod
     def load(cls, path: t.Union[str, os.PathLike], **kwargs) -> "ModelArtifact":
-        """Deserialize model artifact from a file.
+        """Deserialize model artifact from a file, in any version of Flama format.
 
         :param path: Model file path.
         :param kwargs: Keyword arguments passed to library load method.
         :return: Model artifact loaded.
+        :raises ValueError: If an artifact of the model file points outside of its artifacts directory.
         """
         logger.info("Load model '%s'", path)
+
+        if ModelContainer.is_container(path):
+            return cls._load_container(path, **kwargs)
+
         model_directory = _ModelDirectory(path)
 
         with open(model_directory.model, "rb") as f:
@@ -346,3 +398,31 @@ class ModelArtifact:
             artifacts=model_directory.artifacts or None,
             _directory=model_directory,
         )
+
+    @classmethod
+    def _load_container(cls, path: t.Union[str, os.PathLike], **kwargs) -> "ModelArtifact":
+        container = ModelContainer(path)
+        metadata = Metadata.from_dict(container.meta)
+        serializer = FrameworkSerializers.serializer(metadata.framework.lib)
+        model = serializer.load(container.read("model"), **kwargs)
+        cls._check_version(serializer, metadata)
+
+        artifacts = [name for name in container.members if name.startswith("artifacts/")]
+        if not artifacts:
+            return cls(model=model, meta=metadata)
+
+        model_directory = _ModelDirectory()
+        artifacts_directory = (model_directory.directory / "artifacts").resolve()
+        paths = {name: (model_directory.directory / name).resolve() for name in artifacts}
+        for name, artifact_path in paths.items():
+            # Names come from the model file, so they cannot point outside the artifacts directory
+            if artifact_path.parent != artifacts_directory:
+                model_directory.cleanup()
+                raise ValueError(f"Wrong artifact name '{name}' in model file '{path}'")
+
+        for name, artifact_path in paths.items():
+            container.extract(name, artifact_path)
+
+        logger.debug("Model '%s' artifacts extracted in directory '%s'", path, model_directory.directory)
+
+        return cls(model=model, meta=metadata, artifacts=model_directory.artifacts, _directory=model_directory)
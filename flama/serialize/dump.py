@@ -15,7 +15,8 @@ def dump(
     model: t.Any,
     path: t.Union[str, os.PathLike],
     *,
-    compression: t.Union[str, Compression] = Compression.standard,
+    compression: t.Optional[t.Union[str, Compression]] = None,
+    format_version: int = 1,
     model_id: t.Optional[t.Union[str, uuid.UUID]] = None,
     timestamp: t.Optional[datetime.datetime] = None,
     params: t.Optional[dict[str, t.Any]] = None,
@@ -28,7 +29,8 @@ def dump(
 
     :param model: The ML model.
     :param path: Model file path.
-    :param compression: Compression type.
+    :param compression: Compression type, standard for format v1 and none for format v2 if not given.
+    :param format_version: Version of Flama format, either 1 or 2. Version 2 must be requested explicitly.
     :param model_id: The model ID.
     :param timestamp: The model timestamp.
     :param params: The model parameters.
@@ -45,4 +47,4 @@ def dump(
         metrics=metrics,
         extra=extra,
         artifacts=artifacts,
-    ).dump(path, compression, **kwargs)
+    ).dump(path, compression, format_version=format_version, **kwargs)
@@ -1,4 +1,3 @@
-import codecs
 import importlib.metadata
 import io
 import typing as t
@@ -25,14 +24,13 @@ class PyTorchSerializer(Serializer):
 
         buffer = io.BytesIO()
         torch.jit.save(torch.jit.script(obj), buffer, **kwargs)
-        buffer.seek(0)
-        return codecs.encode(buffer.read(), "base64")
+        return buffer.getvalue()
 
     def load(self, model: bytes, **kwargs) -> t.Any:
         if torch is None:  # noqa
             raise exceptions.FrameworkNotInstalled("pytorch")
 
-        return torch.jit.load(io.BytesIO(codecs.decode(model, "base64")), **kwargs)
+        return torch.jit.load(io.BytesIO(model), **kwargs)
 
     def info(self, model: t.Any) -> t.Optional["JSONSchema"]:
         return {
@@ -1,4 +1,3 @@
-import codecs
 import importlib.metadata
 import logging
 import math
@@ -20,12 +19,12 @@ class SKLearnSerializer(Serializer):
     lib = types.Framework.sklearn
 
     def dump(self, obj: t.Any, **kwargs) -> bytes:
-        return codecs.encode(pickle.dumps(obj), "base64")
+        return pickle.dumps(obj)
 
     def load(self, model: bytes, **kwargs) -> t.Any:
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            model = pickle.loads(codecs.decode(model, "base64"))
+            model = pickle.loads(model)
 
         return model
 
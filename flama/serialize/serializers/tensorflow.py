@@ -1,4 +1,3 @@
-import codecs
 import importlib.metadata
 import json
 import tempfile
@@ -26,14 +25,15 @@ class TensorFlowSerializer(Serializer):
 
         with tempfile.NamedTemporaryFile(mode="rb", suffix=".keras") as tmp_file:
             tf.keras.models.save_model(obj, tmp_file.name)  # type: ignore
-            return codecs.encode(tmp_file.read(), "base64")
+            return tmp_file.read()
 
     def load(self, model: bytes, **kwargs) -> t.Any:
         if tf is None:  # noqa
             raise exceptions.FrameworkNotInstalled("tensorflow")
 
         with tempfile.NamedTemporaryFile(mode="wb", suffix=".keras") as tmp_file:
-            tmp_file.write(codecs.decode(model, "base64"))
+            tmp_file.write(model)
+            tmp_file.flush()
             return tf.keras.models.load_model(tmp_file.name)  # type: ignore
 
     def info(self, model: t.Any) -> t.Optional["JSONSchema"]:
@@ -1,4 +1,5 @@
 import abc
+import itertools
 import logging
 import typing as t
 
@@ -16,7 +17,7 @@ except Exception:  # pragma: no cover
     )
 
 
-__all__ = ["metadata", "SQLAlchemyModule"]
+__all__ = ["metadata", "SQLAlchemyModule", "ReplicaPolicy", "RoundRobinPolicy", "LeastConnectionsPolicy"]
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +35,32 @@ class ConnectionManager(abc.ABC):
         """
         self._engine = engine
 
+    @property
     @abc.abstractmethod
-    async def open(self) -> AsyncConnection:
+    def clients(self) -> int:
+        """Number of clients using a connection of this manager.
+
+        :return: Number of clients.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def open(self, *, read_only: bool = False) -> AsyncConnection:
         """Open a new connection to the database.
 
+        :param read_only: If the connection will be used only for reading.
         :return: Database connection.
         """
         ...
 
+    def autocommit(self, connection: AsyncConnection) -> bool:
+        """Check if a connection runs in autocommit mode, so its statements don't need a transaction.
+
+        :param connection: Database connection.
+        :return: True if the connection runs in autocommit mode.
+        """
+        return False
+
     @abc.abstractmethod
     async def close(self, connection: AsyncConnection) -> None:
         """Close the connection to the database.
@@ -90,6 +109,14 @@ class SingleConnectionManager(ConnectionManager):
         self._connection_clients = 0
         self._transaction_clients = 0
 
+    @property
+    def clients(self) -> int:
+        """Number of clients using the shared connection.
+
+        :return: Number of clients.
+        """
+        return self._connection_clients
+
     @property
     def connection(self) -> AsyncConnection:
         """Connection to the database.
@@ -114,11 +141,13 @@ class SingleConnectionManager(ConnectionManager):
 
         return self._transaction
 
-    async def open(self) -> AsyncConnection:
+    async def open(self, *, read_only: bool = False) -> AsyncConnection:
         """Open a new connection to the database.
 
-        The first client will open a new connection, and subsequent clients will share this same connection.
+        The first client will open a new connection, and subsequent clients will share this same connection. As the
+        connection is shared, read only clients use it as it is.
 
+        :param read_only: If the connection will be used only for reading.
         :return: Database connection.
         """
         try:
@@ -203,17 +232,45 @@ class MultipleConnectionManager(ConnectionManager):
         super().__init__(engine)
         self._connections: set[AsyncConnection] = set()
         self._transactions: dict[AsyncConnection, AsyncTransaction] = {}
+        self._autocommit: set[AsyncConnection] = set()
 
-    async def open(self) -> AsyncConnection:
+    @property
+    def clients(self) -> int:
+        """Number of opened connections.
+
+        :return: Number of clients.
+        """
+        return len(self._connections)
+
+    async def open(self, *, read_only: bool = False) -> AsyncConnection:
         """Open a new connection to the database.
 
+        Read only connections run in autocommit mode, so the driver doesn't send BEGIN and COMMIT for them. If a
+        transaction is begun in one of them, e.g. for a server side cursor, the connection leaves autocommit mode, and
+        on PostgreSQL the transaction runs in read only mode.
+
+        :param read_only: If the connection will be used only for reading.
         :return: Database connection.
         """
         connection = self._engine.connect()
         await connection.start()
+        if read_only:
+            await connection.execution_options(
+                isolation_level="AUTOCOMMIT",
+                **({"postgresql_readonly": True} if self._engine.dialect.name == "postgresql" else {}),
+            )
+            self._autocommit.add(connection)
         self._connections.add(connection)
         return connection
 
+    def autocommit(self, connection: AsyncConnection) -> bool:
+        """Check if a connection runs in autocommit mode, so its statements don't need a transaction.
+
+        :param connection: Database connection.
+        :return: True if the connection runs in autocommit mode.
+        """
+        return connection in self._autocommit
+
     async def close(self, connection: AsyncConnection) -> None:
         """Close the connection to the database.
 
@@ -227,6 +284,7 @@ class MultipleConnectionManager(ConnectionManager):
             await self.end(self._transactions[connection])
 
         self._connections.remove(connection)
+        self._autocommit.discard(connection)
         await connection.close()
 
     async def begin(self, connection: AsyncConnection) -> AsyncTransaction:
@@ -242,6 +300,13 @@ class MultipleConnectionManager(ConnectionManager):
         if connection in self._transactions:
             raise exceptions.SQLAlchemyError("Transaction already started in this connection")
 
+        if connection in self._autocommit:
+            # Statements already run in autocommit mode hold an implicit transaction that must end first
+            await connection.commit()
+            isolation_level = connection.sync_connection.default_isolation_level  # type: ignore[union-attr]
+            await connection.execution_options(isolation_level=isolation_level)
+            self._autocommit.discard(connection)
+
         transaction = await connection.begin()
         self._transactions[connection] = transaction
         return transaction
@@ -264,6 +329,42 @@ class MultipleConnectionManager(ConnectionManager):
             await transaction.commit()
 
 
+class ReplicaPolicy(abc.ABC):
+    """Abstract class for policies that select the read replica used by a connection."""
+
+    @abc.abstractmethod
+    def select(self, managers: t.Sequence[ConnectionManager]) -> ConnectionManager:
+        """Select the connection manager of a read replica.
+
+        :param managers: Connection managers of the read replicas.
+        :return: Selected connection manager.
+        """
+        ...
+
+
+class RoundRobinPolicy(ReplicaPolicy):
+    """Policy that selects each read replica in turn."""
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def select(self, managers: t.Sequence[ConnectionManager]) -> ConnectionManager:
+        return managers[next(self._counter) % len(managers)]
+
+
+class LeastConnectionsPolicy(ReplicaPolicy):
+    """Policy that selects the read replica with the fewest clients."""
+
+    def select(self, managers: t.Sequence[ConnectionManager]) -> ConnectionManager:
+        return min(managers, key=lambda x: x.clients)
+
+
+REPLICA_POLICIES: dict[str, type[ReplicaPolicy]] = {
+    "round_robin": RoundRobinPolicy,
+    "least_connections": LeastConnectionsPolicy,
+}
+
+
 class SQLAlchemyModule(Module):
     """SQLAlchemy module.
 
@@ -278,12 +379,21 @@ class SQLAlchemyModule(Module):
     * Single connection: It will open a single connection and transaction, and all requests will share this connection
     and transaction. The connection will be closed when all clients finishes. It will create a single transaction and
     new transactions requested will be nested from this one.
+
+    Read only connections can be routed to read replicas, chosen by a policy between round-robin (default) and least
+    connections. Any other connection, and every read only connection if there are no replicas, uses the primary
+    database.
     """
 
     name = "sqlalchemy"
 
     def __init__(
-        self, database: str, single_connection: bool = False, engine_args: t.Optional[dict[str, t.Any]] = None
+        self,
+        database: str,
+        single_connection: bool = False,
+        engine_args: t.Optional[dict[str, t.Any]] = None,
+        replicas: t.Optional[t.Sequence[str]] = None,
+        replica_policy: str = "round_robin",
     ):
         """Initialize the SQLAlchemy module.
 
@@ -298,12 +408,19 @@ class SQLAlchemyModule(Module):
 
         :param database: Database connection string.
         :param single_connection: If the module should work in single connection mode.
-        :param engine_args: Arguments to pass to the SQLAlchemy engine.
-        :raises ApplicationError: If SQLAlchemy is not installed.
+        :param engine_args: Arguments to pass to the SQLAlchemy engines.
+        :param replicas: Connection strings of the read replicas.
+        :param replica_policy: Policy for selecting a read replica, either `round_robin` or `least_connections`.
+        :raises ApplicationError: If SQLAlchemy is not installed, or the replica policy is unknown.
         """
         if not database:
             raise exceptions.ApplicationError("Database connection string must be provided")
 
+        if replica_policy not in REPLICA_POLICIES:
+            raise exceptions.ApplicationError(
+                f"Unknown replica policy '{replica_policy}', available policies are: {', '.join(REPLICA_POLICIES)}"
+            )
+
         super().__init__()
 
         self.database = database
@@ -314,6 +431,9 @@ class SQLAlchemyModule(Module):
         self._manager_cls: type[ConnectionManager] = (
             SingleConnectionManager if single_connection else MultipleConnectionManager
         )
+        self.replicas = list(replicas or [])
+        self._replica_managers: dict[AsyncEngine, ConnectionManager] = {}
+        self._replica_policy = REPLICA_POLICIES[replica_policy]()
 
     @property
     def engine(self) -> AsyncEngine:
@@ -337,19 +457,41 @@ class SQLAlchemyModule(Module):
             raise exceptions.ApplicationError("SQLAlchemyModule not initialized")
         return self._connection_manager
 
-    async def open_connection(self) -> AsyncConnection:
+    def _manager(self, connection: AsyncConnection) -> ConnectionManager:
+        """Connection manager that opened a connection.
+
+        :param connection: Database connection.
+        :return: Connection manager.
+        """
+        return self._replica_managers.get(getattr(connection, "engine", None), self.connection_manager)
+
+    async def open_connection(self, *, read_only: bool = False) -> AsyncConnection:
         """Open a new connection to the database.
 
+        Read only connections are opened against a read replica, if any, and they may run in autocommit mode.
+
+        :param read_only: If the connection will be used only for reading.
         :return: Database connection.
         """
-        return await self.connection_manager.open()
+        if read_only and self._replica_managers:
+            return await self._replica_policy.select(list(self._replica_managers.values())).open(read_only=True)
+
+        return await self.connection_manager.open(read_only=read_only)
+
+    def autocommit(self, connection: AsyncConnection) -> bool:
+        """Check if a connection runs in autocommit mode, so its statements don't need a transaction.
+
+        :param connection: Database connection.
+        :return: True if the connection runs in autocommit mode.
+        """
+        return self._manager(connection).autocommit(connection)
 
     async def close_connection(self, connection: AsyncConnection) -> None:
         """Close the connection to the database.
 
         :param connection: Database connection.
         """
-        return await self.connection_manager.close(connection)
+        return await self._manager(connection).close(connection)
 
     async def begin_transaction(self, connection: AsyncConnection) -> AsyncTransaction:
         """Begin a new transaction.
@@ -357,7 +499,7 @@ class SQLAlchemyModule(Module):
         :param connection: Database connection to use for the transaction.
         :return: Database transaction.
         """
-        return await self.connection_manager.begin(connection)
+        return await self._manager(connection).begin(connection)
 
     async def end_transaction(self, transaction: AsyncTransaction, *, rollback: bool = False) -> None:
         """End a transaction.
@@ -366,15 +508,21 @@ class SQLAlchemyModule(Module):
         :param rollback: If the transaction should be rolled back.
         :return: Database transaction.
         """
-        return await self.connection_manager.end(transaction, rollback=rollback)
+        return await self._manager(transaction.connection).end(transaction, rollback=rollback)
 
     async def on_startup(self):
-        """Initialize the SQLAlchemy engine and connection manager."""
+        """Initialize the SQLAlchemy engines and connection managers."""
         self._engine = create_async_engine(self.database, **self._engine_args)
         self._connection_manager = self._manager_cls(self._engine)
+        for replica in self.replicas:
+            engine = create_async_engine(replica, **self._engine_args)
+            self._replica_managers[engine] = self._manager_cls(engine)
 
     async def on_shutdown(self):
-        """Close the SQLAlchemy engine and connection manager."""
+        """Close the SQLAlchemy engines and connection managers."""
         await self.engine.dispose()
+        for engine in self._replica_managers:
+            await engine.dispose()
         self._engine = None
         self._connection_manager = None
+        self._replica_managers = {}
@@ -12,7 +12,35 @@ ValidatedQueryParams = t.NewType("ValidatedQueryParams", dict)
 ValidatedRequestData = t.NewType("ValidatedRequestData", dict)
 
 
+class ValidationSchemas:
+    def __init__(self) -> None:
+        """Validation schemas built once for each key and reused for any further validation.
+
+        Keys are combined with the current schema library, so schemas are never shared between libraries. Keys that
+        cannot be hashed are not cached, so their schemas are built every time.
+        """
+        self._schemas: dict[t.Any, Schema] = {}
+
+    def get(self, key: t.Any, fields: t.Callable[[], list[Field]]) -> Schema:
+        """Get the validation schema for a given key, building it if needed.
+
+        :param key: Key that identifies the fields of the schema.
+        :param fields: Function that generates the fields of the schema.
+        :return: Validation schema.
+        """
+        try:
+            key = (schemas.lib, key)
+            return self._schemas[key]
+        except KeyError:
+            schema = self._schemas[key] = Schema.build(name="ValidationSchema", fields=fields())
+            return schema
+        except TypeError:
+            return Schema.build(name="ValidationSchema", fields=fields())
+
+
 class RequestDataComponent(Component):
+    sequential = True  # Consumes the request stream
+
     def __init__(self):
         self.negotiator = ContentTypeNegotiator(
             [codecs.JSONDataCodec(), codecs.URLEncodedCodec(), codecs.MultiPartCodec()]
@@ -46,24 +74,30 @@ class WebSocketMessageDataComponent(Component):
 
 
 class ValidatePathParamsComponent(Component):
+    def __init__(self):
+        self.schemas = ValidationSchemas()
+
     async def resolve(
         self, request: http.Request, route: BaseRoute, path_params: types.PathParams
     ) -> ValidatedPathParams:
         fields = [f.field for f in route.parameters.path[request.method].values()]
 
         try:
-            validated = Schema.build(name="ValidationSchema", fields=fields).validate(path_params)
+            validated = self.schemas.get(tuple(fields), lambda: fields).validate(path_params)
             return ValidatedPathParams({k: v for k, v in path_params.items() if k in validated})
         except SchemaValidationError as exc:
             raise exceptions.ValidationError(detail=exc.errors)
 
 
 class ValidateQueryParamsComponent(Component):
+    def __init__(self):
+        self.schemas = ValidationSchemas()
+
     def resolve(self, request: http.Request, route: BaseRoute, query_params: types.QueryParams) -> ValidatedQueryParams:
         fields = [f.field for f in route.parameters.query[request.method].values()]
 
         try:
-            validated = Schema.build(name="ValidationSchema", fields=fields).validate(dict(query_params))
+            validated = self.schemas.get(tuple(fields), lambda: fields).validate(dict(query_params))
             return ValidatedQueryParams({k: v for k, v in query_params.items() if k in validated})
         except SchemaValidationError as exc:
             raise exceptions.ValidationError(detail=exc.errors)
@@ -84,6 +118,9 @@ class ValidateRequestDataComponent(Component):
 
 
 class PrimitiveParamComponent(Component):
+    def __init__(self):
+        self.schemas = ValidationSchemas()
+
     def can_handle_parameter(self, parameter: Parameter):
         return Field.is_http_valid_type(parameter.annotation)
 
@@ -91,7 +128,7 @@ class PrimitiveParamComponent(Component):
         params = path_params if (parameter.name in path_params) else query_params
 
         try:
-            params = Schema.build(name="ValidationSchema", fields=[Field.from_parameter(parameter)]).validate(params)
+            params = self.schemas.get(parameter, lambda: [Field.from_parameter(parameter)]).validate(params)
         except SchemaValidationError as exc:  # noqa: safety net, just should not happen
             raise exceptions.ValidationError(detail=exc.errors)
         return params.get(parameter.name, parameter.default)
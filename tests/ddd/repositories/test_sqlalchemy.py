@@ -1,5 +1,7 @@
+import datetime
+import importlib.util
 import uuid
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 import sqlalchemy
@@ -47,6 +49,26 @@ def tables(app):
             sqlalchemy.Column("id_second", sqlalchemy.Integer, primary_key=True),
             sqlalchemy.Column("name", sqlalchemy.String, nullable=False),
         ),
+        "defaults": sqlalchemy.Table(
+            "repository_table_defaults",
+            app.sqlalchemy.metadata,
+            sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True, autoincrement=True),
+            sqlalchemy.Column("name", sqlalchemy.String, nullable=False),
+            sqlalchemy.Column("owner", sqlalchemy.String, nullable=True),
+            sqlalchemy.Column("age", sqlalchemy.Integer, default=1),
+            sqlalchemy.Column("kind", sqlalchemy.String, server_default="puppy"),
+            sqlalchemy.Column("tag", sqlalchemy.String, default=lambda: "foo"),
+            sqlalchemy.Column("score", sqlalchemy.Integer, server_default="0"),
+            sqlalchemy.Column(
+                "code", sqlalchemy.String, default=lambda context: context.get_current_parameters()["name"].upper()
+            ),
+        ),
+        "events": sqlalchemy.Table(
+            "repository_table_events",
+            app.sqlalchemy.metadata,
+            sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True, autoincrement=True),
+            sqlalchemy.Column("created", sqlalchemy.DateTime, nullable=False),
+        ),
     }
 
 
@@ -117,6 +139,96 @@ class TestCaseSQLAlchemyTableManager:
         with exception:
             assert await table_manager.create(*data) == result
 
+    @pytest.mark.parametrize(
+        ["data", "kwargs", "result", "statements", "created", "exception"],
+        (
+            pytest.param(
+                [{"name": "foo"}, {"name": "bar"}, {"name": "foobar"}],
+                {},
+                [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}, {"id": 3, "name": "foobar"}],
+                1,
+                3,
+                None,
+                id="single_chunk",
+            ),
+            pytest.param(
+                ({"name": x} for x in ("foo", "bar", "foobar")),
+                {"chunk_size": 2},
+                [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}, {"id": 3, "name": "foobar"}],
+                2,
+                3,
+                None,
+                id="multiple_chunks",
+            ),
+            pytest.param(
+                [{"name": "foo"}, {"name": "bar"}, {"name": "foobar"}],
+                {"chunk_size": 2, "returning": False},
+                None,
+                2,
+                3,
+                None,
+                id="no_returning",
+            ),
+            pytest.param(
+                [{"name": "foo"}, {"name": "bar"}, {"name": "foobar"}],
+                {"returning": False, "copy": True},
+                None,
+                1,
+                3,
+                None,
+                id="copy_not_supported",
+            ),
+            pytest.param([], {}, [], 0, 0, None, id="empty"),
+            pytest.param(
+                [{"name": "foo"}, {"name": None}],
+                {"chunk_size": 1},
+                None,
+                2,
+                1,
+                exceptions.IntegrityError,
+                id="integrity_error",
+            ),
+            pytest.param(
+                [{"name": "foo"}],
+                {"chunk_size": 0},
+                None,
+                0,
+                0,
+                ValueError("Chunk size must be a positive integer"),
+                id="wrong_chunk_size",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    async def test_bulk_create(self, table_manager, data, kwargs, result, statements, created, exception):
+        with patch.object(
+            AsyncConnection, "execute", autospec=True, side_effect=AsyncConnection.execute
+        ) as execute_mock, exception:
+            assert await table_manager.bulk_create(data, **kwargs) == result
+
+        assert execute_mock.call_count == statements
+        assert [x["name"] async for x in table_manager.list()] == ["foo", "bar", "foobar"][:created]
+
+    @pytest.mark.skipif(importlib.util.find_spec("asyncpg") is None, reason="asyncpg not installed")
+    async def test_bulk_create_copy(self, table):
+        raw_connection = Mock()
+        raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+        connection = Mock(spec=AsyncConnection)
+        connection.dialect.driver = "asyncpg"
+        connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+        table_manager = SQLAlchemyTableManager(table, connection)
+
+        result = await table_manager.bulk_create(
+            [{"name": "foo"}, {"name": "bar"}, {"name": "foobar"}], chunk_size=2, returning=False, copy=True
+        )
+
+        assert result is None
+        assert connection.execute.call_args_list == []
+        assert raw_connection.driver_connection.copy_records_to_table.await_args_list == [
+            call(table.name, records=[("foo",), ("bar",)], columns=["name"], schema_name=None),
+            call(table.name, records=[("foobar",)], columns=["name"], schema_name=None),
+        ]
+
     @pytest.mark.parametrize(
         ["clauses", "filters", "result", "exception"],
         (
@@ -194,6 +306,82 @@ class TestCaseSQLAlchemyTableManager:
         with exception:
             assert await table_manager.update(data, *[c(table.c["name"]) for c in clauses], **filters) == result
 
+    @pytest.mark.parametrize(
+        ["clauses", "filters", "data", "result", "exception"],
+        (
+            pytest.param(
+                [],
+                {"id": 1},
+                {"name": "bar"},
+                {
+                    "id": 1,
+                    "name": "bar",
+                    "owner": None,
+                    "age": 1,
+                    "kind": "puppy",
+                    "tag": "foo",
+                    "score": 0,
+                    "code": "FOO",
+                },
+                None,
+                id="ok",
+            ),
+            pytest.param(
+                [],
+                {"id": 1},
+                {"name": "bar", "owner": "foobar", "age": 3, "kind": "cat", "tag": "bar", "score": 2, "code": "BAR"},
+                {
+                    "id": 1,
+                    "name": "bar",
+                    "owner": "foobar",
+                    "age": 3,
+                    "kind": "cat",
+                    "tag": "bar",
+                    "score": 2,
+                    "code": "BAR",
+                },
+                None,
+                id="all_columns",
+            ),
+            pytest.param(
+                [],
+                {"id": 0},
+                {"name": "bar"},
+                None,
+                exceptions.NotFoundError(resource="repository_table_defaults"),
+                id="not_found",
+            ),
+            pytest.param(
+                [],
+                {"id": 1},
+                {"name": None},
+                None,
+                exceptions.IntegrityError,
+                id="integrity_error",
+            ),
+            pytest.param(
+                [lambda x: x.ilike("fo%")],
+                {},
+                {"name": "bar"},
+                None,
+                exceptions.MultipleRecordsError,
+                id="multiple_results",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    async def test_replace(self, client, tables, connection, clauses, filters, data, result, exception):
+        table = tables["defaults"]
+        async with SQLAlchemyContext(client.app, [table]):
+            table_manager = SQLAlchemyTableManager(table, connection)
+            await table_manager.create(
+                {"name": "foo", "owner": "foobar", "age": 2, "kind": "cat", "tag": "bar", "score": 1}
+            )
+            await table_manager.create({"name": "foo"})
+
+            with exception:
+                assert await table_manager.replace(data, *[c(table.c["name"]) for c in clauses], **filters) == result
+
     @pytest.mark.parametrize(
         ["clauses", "filters", "exception"],
         (
@@ -224,6 +412,17 @@ class TestCaseSQLAlchemyTableManager:
         with exception:
             await table_manager.delete(*[c(table.c["name"]) for c in clauses], **filters)
 
+    async def test_delete_single_statement(self, table_manager):
+        await table_manager.create({"name": "foo"}, {"name": "bar"})
+
+        with patch.object(
+            AsyncConnection, "execute", autospec=True, side_effect=AsyncConnection.execute
+        ) as execute_mock:
+            await table_manager.delete(id=1)
+
+        assert execute_mock.call_count == 1
+        assert [x async for x in table_manager.list()] == [{"id": 2, "name": "bar"}]
+
     @pytest.mark.parametrize(
         ["clauses", "order_by", "order_direction", "filters", "result"],
         (
@@ -231,6 +430,20 @@ class TestCaseSQLAlchemyTableManager:
             pytest.param([lambda x: x.ilike("fo%")], None, None, {}, [{"id": 1, "name": "foo"}], id="clauses"),
             pytest.param([], "name", "asc", {}, [{"id": 2, "name": "bar"}, {"id": 1, "name": "foo"}], id="order"),
             pytest.param([], None, None, {"name": "foo"}, [{"id": 1, "name": "foo"}], id="filters"),
+            pytest.param([], None, None, {"limit": 1}, [{"id": 1, "name": "foo"}], id="limit"),
+            pytest.param([], None, None, {"limit": 1, "offset": 1}, [{"id": 2, "name": "bar"}], id="offset"),
+            pytest.param(
+                [], "name", "desc", {"limit": 1, "offset": 1}, [{"id": 2, "name": "bar"}], id="order_and_slice"
+            ),
+            pytest.param([], None, None, {"keyset": (1,)}, [{"id": 2, "name": "bar"}], id="keyset"),
+            pytest.param([], None, "desc", {"keyset": (2,)}, [{"id": 1, "name": "foo"}], id="keyset_desc"),
+            pytest.param([], "name", "asc", {"keyset": ("bar", 2)}, [{"id": 1, "name": "foo"}], id="keyset_order_by"),
+            pytest.param(
+                [], "name", "asc", {"keyset": ("bar", 2), "limit": 1}, [{"id": 1, "name": "foo"}], id="keyset_limit"
+            ),
+            pytest.param(
+                [], None, None, {"yield_per": 1}, [{"id": 1, "name": "foo"}, {"id": 2, "name": "bar"}], id="yield_per"
+            ),
         ),
     )
     async def test_list(self, clauses, order_by, order_direction, filters, result, table, table_manager):
@@ -245,6 +458,81 @@ class TestCaseSQLAlchemyTableManager:
 
         assert r == result
 
+    @pytest.mark.parametrize(
+        ["keyset", "result", "exception"],
+        (
+            pytest.param(
+                (datetime.datetime(2018, 1, 2), 2),
+                [{"id": 3, "created": datetime.datetime(2018, 1, 3)}],
+                None,
+                id="ok",
+            ),
+            pytest.param(
+                ("2018-01-01T00:00:00", 1),
+                [
+                    {"id": 2, "created": datetime.datetime(2018, 1, 2)},
+                    {"id": 3, "created": datetime.datetime(2018, 1, 3)},
+                ],
+                None,
+                id="encoded_values",
+            ),
+            pytest.param(
+                (1,),
+                None,
+                exceptions.KeysetError("Keyset must contain 2 values, the order column followed by the primary key"),
+                id="wrong_keyset",
+            ),
+            pytest.param(
+                "foo",
+                None,
+                exceptions.KeysetError("Keyset must contain 2 values, the order column followed by the primary key"),
+                id="wrong_keyset_type",
+            ),
+            pytest.param(
+                ("foo", 1),
+                None,
+                (exceptions.KeysetError, "Malformed keyset"),
+                id="wrong_value",
+            ),
+            pytest.param(
+                ("2018-01-01T00:00:00", 1.5),
+                None,
+                exceptions.KeysetError("Malformed keyset (Wrong value for column 'id')"),
+                id="wrong_value_type",
+            ),
+            pytest.param(
+                ("2018-01-01T00:00:00", True),
+                None,
+                exceptions.KeysetError("Malformed keyset (Wrong value for column 'id')"),
+                id="wrong_value_bool",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    async def test_list_keyset(self, client, tables, connection, keyset, result, exception):
+        table = tables["events"]
+        async with SQLAlchemyContext(client.app, [table]):
+            table_manager = SQLAlchemyTableManager(table, connection)
+            await table_manager.create(*[{"created": datetime.datetime(2018, 1, i)} for i in (1, 2, 3)])
+
+            with exception:
+                assert [x async for x in table_manager.list(order_by="created", keyset=keyset)] == result
+
+    @pytest.mark.parametrize(
+        ["clauses", "filters", "result"],
+        (
+            pytest.param([], {}, 2, id="all"),
+            pytest.param([lambda x: x.ilike("fo%")], {}, 1, id="clauses"),
+            pytest.param([], {"name": "foo"}, 1, id="filters"),
+        ),
+    )
+    async def test_count(self, clauses, filters, result, table, table_manager):
+        await table_manager.create({"name": "foo"}, {"name": "bar"})
+
+        r = await table_manager.count(*[c(table.c["name"]) for c in clauses], **filters)
+
+        assert r == result
+
     @pytest.mark.parametrize(
         ["clauses", "filters", "result"],
         (
@@ -309,6 +597,13 @@ class TestCaseSQLAlchemyTableRepository:
 
         assert table_manager.create.call_args_list == [call(data)]
 
+    async def test_bulk_create(self, repository, table_manager):
+        data = [{"foo": "bar"}]
+
+        await repository.bulk_create(data, chunk_size=10, returning=False, copy=True)
+
+        assert table_manager.bulk_create.call_args_list == [call(data, chunk_size=10, returning=False, copy=True)]
+
     async def test_retrieve(self, repository, table_manager):
         id = uuid.uuid4()
 
@@ -324,6 +619,13 @@ class TestCaseSQLAlchemyTableRepository:
 
         assert table_manager.update.call_args_list == [call(id, data)]
 
+    async def test_replace(self, repository, table_manager):
+        data = {"foo": "bar"}
+
+        await repository.replace(data, id=1)
+
+        assert table_manager.replace.call_args_list == [call(data, id=1)]
+
     async def test_delete(self, repository, table_manager):
         id = uuid.uuid4()
 
@@ -337,12 +639,31 @@ class TestCaseSQLAlchemyTableRepository:
         order_direction = "desc"
         filters = {"foo": "bar"}
 
-        repository.list(*clauses, order_by=order_by, order_direction=order_direction, **filters)
+        repository.list(
+            *clauses, order_by=order_by, order_direction=order_direction, limit=1, offset=2, yield_per=3, **filters
+        )
 
         assert table_manager.list.call_args_list == [
-            call(*clauses, order_by=order_by, order_direction=order_direction, **filters)
+            call(
+                *clauses,
+                order_by=order_by,
+                order_direction=order_direction,
+                limit=1,
+                offset=2,
+                keyset=None,
+                yield_per=3,
+                **filters,
+            )
         ]
 
+    async def test_count(self, repository, table_manager):
+        clauses = [Mock(), Mock()]
+        filters = {"foo": "bar"}
+
+        await repository.count(*clauses, **filters)
+
+        assert table_manager.count.call_args_list == [call(*clauses, **filters)]
+
     async def test_drop(self, repository, table_manager):
         await repository.drop()
 
@@ -43,6 +43,7 @@ class TestCaseWorkerComponent:
 
     def test_init(self, component, worker):
         assert component.worker == worker
+        assert component.read_only_methods == frozenset()
 
     @pytest.fixture(scope="function")
     def parameter_types(self, worker):
@@ -63,20 +64,35 @@ class TestCaseWorkerComponent:
     def test_can_handle_parameter(self, component, param_name, param_type, parameter_types, expected):
         assert component.can_handle_parameter(Parameter(param_name, parameter_types[param_type])) == expected
 
-    def test_resolve(self, component, worker):
+    @pytest.mark.parametrize(
+        ["read_only_methods", "method", "read_only"],
+        (
+            pytest.param((), "GET", None, id="default"),
+            pytest.param(("get", "head"), "GET", True, id="read_only_method"),
+            pytest.param(("get", "head"), "POST", None, id="other_method"),
+            pytest.param(("get", "head"), None, None, id="no_method"),
+        ),
+    )
+    def test_resolve(self, worker, read_only_methods, method, read_only):
         class App:
             ...
 
         foo = App()
         bar = App()
 
-        scopes = types.Scope({"app": foo, "root_app": bar})
+        component = WorkerComponent(worker, read_only_methods=read_only_methods)
+        scopes = types.Scope({"app": foo, "root_app": bar, **({"method": method} if method else {})})
 
         assert hasattr(component.worker, "_app")
         assert not component.worker._app
 
         resolved = component.resolve(scopes)
 
-        assert resolved == worker
+        assert resolved is not worker
+        assert isinstance(resolved, worker.__class__)
+        assert resolved._app == scopes["root_app"]
+        assert resolved.read_only is read_only
+        assert component.worker.read_only is None
         assert hasattr(component.worker, "_app")
         assert component.worker._app == scopes["root_app"]
+        assert component.resolve(scopes) is not resolved
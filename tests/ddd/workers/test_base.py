@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
@@ -17,7 +18,7 @@ def repository():
 
 class TestCaseAbstractWorker:
     @pytest.fixture(scope="function")
-    def worker(self):
+    def worker_cls(self):
         class FooWorker(AbstractWorker):
             async def begin(self):
                 ...
@@ -31,7 +32,35 @@ class TestCaseAbstractWorker:
             async def rollback(self):
                 ...
 
-        return FooWorker()
+        return FooWorker
+
+    @pytest.fixture(scope="function")
+    def worker(self, worker_cls):
+        return worker_cls()
+
+    @pytest.mark.parametrize(
+        ["lock"],
+        (
+            pytest.param(False, id="no_lock"),
+            pytest.param(True, id="lock"),
+        ),
+    )
+    def test_init(self, app, worker_cls, lock):
+        worker = worker_cls(app, lock=lock)
+
+        assert worker._app == app
+        assert isinstance(worker._lock, asyncio.Lock) if lock else worker._lock is None
+        assert worker.read_only is None
+
+    def test_clone(self, app, worker_cls):
+        worker = worker_cls(app, lock=True)
+
+        clone = worker.clone()
+
+        assert clone is not worker
+        assert isinstance(clone, worker_cls)
+        assert clone._app == app
+        assert clone._lock is worker._lock
 
     def test_app(self, app, worker):
         with pytest.raises(ApplicationError, match="Worker not initialized"):
@@ -57,6 +86,29 @@ class TestCaseAbstractWorker:
             assert worker.begin.await_args_list == [call()]
             assert worker.end.await_args_list == [call(rollback=False)]
 
+    @pytest.mark.parametrize(
+        ["lock", "overlap"],
+        (
+            pytest.param(False, True, id="concurrent"),
+            pytest.param(True, False, id="lock"),
+        ),
+    )
+    async def test_async_context_concurrent(self, app, worker_cls, lock, overlap):
+        worker = worker_cls(app, lock=lock)
+        running = []
+        overlaps = []
+
+        async def unit_of_work():
+            async with worker.clone():
+                running.append(True)
+                await asyncio.sleep(0.01)
+                overlaps.append(len(running) > 1)
+                running.pop()
+
+        await asyncio.gather(unit_of_work(), unit_of_work())
+
+        assert any(overlaps) == overlap
+
 
 class TestCaseBaseWorker:
     @pytest.fixture(scope="function")
@@ -90,3 +142,11 @@ class TestCaseBaseWorker:
     def test_new(self, worker, repository):
         assert hasattr(worker, "_repositories")
         assert worker._repositories == {"foo": repository}
+
+    def test_clone(self, worker, repository):
+        worker.foo = repository()
+
+        clone = worker.clone()
+
+        assert hasattr(worker, "foo")
+        assert not hasattr(clone, "foo")
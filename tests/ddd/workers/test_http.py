@@ -21,6 +21,15 @@ class TestCaseHTTPWorker:
         assert worker._url == "foo"
         assert not hasattr(worker, "client")
 
+    def test_clone(self, worker):
+        worker.client = MagicMock()
+
+        clone = worker.clone()
+
+        assert clone._url == worker._url
+        assert not hasattr(clone, "client")
+        assert hasattr(worker, "client")
+
     def test_client(self, worker):
         with pytest.raises(AttributeError, match="Client not initialized"):
             worker.client
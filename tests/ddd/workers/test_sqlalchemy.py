@@ -1,10 +1,12 @@
-from unittest.mock import AsyncMock, MagicMock, call, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, call, patch
 
 import pytest
+import sqlalchemy
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from flama.ddd.repositories.sqlalchemy import SQLAlchemyRepository
-from flama.ddd.workers.sqlalchemy import SQLAlchemyWorker
+from flama.ddd.workers.sqlalchemy import LazyConnection, SQLAlchemyWorker, UnitsOfWork
 
 
 class TestCaseSQLAlchemyWorker:
@@ -20,6 +22,19 @@ class TestCaseSQLAlchemyWorker:
 
         assert worker._app == app
         assert not hasattr(worker, "_connection")
+        assert worker.units_of_work == UnitsOfWork()
+
+    def test_clone(self, worker):
+        worker._connection = AsyncMock()
+        worker._transaction = AsyncMock()
+
+        clone = worker.clone()
+
+        assert clone._app == worker._app
+        assert not hasattr(clone, "_connection")
+        assert not hasattr(clone, "_transaction")
+        assert hasattr(worker, "_connection")
+        assert hasattr(worker, "_transaction")
 
     def test_connection(self, worker):
         with pytest.raises(AttributeError, match="Connection not initialized"):
@@ -30,19 +45,84 @@ class TestCaseSQLAlchemyWorker:
             worker.transaction
 
     async def test_set_up(self, app, worker):
+        with patch.multiple(app.sqlalchemy, open_connection=AsyncMock(), begin_transaction=AsyncMock()):
+            await worker.set_up()
+
+            assert isinstance(worker.connection, LazyConnection)
+            assert not hasattr(worker, "_connection")
+            assert not hasattr(worker, "_transaction")
+            assert worker.units_of_work == UnitsOfWork(total=1, untouched=0)
+            assert app.sqlalchemy.open_connection.await_args_list == []
+            assert app.sqlalchemy.begin_transaction.await_args_list == []
+
+    @pytest.mark.parametrize(
+        ["read_only", "autocommit", "stream", "transaction"],
+        (
+            pytest.param(False, False, False, True, id="read_write"),
+            pytest.param(True, False, False, True, id="read_only"),
+            pytest.param(True, True, False, False, id="read_only_autocommit"),
+            pytest.param(True, True, True, True, id="read_only_autocommit_stream"),
+        ),
+    )
+    async def test_acquire(self, app, worker, read_only, autocommit, stream, transaction):
+        connection_mock = AsyncMock()
+        transaction_mock = AsyncMock()
+        worker.read_only = read_only
+
+        with patch.multiple(
+            app.sqlalchemy,
+            open_connection=AsyncMock(return_value=connection_mock),
+            begin_transaction=AsyncMock(return_value=transaction_mock),
+            autocommit=Mock(return_value=autocommit),
+        ):
+            await worker.set_up()
+
+            assert await asyncio.gather(worker.acquire(stream=stream), worker.acquire()) == [
+                connection_mock,
+                connection_mock,
+            ]
+
+            assert worker.connection == connection_mock
+            assert app.sqlalchemy.open_connection.await_args_list == [call(read_only=read_only)]
+            assert ("_transaction" in worker.__dict__) is transaction
+            assert app.sqlalchemy.begin_transaction.await_args_list == ([call(connection_mock)] if transaction else [])
+
+    async def test_acquire_begin_error(self, app, worker):
+        connection_mock = AsyncMock()
+
+        with patch.multiple(
+            app.sqlalchemy,
+            open_connection=AsyncMock(return_value=connection_mock),
+            begin_transaction=AsyncMock(side_effect=ValueError("Foo")),
+            close_connection=AsyncMock(),
+        ):
+            await worker.set_up()
+
+            with pytest.raises(ValueError, match="Foo"):
+                await worker.acquire()
+
+            assert "_connection" not in worker.__dict__
+            assert "_transaction" not in worker.__dict__
+            assert app.sqlalchemy.close_connection.await_args_list == [call(connection_mock)]
+
+    async def test_acquire_stream_after_autocommit(self, app, worker):
         connection_mock = AsyncMock()
         transaction_mock = AsyncMock()
+        worker.read_only = True
 
         with patch.multiple(
             app.sqlalchemy,
             open_connection=AsyncMock(return_value=connection_mock),
             begin_transaction=AsyncMock(return_value=transaction_mock),
+            autocommit=Mock(return_value=True),
         ):
             await worker.set_up()
 
-            assert worker._connection == connection_mock
-            assert worker._transaction == transaction_mock
-            assert app.sqlalchemy.open_connection.await_args_list == [call()]
+            await worker.acquire()
+            assert "_transaction" not in worker.__dict__
+
+            await worker.acquire(stream=True)
+            assert worker.transaction == transaction_mock
             assert app.sqlalchemy.begin_transaction.await_args_list == [call(connection_mock)]
 
     @pytest.mark.parametrize(
@@ -53,6 +133,7 @@ class TestCaseSQLAlchemyWorker:
         ),
     )
     async def test_tear_down(self, app, worker, rollback):
+        await worker.set_up()
         worker._connection = connection_mock = AsyncMock()
         worker._transaction = transaction_mock = AsyncMock()
 
@@ -61,9 +142,49 @@ class TestCaseSQLAlchemyWorker:
 
             assert not hasattr(worker, "_transaction")
             assert not hasattr(worker, "_connection")
+            assert not hasattr(worker, "_lazy_connection")
+            assert worker.units_of_work == UnitsOfWork(total=1, untouched=0)
             assert app.sqlalchemy.end_transaction.await_args_list == [call(transaction_mock, rollback=rollback)]
             assert app.sqlalchemy.close_connection.await_args_list == [call(connection_mock)]
 
+    async def test_read_only(self, worker):
+        worker.read_only = True
+
+        async with worker:
+            assert (await worker.connection.execute(sqlalchemy.select(sqlalchemy.literal(1)))).all() == [(1,)]
+            assert not hasattr(worker, "_transaction")
+
+            result = await worker.bar._connection.stream(sqlalchemy.select(sqlalchemy.literal(2)))
+            rows = [row async for row in result]
+
+            assert worker.connection.in_transaction()
+            assert hasattr(worker, "_transaction")
+
+        assert rows == [(2,)]
+
+    async def test_tear_down_without_transaction(self, app, worker):
+        await worker.set_up()
+        worker._connection = connection_mock = AsyncMock()
+
+        with patch.multiple(app.sqlalchemy, end_transaction=AsyncMock(), close_connection=AsyncMock()):
+            await worker.tear_down()
+
+            assert not hasattr(worker, "_connection")
+            assert app.sqlalchemy.end_transaction.await_args_list == []
+            assert app.sqlalchemy.close_connection.await_args_list == [call(connection_mock)]
+
+    async def test_tear_down_untouched(self, app, worker):
+        clone = worker.clone()
+        await clone.set_up()
+
+        with patch.multiple(app.sqlalchemy, end_transaction=AsyncMock(), close_connection=AsyncMock()):
+            await clone.tear_down()
+
+            assert not hasattr(clone, "_lazy_connection")
+            assert worker.units_of_work == UnitsOfWork(total=1, untouched=1)
+            assert app.sqlalchemy.end_transaction.await_args_list == []
+            assert app.sqlalchemy.close_connection.await_args_list == []
+
     async def test_begin(self, worker):
         worker._connection = AsyncMock()
 
@@ -103,6 +224,15 @@ class TestCaseSQLAlchemyWorker:
             await worker.commit()
             assert commit_mock.await_args_list == [call()]
 
+    async def test_commit_untouched(self, worker):
+        await worker.set_up()
+
+        with patch.object(worker, "acquire") as acquire_mock:
+            await worker.commit()
+            await worker.rollback()
+
+        assert acquire_mock.await_args_list == []
+
     async def test_rollback(self, worker):
         rollback_mock = AsyncMock()
         connection_mock = AsyncMock(spec=AsyncConnection)
@@ -111,3 +241,55 @@ class TestCaseSQLAlchemyWorker:
         with patch.object(worker, "_connection", new=connection_mock, create=True):
             await worker.rollback()
             assert rollback_mock.await_args_list == [call()]
+
+
+class TestCaseLazyConnection:
+    @pytest.fixture(scope="function")
+    def worker(self, client):
+        return SQLAlchemyWorker(client.app)
+
+    async def test_execute(self, worker):
+        await worker.set_up()
+        connection = worker.connection
+
+        try:
+            assert isinstance(connection, LazyConnection)
+            assert (await connection.execute(sqlalchemy.text("SELECT 1"))).scalar_one() == 1
+            assert (await connection.scalar(sqlalchemy.text("SELECT 2"))) == 2
+            assert isinstance(worker.connection, AsyncConnection)
+        finally:
+            await worker.tear_down()
+
+    async def test_deferred(self, worker):
+        await worker.set_up()
+        connection = worker.connection
+
+        try:
+            assert isinstance(connection, LazyConnection)
+            assert await connection.get_isolation_level() == await worker.connection.get_isolation_level()
+            assert "_connection" in worker.__dict__
+        finally:
+            await worker.tear_down()
+
+    async def test_opened_connection_attributes(self, worker):
+        await worker.set_up()
+        connection = worker.connection
+
+        try:
+            with pytest.raises(AttributeError, match="'begin_nested' needs an opened connection"):
+                connection.begin_nested
+
+            assert await worker.acquire() is worker.connection
+            assert connection.in_transaction()
+            assert connection.info is worker.connection.info
+            async with connection.begin_nested():
+                assert connection.in_nested_transaction()
+        finally:
+            await worker.tear_down()
+
+    def test_dialect(self, worker):
+        assert LazyConnection(worker).dialect is worker.app.sqlalchemy.engine.dialect
+
+    def test_unknown_attribute(self, worker):
+        with pytest.raises(AttributeError, match="'LazyConnection' object has no attribute 'foo'"):
+            LazyConnection(worker).foo
@@ -4,9 +4,10 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from flama.injection.components import Component, Components
+from flama.injection.components import Component, Components, Lifetime
 from flama.injection.exceptions import ComponentError, ComponentNotFound
 from flama.injection.injector import Injector
+from flama.injection.plan import InjectionPlan, InjectionStats
 from flama.injection.resolver import EMPTY, Parameter, ResolutionTree, Resolver
 
 Foo = t.NewType("Foo", str)
@@ -112,6 +113,71 @@ class TestCaseInjector:
         assert resolver_mock.resolve.call_args_list == [call(Parameter("foo", Foo, EMPTY))]
         assert resolution == {"foo": resolution_mock}
 
+    def test_compile_function(self):
+        class Handler:
+            def method(self, foo: Foo):
+                ...
+
+        injector = Injector(components=Components([LiteralComponent()]))
+
+        with patch.object(injector, "resolve_function", wraps=injector.resolve_function) as resolve_function_mock:
+            plan = injector.compile_function(function)
+            assert isinstance(plan, InjectionPlan)
+            assert injector.compile_function(function) is plan
+
+            # Bound methods share the plan with its function
+            method_plan = injector.compile_function(Handler.method)
+            assert injector.compile_function(Handler().method) is method_plan
+
+            # Plans are discarded when components change
+            injector.components = Components([LiteralComponent()])
+            assert injector.compile_function(function) is not plan
+
+        assert resolve_function_mock.call_args_list == [call(function), call(Handler.method), call(function)]
+
+    async def test_inject_stats(self):
+        def function_nested(foo: Foo, bar: Bar):
+            return foo, bar
+
+        calls = []
+
+        class CountedChildNestedComponent(Component):
+            def resolve(self) -> Bar:
+                calls.append(True)
+                return Bar("bar")
+
+        injector = Injector(components=Components([NestedComponent(), CountedChildNestedComponent()]))
+
+        assert (await injector.inject(function_nested))() == (Foo("bar"), Bar("bar"))
+        assert (await injector.inject(function_nested))() == (Foo("bar"), Bar("bar"))
+
+        assert len(calls) == 2
+        assert injector.stats.hits == 2
+        assert injector.stats.misses == 4
+
+    async def test_inject_app_lifetime(self):
+        calls = []
+
+        class AppLiteralComponent(Component):
+            lifetime = Lifetime.app
+
+            def resolve(self) -> Foo:
+                calls.append(True)
+                return Foo("foo")
+
+        injector = Injector(components=Components([AppLiteralComponent()]))
+
+        assert (await injector.inject(function))() == Foo("foo")
+        assert (await injector.inject(function))() == Foo("foo")
+        assert (await injector.inject(function))() == Foo("foo")
+        assert len(calls) == 1
+        assert injector.stats == InjectionStats(hits=2, misses=1)
+
+        injector.release()
+
+        assert (await injector.inject(function))() == Foo("foo")
+        assert len(calls) == 2
+
     @pytest.mark.parametrize(
         ["context", "context_types", "components", "result", "exception"],
         (
@@ -0,0 +1,216 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from flama.injection.components import Component, Components, Lifetime
+from flama.injection.injector import Injector
+from flama.injection.plan import ConstantSource, ContextSource, InjectionPlan, InjectionStats, Step, StepSource
+from flama.injection.resolver import Parameter
+
+Foo = t.NewType("Foo", str)
+Bar = t.NewType("Bar", str)
+Baz = t.NewType("Baz", str)
+Ping = t.NewType("Ping", str)
+Pong = t.NewType("Pong", str)
+CustomStr = t.NewType("CustomStr", str)
+
+
+class BarComponent(Component):
+    def resolve(self, x: CustomStr) -> Bar:
+        return Bar(f"bar_{x}")
+
+
+class BazComponent(Component):
+    async def resolve(self, parameter: Parameter) -> Baz:
+        return Baz(f"baz_{parameter.name}")
+
+
+class FooComponent(Component):
+    def resolve(self, bar: Bar, baz: Baz) -> Foo:
+        return Foo(f"{bar}_{baz}")
+
+
+class PingComponent(Component):
+    async def resolve(self, events: dict) -> Ping:
+        events["ping"].set()
+        await events["pong"].wait()
+        return Ping("ping")
+
+
+class PongComponent(Component):
+    async def resolve(self, events: dict) -> Pong:
+        await events["ping"].wait()
+        events["pong"].set()
+        return Pong("pong")
+
+
+class SequentialPongComponent(PongComponent):
+    sequential = True
+
+
+class FailingPongComponent(PongComponent):
+    async def resolve(self, events: dict) -> Pong:
+        raise ValueError("Wrong pong")
+
+
+bar_component = BarComponent()
+baz_component = BazComponent()
+foo_component = FooComponent()
+
+
+def function(foo: Foo, bar: Bar, x: CustomStr):
+    return foo, bar, x
+
+
+class TestCaseInjectionPlan:
+    @pytest.fixture(scope="function")
+    def injector(self):
+        return Injector({"x": CustomStr}, Components([foo_component, bar_component, baz_component]))
+
+    @pytest.fixture(scope="function")
+    def plan(self, injector):
+        return InjectionPlan(injector.resolve_function(function))
+
+    def test_init(self, plan):
+        assert plan.steps == [
+            Step(bar_component, (("x", ContextSource("x")),)),
+            Step(baz_component, (("parameter", ConstantSource(Parameter("baz", Baz))),)),
+            Step(foo_component, (("bar", StepSource(0)), ("baz", StepSource(1)))),
+        ]
+        assert plan.arguments == {"foo": StepSource(2), "bar": StepSource(0), "x": ContextSource("x")}
+        assert plan.hits == 1
+        assert plan.stages == [([0, 1], []), ([2], [])]
+
+    @pytest.mark.parametrize(
+        ["attributes"],
+        (
+            pytest.param({"lifetime": Lifetime.transient}, id="transient"),
+            pytest.param({"memoize": False}, id="not_memoized"),
+        ),
+    )
+    def test_init_transient(self, injector, attributes):
+        NotMemoizedBarComponent = type("NotMemoizedBarComponent", (BarComponent,), attributes)
+
+        not_memoized_bar_component = NotMemoizedBarComponent()
+        injector.components = Components([foo_component, not_memoized_bar_component, baz_component])
+
+        plan = InjectionPlan(injector.resolve_function(function))
+
+        assert plan.steps == [
+            Step(not_memoized_bar_component, (("x", ContextSource("x")),)),
+            Step(baz_component, (("parameter", ConstantSource(Parameter("baz", Baz))),)),
+            Step(foo_component, (("bar", StepSource(0)), ("baz", StepSource(1)))),
+            Step(not_memoized_bar_component, (("x", ContextSource("x")),)),
+        ]
+        assert plan.arguments == {"foo": StepSource(2), "bar": StepSource(3), "x": ContextSource("x")}
+        assert plan.hits == 0
+
+    def test_init_app(self, injector):
+        class AppBarComponent(BarComponent):
+            lifetime = Lifetime.app
+
+        app_bar_component = AppBarComponent()
+        injector.components = Components([foo_component, app_bar_component, baz_component])
+
+        plan = InjectionPlan(injector.resolve_function(function))
+
+        key = (id(app_bar_component), app_bar_component.identity(Parameter("bar", Bar)))
+        assert plan.steps == [
+            Step(app_bar_component, (("x", ContextSource("x")),), key),
+            Step(baz_component, (("parameter", ConstantSource(Parameter("baz", Baz))),)),
+            Step(foo_component, (("bar", StepSource(0)), ("baz", StepSource(1)))),
+        ]
+        assert plan.arguments == {"foo": StepSource(2), "bar": StepSource(0), "x": ContextSource("x")}
+        assert plan.hits == 1
+
+    async def test_values_cache(self, injector):
+        class AppBarComponent(BarComponent):
+            lifetime = Lifetime.app
+
+        injector.components = Components([foo_component, AppBarComponent(), baz_component])
+        plan = InjectionPlan(injector.resolve_function(function))
+        cache: dict = {}
+
+        assert await plan.values({"x": "foo"}, cache=cache) == {"foo": "bar_foo_baz_baz", "bar": "bar_foo", "x": "foo"}
+        assert list(cache.values()) == ["bar_foo"]
+        assert await plan.values({"x": "bar"}, cache=cache) == {"foo": "bar_foo_baz_baz", "bar": "bar_foo", "x": "bar"}
+        assert await plan.values({"x": "bar"}) == {"foo": "bar_bar_baz_baz", "bar": "bar_bar", "x": "bar"}
+
+    @pytest.mark.parametrize("concurrent", (pytest.param(False, id="sequential"), pytest.param(True, id="concurrent")))
+    async def test_values_cache_pruned(self, injector, concurrent):
+        calls = []
+
+        class AppFooComponent(FooComponent):
+            lifetime = Lifetime.app
+
+        class CountedBazComponent(BazComponent):
+            async def resolve(self, parameter: Parameter) -> Baz:
+                calls.append(parameter.name)
+                return Baz(f"baz_{parameter.name}")
+
+        injector.components = Components([AppFooComponent(), bar_component, CountedBazComponent()])
+        plan = InjectionPlan(injector.resolve_function(function))
+        cache: dict = {}
+
+        assert plan.stages == [([0, 1], []), ([2], [])]
+        for x in ("foo", "bar"):
+            assert await plan.values({"x": x}, concurrent=concurrent, cache=cache) == {
+                "foo": "bar_foo_baz_baz",
+                "bar": f"bar_{x}",
+                "x": x,
+            }
+        assert calls == ["baz"]
+        assert plan._pruned == {(True,): ([0, 2], [([0], []), ([2], [])])}
+
+    async def test_values_stats(self, injector):
+        class AppBarComponent(BarComponent):
+            lifetime = Lifetime.app
+
+        injector.components = Components([foo_component, AppBarComponent(), baz_component])
+        plan = InjectionPlan(injector.resolve_function(function))
+        cache: dict = {}
+        stats = InjectionStats()
+
+        await plan.values({"x": "foo"}, cache=cache, stats=stats)
+        assert stats == InjectionStats(hits=1, misses=3)
+
+        await plan.values({"x": "foo"}, cache=cache, stats=stats)
+        assert stats == InjectionStats(hits=3, misses=5)
+
+    @pytest.mark.parametrize("concurrent", (pytest.param(False, id="sequential"), pytest.param(True, id="concurrent")))
+    async def test_values(self, plan, concurrent):
+        assert await plan.values({"x": "foo"}, concurrent=concurrent) == {
+            "foo": "bar_foo_baz_baz",
+            "bar": "bar_foo",
+            "x": "foo",
+        }
+
+    @pytest.mark.parametrize(
+        ["pong_component", "concurrent", "stages", "exception"],
+        (
+            pytest.param(PongComponent(), True, [([], [0, 1])], None, id="concurrent"),
+            pytest.param(PongComponent(), False, [([], [0, 1])], asyncio.TimeoutError, id="concurrent_disabled"),
+            pytest.param(SequentialPongComponent(), True, [([0, 1], [])], asyncio.TimeoutError, id="sequential"),
+            pytest.param(FailingPongComponent(), True, [([], [0, 1])], ValueError("Wrong pong"), id="error"),
+        ),
+        indirect=["exception"],
+    )
+    async def test_values_concurrent(self, pong_component, concurrent, stages, exception):
+        def ping_pong(ping: Ping, pong: Pong):
+            ...
+
+        injector = Injector({"events": dict}, Components([PingComponent(), pong_component]))
+        plan = InjectionPlan(injector.resolve_function(ping_pong))
+
+        assert plan.stages == stages
+
+        with exception:
+            events = {"ping": asyncio.Event(), "pong": asyncio.Event()}
+            values = await asyncio.wait_for(plan.values({"events": events}, concurrent=concurrent), timeout=0.1)
+
+            assert values == {"ping": "ping", "pong": "pong"}
+
+    async def test_values_missing_context(self, plan):
+        with pytest.raises(KeyError, match="x"):
+            await plan.values({})
@@ -0,0 +1,189 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from flama.models import CacheMetrics, Model, PredictionCache
+
+
+class DoubleModel(Model):
+    def predict(self, x):
+        return [[i * 2 for i in row] for row in x]
+
+
+@pytest.fixture(scope="function")
+def model():
+    return DoubleModel(None, MagicMock(id=uuid.UUID("00000000-0000-0000-0000-000000000001")), None)
+
+
+@pytest.fixture(scope="function")
+def predict():
+    async def _predict(model, x):
+        return model.predict(x)
+
+    return AsyncMock(side_effect=_predict)
+
+
+class TestCaseCacheMetrics:
+    @pytest.mark.parametrize(
+        ["metrics", "result"],
+        (
+            pytest.param(
+                CacheMetrics(),
+                {
+                    "size": 0,
+                    "hits": 0,
+                    "misses": 0,
+                    "hit_rate": 0.0,
+                    "evictions": 0,
+                    "expirations": 0,
+                    "invalidations": 0,
+                },
+                id="empty",
+            ),
+            pytest.param(
+                CacheMetrics(size=2, hits=3, misses=1, evictions=1, expirations=2, invalidations=1),
+                {
+                    "size": 2,
+                    "hits": 3,
+                    "misses": 1,
+                    "hit_rate": 0.75,
+                    "evictions": 1,
+                    "expirations": 2,
+                    "invalidations": 1,
+                },
+                id="lookups",
+            ),
+        ),
+    )
+    def test_to_dict(self, metrics, result):
+        assert metrics.to_dict() == result
+
+
+class TestCasePredictionCache:
+    @pytest.mark.parametrize(
+        ["max_size", "exception"],
+        (
+            pytest.param(1, None, id="ok"),
+            pytest.param(0, ValueError("Max size must be greater than 0"), id="wrong_size"),
+        ),
+        indirect=["exception"],
+    )
+    def test_init(self, max_size, exception):
+        with exception:
+            cache = PredictionCache(max_size=max_size, ttl=1.0)
+
+            assert cache.max_size == max_size
+            assert cache.ttl == 1.0
+            assert cache.metrics == CacheMetrics()
+
+    @pytest.mark.parametrize(
+        ["a", "b", "equal"],
+        (
+            pytest.param([1, 2.0, "foo"], [1, 2.0, "foo"], True, id="equal"),
+            pytest.param([1, 2], [2, 1], False, id="order"),
+            pytest.param({"a": 1, "b": 2}, {"b": 2, "a": 1}, True, id="mapping"),
+            pytest.param([1, 2], [1, 3], False, id="different"),
+        ),
+    )
+    def test_key(self, a, b, equal):
+        assert (PredictionCache.key(a) == PredictionCache.key(b)) is equal
+
+    def test_get_set(self):
+        cache = PredictionCache()
+
+        assert cache.get("foo") == (False, None)
+
+        cache.set("foo", [1])
+
+        assert cache.get("foo") == (True, [1])
+        assert cache.metrics == CacheMetrics(size=1, hits=1, misses=1)
+
+    def test_eviction(self):
+        cache = PredictionCache(max_size=2)
+
+        cache.set("foo", 1)
+        cache.set("bar", 2)
+        cache.get("foo")
+        cache.set("baz", 3)
+
+        assert cache.get("bar") == (False, None)
+        assert cache.get("foo") == (True, 1)
+        assert cache.get("baz") == (True, 3)
+        assert cache.metrics.evictions == 1
+        assert cache.metrics.size == 2
+
+    def test_expiration(self):
+        cache = PredictionCache(ttl=10.0)
+
+        with patch("time.monotonic", return_value=100.0):
+            cache.set("foo", 1)
+
+        with patch("time.monotonic", return_value=105.0):
+            assert cache.get("foo") == (True, 1)
+
+        with patch("time.monotonic", return_value=110.0):
+            assert cache.get("foo") == (False, None)
+
+        assert cache.metrics.expirations == 1
+        assert cache.metrics.size == 0
+
+    async def test_predict(self, model, predict):
+        cache = PredictionCache()
+
+        assert await cache.predict(model, [[1, 2], [3, 4]], predict) == [[2, 4], [6, 8]]
+        assert await cache.predict(model, [[3, 4], [5, 6], [1, 2]], predict) == [[6, 8], [10, 12], [2, 4]]
+        assert await cache.predict(model, [[5, 6]], predict) == [[10, 12]]
+
+        assert [c.args[1] for c in predict.call_args_list] == [[[1, 2], [3, 4]], [[5, 6]]]
+        assert cache.metrics.hits == 3
+        assert cache.metrics.misses == 3
+        assert cache.metrics.hit_rate == 0.5
+
+    @pytest.mark.parametrize(
+        ["x"],
+        (
+            pytest.param("foo", id="not_rows"),
+            pytest.param([], id="empty"),
+        ),
+    )
+    async def test_predict_not_cached(self, model, x):
+        cache = PredictionCache()
+        predict = AsyncMock(return_value="bar")
+
+        assert await cache.predict(model, x, predict) == "bar"
+        assert await cache.predict(model, x, predict) == "bar"
+        assert predict.await_count == 2
+        assert cache.metrics == CacheMetrics()
+
+    async def test_predict_invalidation(self, model, predict):
+        cache = PredictionCache()
+
+        await cache.predict(model, [[1, 2]], predict)
+        model.meta = MagicMock(id=uuid.UUID("00000000-0000-0000-0000-000000000002"))
+        await cache.predict(model, [[1, 2]], predict)
+
+        assert predict.await_count == 2
+        assert cache.metrics.invalidations == 1
+        assert cache.metrics.size == 1
+
+    @pytest.mark.parametrize(
+        ["cached", "result", "exception"],
+        (
+            pytest.param(False, "foo", None, id="uncached"),
+            pytest.param(
+                True, None, ValueError("Model output must have a row for each input row"), id="partially_cached"
+            ),
+        ),
+        indirect=["exception"],
+    )
+    async def test_predict_output_without_rows(self, model, cached, result, exception):
+        cache = PredictionCache()
+        if cached:
+            cache.set(cache.key([1, 2]), [2, 4])
+            cache._model_id = model.meta.id
+
+        with exception:
+            assert await cache.predict(model, [[1, 2], [3, 4]], AsyncMock(return_value="foo")) == result
+
+        assert cache.metrics.size == int(cached)
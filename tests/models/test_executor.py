@@ -0,0 +1,219 @@
+import asyncio
+import importlib.util
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from flama.models import BatchingModelExecutor, ExecutorMetrics, Model, ModelExecutor
+
+
+class DoubleModel(Model):
+    def predict(self, x):
+        if x == "wrong":
+            raise ValueError("Wrong input")
+
+        return [i * 2 for i in x]
+
+
+class TestCaseExecutorMetrics:
+    @pytest.mark.parametrize(
+        ["in_flight", "queue_depth"],
+        (
+            pytest.param(0, 0, id="idle"),
+            pytest.param(2, 0, id="busy"),
+            pytest.param(5, 3, id="queued"),
+        ),
+    )
+    def test_queue_depth(self, in_flight, queue_depth):
+        assert ExecutorMetrics(workers=2, in_flight=in_flight).queue_depth == queue_depth
+
+    @pytest.mark.parametrize(
+        ["metrics", "result"],
+        (
+            pytest.param(
+                ExecutorMetrics(workers=1),
+                {
+                    "workers": 1,
+                    "queue_depth": 0,
+                    "in_flight": 0,
+                    "predictions": 0,
+                    "errors": 0,
+                    "execution_time": {"total": 0.0, "mean": 0.0, "max": 0.0},
+                },
+                id="empty",
+            ),
+            pytest.param(
+                ExecutorMetrics(
+                    workers=1, in_flight=3, predictions=4, errors=1, execution_time=2.0, max_execution_time=1.0
+                ),
+                {
+                    "workers": 1,
+                    "queue_depth": 2,
+                    "in_flight": 3,
+                    "predictions": 4,
+                    "errors": 1,
+                    "execution_time": {"total": 2.0, "mean": 0.5, "max": 1.0},
+                },
+                id="predictions",
+            ),
+        ),
+    )
+    def test_to_dict(self, metrics, result):
+        assert metrics.to_dict() == result
+
+
+class TestCaseModelExecutor:
+    @pytest.fixture(scope="function")
+    def model(self):
+        return DoubleModel(None, None, None)
+
+    @pytest.mark.parametrize(
+        ["kind", "max_workers", "workers", "exception"],
+        (
+            pytest.param("thread", 2, 2, None, id="thread"),
+            pytest.param("process", None, 8, None, id="process_default_workers"),
+            pytest.param(
+                "foo",
+                None,
+                None,
+                ValueError("Unknown executor kind 'foo', available kinds are: thread, process"),
+                id="wrong",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    def test_init(self, kind, max_workers, workers, exception):
+        with exception, patch("os.cpu_count", return_value=8):
+            executor = ModelExecutor(kind, max_workers=max_workers)
+
+            assert executor.kind == kind
+            assert executor.max_workers == workers
+            assert executor.metrics == ExecutorMetrics(workers=workers)
+            assert executor._executor is None
+
+    @pytest.mark.parametrize(["kind"], (pytest.param("thread", id="thread"), pytest.param("process", id="process")))
+    async def test_predict(self, model, kind):
+        executor = ModelExecutor(kind, max_workers=1)
+
+        try:
+            assert await executor.predict(model, [1, 2]) == [2, 4]
+
+            with pytest.raises(ValueError, match="Wrong input"):
+                await executor.predict(model, "wrong")
+        finally:
+            executor.shutdown()
+
+        assert executor._executor is None
+        assert executor.metrics.predictions == 1
+        assert executor.metrics.errors == 1
+        assert executor.metrics.in_flight == 0
+        assert executor.metrics.execution_time > 0
+        assert executor.metrics.max_execution_time == executor.metrics.execution_time
+
+    async def test_predict_off_event_loop(self, model):
+        executor = ModelExecutor(max_workers=2)
+        threads = set()
+        release = threading.Event()
+
+        def predict(x):
+            threads.add(threading.current_thread())
+            release.wait(timeout=5)
+            return x
+
+        try:
+            with patch.object(model, "predict", side_effect=predict):
+                tasks = [asyncio.create_task(executor.predict(model, [i])) for i in range(3)]
+                await asyncio.sleep(0.05)  # Event loop keeps running while predictions are blocked
+
+                assert executor.metrics.in_flight == 3
+                assert executor.metrics.queue_depth == 1
+
+                release.set()
+                assert await asyncio.gather(*tasks) == [[0], [1], [2]]
+        finally:
+            executor.shutdown()
+
+        assert threading.current_thread() not in threads
+        assert executor.metrics.queue_depth == 0
+
+
+class TestCaseBatchingModelExecutor:
+    @pytest.fixture(scope="function")
+    def model(self):
+        return DoubleModel(None, None, None)
+
+    @pytest.fixture(scope="function")
+    async def executor(self):
+        executor = BatchingModelExecutor(max_workers=1, max_batch_size=4, max_wait_ms=10)
+        yield executor
+        executor.shutdown()
+
+    def test_init(self):
+        executor = BatchingModelExecutor("process", 2, max_batch_size=8, max_wait_ms=1.5)
+
+        assert executor.kind == "process"
+        assert executor.max_workers == 2
+        assert executor.max_batch_size == 8
+        assert executor.max_wait_ms == 1.5
+
+    def test_init_wrong_batch_size(self):
+        with pytest.raises(ValueError, match="Max batch size must be greater than 0"):
+            BatchingModelExecutor(max_batch_size=0)
+
+    @pytest.mark.parametrize(
+        ["inputs", "calls"],
+        (
+            pytest.param([[1], [2, 3]], [[1, 2, 3]], id="wait"),
+            pytest.param([[1, 2], [3, 4], [5]], [[1, 2, 3, 4], [5]], id="max_batch_size"),
+            pytest.param([[1, 2, 3, 4, 5]], [[1, 2, 3, 4, 5]], id="bigger_than_batch"),
+        ),
+    )
+    async def test_predict(self, executor, model, inputs, calls):
+        with patch.object(model, "predict", side_effect=model.predict) as predict_mock:
+            result = await asyncio.gather(*[executor.predict(model, x) for x in inputs])
+
+        assert result == [[i * 2 for i in x] for x in inputs]
+        assert [c.args[0] for c in predict_mock.call_args_list] == calls
+        assert executor.metrics.predictions == len(calls)
+
+    @pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+    @pytest.mark.parametrize(
+        ["arrays", "concatenated"],
+        (
+            pytest.param([True, True], True, id="arrays"),
+            pytest.param([True, False], False, id="arrays_and_lists"),
+        ),
+    )
+    async def test_predict_arrays(self, executor, model, arrays, concatenated):
+        import numpy as np
+
+        inputs = [np.array(x) if array else x for x, array in zip([[[1.0]], [[2.0], [3.0]]], arrays)]
+
+        with patch.object(model, "predict", side_effect=lambda x: [[i * 2 for i in row] for row in x]) as predict_mock:
+            result = await asyncio.gather(*[executor.predict(model, x) for x in inputs])
+
+        assert result == [[[2.0]], [[4.0], [6.0]]]
+        assert predict_mock.call_count == 1
+        batch = predict_mock.call_args.args[0]
+        assert isinstance(batch, np.ndarray) is concatenated
+        assert np.asarray(batch).tolist() == [[1.0], [2.0], [3.0]]
+
+    async def test_predict_not_batched(self, executor, model):
+        with patch.object(model, "predict", return_value="foo") as predict_mock:
+            assert await executor.predict(model, "bar") == "foo"
+
+        assert predict_mock.call_args_list == [((("bar"),),)]
+
+    async def test_predict_isolates_errors(self, executor, model):
+        result = await asyncio.gather(
+            executor.predict(model, [1]), executor.predict(model, [None]), return_exceptions=True
+        )
+
+        assert result[0] == [2]
+        assert isinstance(result[1], TypeError)
+
+    async def test_predict_wrong_output(self, executor, model):
+        with patch.object(model, "predict", return_value=[1]):
+            with pytest.raises(ValueError, match="Model output must have a row for each input row"):
+                await executor.predict(model, [1, 2])
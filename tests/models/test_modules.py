@@ -1,7 +1,10 @@
+import threading
+from unittest.mock import patch
+
 import pytest
 
 from flama.applications import Flama
-from flama.models import ModelResource, ModelResourceType
+from flama.models import MetricsModelResourceType, ModelExecutor, ModelResource, ModelResourceType
 from flama.resources.routing import ResourceRoute
 
 
@@ -97,3 +100,47 @@ class TestCaseResourcesModule:
             ("/", {"HEAD", "GET"}, resource.inspect, {"tag": "inspect"}),
             ("/predict/", {"POST"}, resource.predict, {"tag": "predict"}),
         ]
+
+    def test_add_model_resource_metrics(self, app, model, component, tags):
+        component_ = component
+
+        class PuppyModelResource(ModelResource, metaclass=MetricsModelResourceType):
+            name = "puppy"
+            verbose_name = "Puppy"
+            component = component_
+
+        resource = PuppyModelResource()
+
+        app.models.add_model_resource("/", resource, tags={**tags, "metrics": {"tag": "metrics"}})
+
+        assert len(app.routes) == 1
+        assert isinstance(app.routes[0], ResourceRoute)
+        resource_route = app.routes[0]
+        assert len(resource_route.routes) == 3
+        assert [(route.path, route.methods, route.endpoint, route.tags) for route in resource_route.routes] == [
+            ("/", {"HEAD", "GET"}, resource.inspect, {"tag": "inspect"}),
+            ("/predict/", {"POST"}, resource.predict, {"tag": "predict"}),
+            ("/metrics/", {"HEAD", "GET"}, resource.metrics, {"tag": "metrics"}),
+        ]
+
+    async def test_on_shutdown(self, app, model, component):
+        component_ = component
+        executor_ = ModelExecutor()
+
+        class PuppyModelResource(ModelResource, metaclass=ModelResourceType):
+            name = "puppy"
+            verbose_name = "Puppy"
+            component = component_
+            executor = executor_
+
+        app.models.add_model_resource("/puppy/", PuppyModelResource)
+        app.models.add_model_resource("/other-puppy/", PuppyModelResource)
+
+        assert app.models.executors == [executor_]
+
+        threads = []
+        with patch.object(executor_, "shutdown", side_effect=lambda: threads.append(threading.get_ident())) as shutdown:
+            await app.models.on_shutdown()
+
+        assert shutdown.call_count == 1
+        assert threads != [threading.get_ident()]
@@ -1,6 +1,18 @@
+import importlib.util
+import io
+from unittest.mock import patch
+
 import pytest
 
-from flama.models import ModelResource, ModelResourceType
+from flama.models import (
+    MetricsModelResourceType,
+    Model,
+    ModelComponent,
+    ModelExecutor,
+    ModelResource,
+    ModelResourceType,
+    PredictionCache,
+)
 from flama.resources.exceptions import ResourceAttributeError
 
 
@@ -25,8 +37,15 @@ class TestCaseModelResource:
         assert hasattr(resource, "_meta")
         assert resource._meta.name == "puppy"
         assert resource._meta.verbose_name == "Puppy"
+        assert isinstance(resource.executor, ModelExecutor)
         assert resource._meta.namespaces == {
-            "model": {"component": component, "model": model, "model_type": component.get_model_type()}
+            "model": {
+                "component": component,
+                "model": model,
+                "model_type": component.get_model_type(),
+                "executor": resource.executor,
+                "cache": None,
+            }
         }
 
     @pytest.mark.parametrize(
@@ -61,7 +80,13 @@ class TestCaseModelResource:
         assert resource._meta.name == "puppy"
         assert resource._meta.verbose_name == "Puppy"
         assert resource._meta.namespaces == {
-            "model": {"component": component, "model": component.model, "model_type": component.get_model_type()}
+            "model": {
+                "component": component,
+                "model": component.model,
+                "model_type": component.get_model_type(),
+                "executor": resource.executor,
+                "cache": None,
+            }
         }
 
     def test_resource_wrong(self):
@@ -160,3 +185,220 @@ class TestCaseModelResourceMethods:
         if status_code == 200:
             for a, e in zip(response.json()["output"], y):
                 assert a == pytest.approx(e, abs=3e-1)
+
+    async def test_predict_executor(self, app, client):
+        class SumModel(Model):
+            def predict(self, x):
+                return [sum(i) for i in x]
+
+        class SumModelComponent(ModelComponent):
+            def resolve(self) -> SumModel:
+                return self.model
+
+        executor_ = ModelExecutor(max_workers=1)
+
+        @app.models.model_resource("/sum/")
+        class SumModelResource(ModelResource, metaclass=MetricsModelResourceType):
+            name = "sum"
+            component = SumModelComponent(SumModel(None, None, None))
+            executor = executor_
+
+        try:
+            response = await client.post("/sum/predict/", json={"input": [[0, 1], [1, 1]]})
+            assert response.status_code == 200, response.json()
+            assert response.json() == {"output": [1, 2]}
+
+            response = await client.get("/sum/metrics/")
+            assert response.status_code == 200, response.json()
+            metrics = response.json()
+            assert metrics["predictions"] == 1
+            assert metrics["queue_depth"] == 0
+            assert metrics["execution_time"]["total"] > 0
+        finally:
+            executor_.shutdown()
+
+    async def test_predict_cache(self, app, client):
+        class SumModel(Model):
+            def predict(self, x):
+                return [sum(i) for i in x]
+
+        class SumModelComponent(ModelComponent):
+            def resolve(self) -> SumModel:
+                return self.model
+
+        executor_ = ModelExecutor(max_workers=1)
+        cache_ = PredictionCache(max_size=8)
+
+        @app.models.model_resource("/sum/")
+        class SumModelResource(ModelResource, metaclass=MetricsModelResourceType):
+            name = "sum"
+            component = SumModelComponent(SumModel(None, None, None))
+            executor = executor_
+            cache = cache_
+
+        assert SumModelResource._meta.namespaces["model"]["cache"] == cache_
+
+        try:
+            response = await client.post("/sum/predict/", json={"input": [[0, 1], [1, 1]]})
+            assert response.status_code == 200, response.json()
+            assert response.json() == {"output": [1, 2]}
+
+            response = await client.post("/sum/predict/", json={"input": [[1, 1], [2, 1]]})
+            assert response.status_code == 200, response.json()
+            assert response.json() == {"output": [2, 3]}
+
+            response = await client.get("/sum/metrics/")
+            assert response.status_code == 200, response.json()
+            metrics = response.json()
+            assert metrics["predictions"] == 2
+            assert metrics["cache"]["hits"] == 1
+            assert metrics["cache"]["misses"] == 3
+            assert metrics["cache"]["hit_rate"] == 0.25
+            assert metrics["cache"]["size"] == 3
+        finally:
+            executor_.shutdown()
+
+    @pytest.fixture
+    def sum_model_resource(self, app):
+        class SumModel(Model):
+            def predict(self, x):
+                return [float(sum(i)) for i in x]
+
+        class SumModelComponent(ModelComponent):
+            def resolve(self) -> SumModel:
+                return self.model
+
+        @app.models.model_resource("/sum/")
+        class SumModelResource(ModelResource, metaclass=MetricsModelResourceType):
+            name = "sum"
+            component = SumModelComponent(SumModel(None, None, None))
+
+        yield SumModelResource
+
+        SumModelResource.executor.shutdown()
+
+    @pytest.mark.parametrize(
+        ["content_type", "content", "status_code"],
+        (
+            pytest.param("application/json", b'{"input": [[0, 1], [1, 1]]}', 200, id="json"),
+            pytest.param("application/json", b'{"foo": []}', 400, id="json_invalid"),
+            pytest.param("application/json", b"{", 400, id="json_malformed"),
+            pytest.param("text/plain", b"foo", 415, id="unsupported"),
+            pytest.param(
+                "application/x-npy",
+                b"foo",
+                400,
+                id="npy_malformed",
+                marks=pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed"),
+            ),
+            pytest.param(
+                "application/x-float32; columns=3",
+                b"\x00" * 8,
+                400,
+                id="float32_malformed",
+                marks=pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed"),
+            ),
+        ),
+    )
+    async def test_predict_content_type(self, client, sum_model_resource, content_type, content, status_code):
+        response = await client.post("/sum/predict/", content=content, headers={"Content-Type": content_type})
+
+        assert response.status_code == status_code, response.json()
+        if status_code == 200:
+            assert response.json() == {"output": [1.0, 2.0]}
+
+    @pytest.mark.parametrize(
+        ["content_type"],
+        (
+            pytest.param("application/x-npy", id="npy"),
+            pytest.param("application/x-float32", id="float32"),
+            pytest.param("application/vnd.apache.arrow.stream", id="arrow"),
+        ),
+    )
+    async def test_predict_content_type_not_installed(self, client, sum_model_resource, content_type):
+        with patch("flama.codecs.http.npy.np", None), patch("flama.codecs.http.float32.np", None), patch(
+            "flama.codecs.http.arrow.np", None
+        ):
+            response = await client.post("/sum/predict/", content=b"foo", headers={"Content-Type": content_type})
+
+        assert response.status_code == 415, response.json()
+
+    async def test_predict_accept_not_installed(self, client, sum_model_resource):
+        with patch("flama.codecs.http.npy.np", None):
+            response = await client.post(
+                "/sum/predict/", json={"input": [[0, 1], [1, 1]]}, headers={"Accept": "application/x-npy"}
+            )
+
+        assert response.status_code == 200, response.json()
+        assert response.json() == {"output": [1.0, 2.0]}
+
+    def test_predict_schema(self, app, sum_model_resource):
+        request_body = app.schema.schema["paths"]["/sum/predict/"]["post"]["requestBody"]
+
+        assert request_body["content"] == {
+            "application/json": {"schema": {"$ref": "#/components/schemas/flama.MLModelInput"}},
+            "application/x-npy": {"schema": {"type": "string", "format": "binary"}},
+            "application/vnd.apache.arrow.stream": {"schema": {"type": "string", "format": "binary"}},
+            "application/x-float32": {"schema": {"type": "string", "format": "binary"}},
+        }
+        assert "flama.MLModelInput" in app.schema.schema["components"]["schemas"]
+
+    @pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+    @pytest.mark.parametrize(
+        ["format", "accept"],
+        (
+            pytest.param("npy", "application/json", id="npy"),
+            pytest.param("npy", "application/x-npy", id="npy_output"),
+            pytest.param("float32", "application/json", id="float32"),
+            pytest.param("float32", "application/x-float32", id="float32_output"),
+            pytest.param(
+                "arrow",
+                "application/json",
+                id="arrow",
+                marks=pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"),
+            ),
+            pytest.param(
+                "arrow",
+                "application/vnd.apache.arrow.stream",
+                id="arrow_output",
+                marks=pytest.mark.skipif(importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"),
+            ),
+        ),
+    )
+    async def test_predict_binary(self, client, sum_model_resource, format, accept):
+        import numpy as np
+
+        x = np.array([[0.0, 1.0, 2.0], [1.0, 1.0, 1.5]], dtype="<f4")
+
+        if format == "npy":
+            stream = io.BytesIO()
+            np.save(stream, x)
+            content, content_type = stream.getvalue(), "application/x-npy"
+        elif format == "float32":
+            content, content_type = x.tobytes(), "application/x-float32; columns=3"
+        else:
+            import pyarrow as pa
+
+            table = pa.table({"a": x[:, 0], "b": x[:, 1], "c": x[:, 2]})
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            content, content_type = sink.getvalue().to_pybytes(), "application/vnd.apache.arrow.stream"
+
+        response = await client.post(
+            "/sum/predict/", content=content, headers={"Content-Type": content_type, "Accept": accept}
+        )
+
+        assert response.status_code == 200, response.text
+        assert response.headers["Content-Type"].startswith(accept)
+        if accept == "application/json":
+            output = response.json()["output"]
+        elif accept == "application/x-npy":
+            output = np.load(io.BytesIO(response.content)).tolist()
+        elif accept == "application/x-float32":
+            output = np.frombuffer(response.content, dtype="<f4").tolist()
+        else:
+            import pyarrow as pa
+
+            output = pa.ipc.open_stream(response.content).read_all().column(0).to_pylist()
+        assert output == pytest.approx([3.0, 3.5])
@@ -1,6 +1,8 @@
 import datetime
+import json
 import typing as t
 import uuid
+from unittest.mock import patch
 
 import marshmallow
 import pydantic
@@ -11,7 +13,8 @@ import typesystem.fields
 from sqlalchemy.dialects import postgresql
 
 from flama.applications import Flama
-from flama.resources.crud import CRUDResource
+from flama.ddd.repositories.sqlalchemy import SQLAlchemyTableRepository
+from flama.resources.crud import CRUDResource, StreamCRUDResourceType
 from flama.resources.routing import ResourceRoute, resource_method
 from flama.resources.workers import FlamaWorker
 from flama.schemas import SchemaMetadata, SchemaType
@@ -90,6 +93,22 @@ class TestCaseCRUDResource:
 
         return PuppyResource()
 
+    @pytest.fixture(scope="function")
+    def stream_resource(self, app, puppy_model, puppy_schema):
+        class StreamPuppyResource(CRUDResource, metaclass=StreamCRUDResourceType):
+            name = "stream_puppy"
+            verbose_name = "Stream Puppy"
+
+            model = puppy_model
+            input_schema = puppy_schema
+            output_schema = puppy_schema
+
+        app.resources.add_resource("/stream-puppy/", StreamPuppyResource)
+
+        yield StreamPuppyResource
+
+        app.resources.remove_repository(StreamPuppyResource._meta.name)
+
     @pytest.fixture(scope="function")
     async def custom_id_datetime_model(self, app):
         table = sqlalchemy.Table(
@@ -477,6 +496,30 @@ class TestCaseCRUDResource:
         assert response.status_code == 200, response.json()
         assert response.json()["data"] == [{"custom_id": 1, **puppy}, {"custom_id": 2, **another_puppy}]
 
+    @pytest.mark.parametrize(
+        ["params", "data", "count"],
+        (
+            pytest.param({"page_size": 2}, [0, 1], None, id="first_page"),
+            pytest.param({"page_size": 2, "page": 2}, [2], None, id="last_page"),
+            pytest.param({"page_size": 2, "page": 2, "count": True}, [2], 3, id="count"),
+        ),
+    )
+    async def test_list_pagination(self, client, custom_id_datetime_resource, params, data, count):
+        records = [{"custom_id": f"2018-01-0{i + 1}T00:00:00", "name": f"foo{i}"} for i in range(3)]
+        for record in records:
+            response = await client.request("post", "/custom_id_datetime/", json=record)
+            assert response.status_code == 201, response.json()
+
+        with patch.object(
+            SQLAlchemyTableRepository, "count", autospec=True, side_effect=SQLAlchemyTableRepository.count
+        ) as count_mock:
+            response = await client.request("get", "/custom_id_datetime/", params=params)
+
+        assert response.status_code == 200, response.json()
+        assert response.json()["data"] == [records[i] for i in data]
+        assert response.json()["meta"]["count"] == count
+        assert count_mock.call_count == (1 if count else 0)
+
     async def test_list_order(self, client, puppy, another_puppy):
         # Successfully create a new record
         response = await client.request("post", "/puppy/", json=puppy)
@@ -510,6 +553,128 @@ class TestCaseCRUDResource:
         assert response.status_code == 200, response.json()
         assert response.json()["data"] == []
 
+    @pytest.mark.parametrize(
+        ["headers", "media_type", "order"],
+        (
+            pytest.param({}, "application/json", {}, id="json"),
+            pytest.param({"accept": "application/x-ndjson"}, "application/x-ndjson", {}, id="ndjson"),
+            pytest.param({}, "application/json", {"order_by": "name", "order_direction": "desc"}, id="order"),
+        ),
+    )
+    async def test_stream(self, client, stream_resource, puppy, another_puppy, headers, media_type, order):
+        for record in (puppy, another_puppy):
+            response = await client.request("post", "/puppy/", json=record)
+            assert response.status_code == 201, response.json()
+
+        expected = [{"custom_id": 1, **puppy}, {"custom_id": 2, **another_puppy}]
+        if order:
+            expected.reverse()
+
+        with patch.object(
+            SQLAlchemyTableRepository, "list", autospec=True, side_effect=SQLAlchemyTableRepository.list
+        ) as list_mock:
+            response = await client.request("get", "/stream-puppy/stream/", params=order, headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith(media_type)
+        if media_type == "application/x-ndjson":
+            assert [json.loads(x) for x in response.text.splitlines()] == expected
+        else:
+            assert response.json() == expected
+        assert list_mock.call_args.kwargs["yield_per"] == stream_resource.stream_yield_per
+
+    def test_stream_crud_resource(self, stream_resource, app):
+        assert len(app.routes) == 2
+        resource_route = app.routes[1]
+        assert isinstance(resource_route.resource, stream_resource)
+        resource = resource_route.resource
+        assert [(i.path, i.endpoint, i.methods, i.name) for i in resource_route.routes] == [
+            ("/", resource.create, {"POST"}, "create"),
+            ("/stream/", resource.stream, {"GET", "HEAD"}, "stream"),
+            ("/{resource_id}/", resource.retrieve, {"GET", "HEAD"}, "retrieve"),
+            ("/{resource_id}/", resource.update, {"PUT"}, "update"),
+            ("/{resource_id}/", resource.partial_update, {"PATCH"}, "partial-update"),
+            ("/{resource_id}/", resource.delete, {"DELETE"}, "delete"),
+            ("/", resource.list, {"GET", "HEAD"}, "list"),
+            ("/", resource.replace, {"PUT"}, "replace"),
+            ("/", resource.partial_replace, {"PATCH"}, "partial-replace"),
+            ("/", resource.drop, {"DELETE"}, "drop"),
+        ]
+
+    async def test_stream_empty(self, client, stream_resource):
+        response = await client.request("get", "/stream-puppy/stream/")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    @pytest.mark.parametrize(
+        ["method", "path", "transactions"],
+        (
+            pytest.param("get", "/puppy/1/", 0, id="retrieve"),
+            pytest.param("get", "/puppy/", 1, id="list"),
+            pytest.param("get", "/stream-puppy/stream/", 1, id="stream"),
+            pytest.param("delete", "/puppy/1/", 1, id="delete"),
+        ),
+    )
+    async def test_transactions(self, client, stream_resource, puppy, method, path, transactions):
+        response = await client.request("post", "/puppy/", json=puppy)
+        assert response.status_code == 201, response.json()
+
+        with patch.object(
+            SQLAlchemyModule, "begin_transaction", autospec=True, side_effect=SQLAlchemyModule.begin_transaction
+        ) as begin_transaction_mock:
+            response = await client.request(method, path)
+
+        assert response.status_code < 300
+        assert begin_transaction_mock.call_count == transactions
+
+    @pytest.mark.parametrize(
+        ["method", "path", "read_only"],
+        (
+            pytest.param("get", "/puppy/1/", True, id="retrieve"),
+            pytest.param("get", "/stream-puppy/stream/", True, id="stream"),
+            pytest.param("get", "/puppy/", False, id="custom_get"),
+            pytest.param("put", "/puppy/1/", False, id="update"),
+            pytest.param("delete", "/puppy/1/", False, id="delete"),
+        ),
+    )
+    async def test_read_only(self, client, stream_resource, puppy, method, path, read_only):
+        response = await client.request("post", "/puppy/", json=puppy)
+        assert response.status_code == 201, response.json()
+
+        with patch.object(
+            SQLAlchemyModule, "open_connection", autospec=True, side_effect=SQLAlchemyModule.open_connection
+        ) as open_connection_mock:
+            response = await client.request(method, path, **({"json": puppy} if method == "put" else {}))
+
+        assert response.status_code < 300, response.json()
+        assert [c.kwargs for c in open_connection_mock.call_args_list] == [{"read_only": read_only}]
+
+    @pytest.mark.parametrize(
+        ["read_replica", "worker_read_only", "read_only"],
+        (
+            pytest.param(True, None, True, id="read_replica"),
+            pytest.param(False, None, False, id="no_read_replica"),
+            pytest.param(True, False, False, id="declared_read_write"),
+            pytest.param(False, True, True, id="declared_read_only"),
+        ),
+    )
+    async def test_read_only_declared(
+        self, app, client, stream_resource, puppy, read_replica, worker_read_only, read_only
+    ):
+        response = await client.request("post", "/puppy/", json=puppy)
+        assert response.status_code == 201, response.json()
+
+        with patch.object(stream_resource, "read_replica", read_replica), patch.object(
+            app.resources.worker, "read_only", worker_read_only
+        ), patch.object(
+            SQLAlchemyModule, "open_connection", autospec=True, side_effect=SQLAlchemyModule.open_connection
+        ) as open_connection_mock:
+            response = await client.request("get", "/stream-puppy/1/")
+
+        assert response.status_code == 200, response.json()
+        assert [c.kwargs for c in open_connection_mock.call_args_list] == [{"read_only": read_only}]
+
     async def test_replace(self, client, puppy, another_puppy):
         # Successfully create a new record
         response = await client.request("post", "/puppy/", json=puppy)
@@ -42,6 +42,26 @@ class TestCaseFlamaWorker:
 
         assert not worker._resources_repositories.registered
 
+    async def test_clone(self, app, worker, sqlalchemy_repository):
+        worker.app = app
+        worker.add_repository("foo", sqlalchemy_repository)
+
+        async with worker:
+            clone = worker.clone()
+
+            with pytest.raises(ApplicationError, match="Repositories not initialized"):
+                clone.repositories
+
+            async with clone:
+                assert clone.connection is not worker.connection
+                assert clone.repositories == {"foo": sqlalchemy_repository(clone.connection)}
+
+            assert worker.repositories == {"foo": sqlalchemy_repository(worker.connection)}
+
+        clone.add_repository("bar", sqlalchemy_repository)
+
+        assert worker._resources_repositories.registered == {"foo": sqlalchemy_repository, "bar": sqlalchemy_repository}
+
     async def test_async_context(self, app, worker, http_repository, sqlalchemy_repository):
         worker.app = app
         worker.add_repository("foo", sqlalchemy_repository)
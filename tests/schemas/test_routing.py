@@ -15,6 +15,15 @@ class Custom:
     ...
 
 
+class Bar:
+    ...
+
+
+class BarComponent(Component):
+    def resolve(self) -> Bar:
+        return Bar()
+
+
 class TestCaseRouteFieldsMixin:
     @pytest.fixture
     def component(self):
@@ -46,7 +55,7 @@ class TestCaseRouteFieldsMixin:
         return schema
 
     @pytest.fixture
-    def route(self, request, foo_schema):
+    def route(self, request, app, foo_schema):
         if request.param == "http_function":
 
             def foo(
@@ -58,7 +67,7 @@ class TestCaseRouteFieldsMixin:
             ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(foo_schema)]:
                 ...
 
-            return Route("/foo/{w:int}/", endpoint=foo, methods=["GET"])
+            route = Route("/foo/{w:int}/", endpoint=foo, methods=["GET"])
 
         if request.param == "http_endpoint":
 
@@ -73,7 +82,7 @@ class TestCaseRouteFieldsMixin:
                 ) -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(foo_schema)]:
                     ...
 
-            return Route("/bar/{w:int}/", endpoint=BarEndpoint, methods=["GET"])
+            route = Route("/bar/{w:int}/", endpoint=BarEndpoint, methods=["GET"])
 
         if request.param == "websocket_function":
 
@@ -88,7 +97,7 @@ class TestCaseRouteFieldsMixin:
             ) -> None:
                 ...
 
-            return WebSocketRoute("/foo/{w:int}/", endpoint=foo)
+            route = WebSocketRoute("/foo/{w:int}/", endpoint=foo)
 
         if request.param == "websocket_endpoint":
 
@@ -105,12 +114,29 @@ class TestCaseRouteFieldsMixin:
                 ) -> None:
                     ...
 
-            return WebSocketRoute("/foo/{w:int}/", endpoint=FooWebsocket)
+            route = WebSocketRoute("/foo/{w:int}/", endpoint=FooWebsocket)
+
+        route.build(app)
+        return route
 
     @pytest.fixture(scope="function", autouse=True)
     def add_component(self, app, component):
         app.add_component(component)
 
+    @pytest.mark.parametrize("route", ["http_function"], indirect=True)
+    def test_memoized(self, route, app):
+        parameters = route.parameters
+
+        assert route.parameters is parameters
+        assert type(route).parameters is not parameters
+        assert parameters.query is parameters.query
+
+        query = parameters.query
+        app.add_component(BarComponent())
+
+        assert parameters.query is not query
+        assert parameters.query == query
+
     @pytest.mark.parametrize(
         ["route", "expected_params"],
         (
@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
-from flama import Component, Flama, Module, Mount, Route, Router, exceptions, http, types, websockets
+from flama import Component, Flama, Module, Mount, Route, Router, exceptions, http, json_engines, types, websockets
+from flama.asgi import ASGI_COMPONENTS
+from flama.client import Client
 from flama.ddd.components import WorkerComponent
 from flama.events import Events
 from flama.injection.injector import Injector
@@ -15,6 +17,7 @@ from flama.routing import BaseRoute
 from flama.schemas.modules import SchemaModule
 from flama.types.applications import AppStatus
 from flama.url import URL
+from flama.validation import VALIDATION_COMPONENTS
 
 DEFAULT_MODULES = [ResourcesModule, SchemaModule, ModelsModule]
 
@@ -68,7 +71,8 @@ class TestCaseFlama:
             "websocket_encoding": types.Encoding,
             "websocket_code": types.Code,
         }
-        assert app._injector.components == []
+        # Injector is initialised when building routes for compiling their injection plans
+        assert app._injector.components == [*app.components, *ASGI_COMPONENTS, *VALIDATION_COMPONENTS]
         # Check middleware
         assert isinstance(app.middleware, MiddlewareStack)
         assert app.middleware
@@ -428,3 +432,30 @@ class TestCaseFlama:
 
         assert app._status == AppStatus.SHUT_DOWN
         assert sub_app._status == AppStatus.SHUT_DOWN
+
+    @pytest.mark.skipif(not json_engines.OrjsonJSONEngine.installed(), reason="orjson not installed")
+    async def test_json_engine(self):
+        def engine():
+            return {"engine": json_engines.get().name}
+
+        with patch.object(json_engines, "engine", json_engines.StdlibJSONEngine()):
+            app = Flama(docs=None, schema=None, json_engine="orjson")
+            app.add_route("/engine/", engine)
+            sub_app = Flama(docs=None, schema=None)
+            sub_app.add_route("/engine/", engine)
+            app.mount("/foo", sub_app)
+            other_app = Flama(docs=None, schema=None)
+            other_app.add_route("/engine/", engine)
+
+            assert isinstance(app.json_engine, json_engines.OrjsonJSONEngine)
+            assert sub_app.json_engine is None
+            assert isinstance(json_engines.engine, json_engines.StdlibJSONEngine)
+
+            async with Client(app=app) as client:
+                assert (await client.get("/engine/")).json() == {"engine": "orjson"}
+                assert (await client.get("/foo/engine/")).json() == {"engine": "orjson"}
+
+            async with Client(app=other_app) as client:
+                assert (await client.get("/engine/")).json() == {"engine": "json"}
+
+            assert json_engines.get().name == "json"
@@ -13,7 +13,7 @@ import pytest
 import typesystem
 import typesystem.fields
 
-from flama import exceptions, http
+from flama import exceptions, http, schemas
 
 
 @dataclasses.dataclass
@@ -135,6 +135,15 @@ class TestCaseAPIResponse:
             response = http.APIResponse(schema=schema if use_schema else None, content=content)
             assert response.body.decode() == expected
 
+    def test_render_built_schema(self, schema):
+        built_schema = schemas.Schema(schema=schema)
+
+        with patch.object(schemas.Schema, "from_type") as from_type_mock:
+            response = http.APIResponse(schema=built_schema, content={"name": "Canna"})
+
+        assert response.body.decode() == '{"name":"Canna"}'
+        assert from_type_mock.call_count == 0
+
 
 class TestCaseAPIErrorResponse:
     def test_init(self):
@@ -151,6 +160,76 @@ class TestCaseAPIErrorResponse:
         assert json.loads(response.body.decode()) == expected_result
 
 
+class TestCaseAPIStreamingResponse:
+    @pytest.fixture(scope="function")
+    def schema(self, app):
+        if app.schema.schema_library.lib == pydantic:
+            schema = pydantic.create_model("Puppy", name=(str, ...))
+        elif app.schema.schema_library.lib == typesystem:
+            schema = typesystem.Schema(title="Puppy", fields={"name": typesystem.fields.String()})
+        elif app.schema.schema_library.lib == marshmallow:
+            schema = type("Puppy", (marshmallow.Schema,), {"name": marshmallow.fields.String(required=True)})
+        else:
+            raise ValueError("Wrong schema lib")
+
+        return schema
+
+    @pytest.mark.parametrize(
+        ["use_schema", "media_type", "chunk_size", "content", "expected", "exception"],
+        (
+            pytest.param(
+                True,
+                None,
+                65536,
+                [{"name": "Canna"}, {"name": "Sandy"}],
+                [b'[{"name":"Canna"},{"name":"Sandy"}]'],
+                None,
+                id="json",
+            ),
+            pytest.param(
+                True,
+                "application/x-ndjson",
+                65536,
+                [{"name": "Canna"}, {"name": "Sandy"}],
+                [b'{"name":"Canna"}\n{"name":"Sandy"}\n'],
+                None,
+                id="ndjson",
+            ),
+            pytest.param(
+                True,
+                None,
+                1,
+                [{"name": "Canna"}, {"name": "Sandy"}],
+                [b'[{"name":"Canna"}', b',{"name":"Sandy"}', b"]"],
+                None,
+                id="chunks",
+            ),
+            pytest.param(False, None, 65536, [], [b"[]"], None, id="json_empty"),
+            pytest.param(False, "application/x-ndjson", 65536, [], [], None, id="ndjson_empty"),
+            pytest.param(False, None, 65536, [{"foo": "bar"}], [b'[{"foo":"bar"}]'], None, id="no_schema"),
+            pytest.param(True, None, 65536, [{"foo": "bar"}], None, exceptions.SerializationError, id="error"),
+        ),
+        indirect=["exception"],
+    )
+    async def test_render(self, schema, use_schema, media_type, chunk_size, content, expected, exception):
+        async def elements():
+            for element in content:
+                yield element
+
+        response = http.APIStreamingResponse(
+            elements(), schema=schema if use_schema else None, media_type=media_type, chunk_size=chunk_size
+        )
+
+        with exception:
+            assert [x async for x in response.body_iterator] == expected
+
+    async def test_render_sync_iterable(self, schema):
+        response = http.APIStreamingResponse([{"name": "Canna"}], schema=schemas.Schema(schema=schema))
+
+        assert response.media_type == "application/json"
+        assert [x async for x in response.body_iterator] == [b'[{"name":"Canna"}]']
+
+
 class TestCaseHTMLFileResponse:
     def test_init(self):
         content = "<html></html>"
@@ -0,0 +1,173 @@
+import dataclasses
+import datetime
+import enum
+import json
+import os
+import pathlib
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from flama import exceptions, json_engines
+
+
+@dataclasses.dataclass
+class Foo:
+    bar: int
+
+
+class TestCaseJSONEngine:
+    @pytest.fixture(autouse=True)
+    def restore_engine(self):
+        engine = json_engines.engine
+        yield
+        json_engines.engine = engine
+
+    @pytest.fixture(params=["json", "orjson", "msgspec"])
+    def engine(self, request):
+        engine_cls = json_engines.ENGINES[request.param]
+        if not engine_cls.installed():
+            pytest.skip(f"{request.param} not installed")
+
+        return engine_cls()
+
+    @pytest.mark.parametrize(
+        ["content", "result", "exception"],
+        (
+            pytest.param(
+                {"foo": {"bar": [1, "foobar", 2.0, True, None]}},
+                {"foo": {"bar": [1, "foobar", 2.0, True, None]}},
+                None,
+                id="default",
+            ),
+            pytest.param({1: "foo"}, {"1": "foo"}, None, id="non_str_keys"),
+            pytest.param({"foo": 2**70}, {"foo": 2**70}, None, id="big_int"),
+            pytest.param({"foo": pathlib.Path("foo/bar.json")}, {"foo": "foo/bar.json"}, None, id="path"),
+            pytest.param({"foo": enum.Enum("Foo", ["bar"]).bar}, {"foo": 1}, None, id="enum"),
+            pytest.param({"foo": uuid.UUID(int=0)}, {"foo": "00000000-0000-0000-0000-000000000000"}, None, id="uuid"),
+            pytest.param({"foo": {"bar"}}, {"foo": ["bar"]}, None, id="set"),
+            pytest.param({"foo": frozenset({"bar"})}, {"foo": ["bar"]}, None, id="frozenset"),
+            pytest.param(
+                {"foo": datetime.datetime(2023, 9, 20, 11, 30, 0)}, {"foo": "2023-09-20T11:30:00"}, None, id="datetime"
+            ),
+            pytest.param({"foo": datetime.date(2023, 9, 20)}, {"foo": "2023-09-20"}, None, id="date"),
+            pytest.param({"foo": datetime.time(11, 30, 0)}, {"foo": "11:30:00"}, None, id="time"),
+            pytest.param(
+                {"foo": datetime.timedelta(days=1, hours=20, minutes=30, seconds=10, milliseconds=10, microseconds=6)},
+                {"foo": "P1D20H30M10.010006S"},
+                None,
+                id="timedelta",
+            ),
+            pytest.param({"foo": Exception}, {"foo": "Exception"}, None, id="exception_class"),
+            pytest.param({"foo": Exception("bar")}, {"foo": "Exception('bar')"}, None, id="exception_obj"),
+            pytest.param({"foo": Foo(bar=1)}, {"foo": {"bar": 1}}, None, id="dataclass"),
+            pytest.param({"foo": Mock()}, None, TypeError, id="error"),
+        ),
+        indirect=["exception"],
+    )
+    def test_dumps(self, engine, content, result, exception):
+        with exception:
+            assert json.loads(engine.dumps(content)) == result
+
+    @pytest.mark.parametrize(
+        ["data", "result", "exception"],
+        (
+            pytest.param(b'{"foo":[1,"bar",2.0,true,null]}', {"foo": [1, "bar", 2.0, True, None]}, None, id="bytes"),
+            pytest.param('{"foo":"bar"}', {"foo": "bar"}, None, id="str"),
+            pytest.param(b'{"foo":', None, ValueError, id="malformed"),
+        ),
+        indirect=["exception"],
+    )
+    def test_loads(self, engine, data, result, exception):
+        with exception:
+            assert engine.loads(data) == result
+
+    @pytest.mark.parametrize(
+        ["name", "env", "installed", "result", "exception"],
+        (
+            pytest.param(
+                None, {}, {"orjson": True, "msgspec": True}, json_engines.StdlibJSONEngine, None, id="default"
+            ),
+            pytest.param(
+                None,
+                {"FLAMA_JSON_ENGINE": "orjson"},
+                {"orjson": True},
+                json_engines.OrjsonJSONEngine,
+                None,
+                id="env",
+                marks=pytest.mark.skipif(not json_engines.OrjsonJSONEngine.installed(), reason="orjson not installed"),
+            ),
+            pytest.param(
+                "orjson",
+                {},
+                {"orjson": True},
+                json_engines.OrjsonJSONEngine,
+                None,
+                id="orjson",
+                marks=pytest.mark.skipif(not json_engines.OrjsonJSONEngine.installed(), reason="orjson not installed"),
+            ),
+            pytest.param("json", {"FLAMA_JSON_ENGINE": "orjson"}, {}, json_engines.StdlibJSONEngine, None, id="json"),
+            pytest.param(
+                "orjson",
+                {},
+                {"orjson": False},
+                None,
+                exceptions.DependencyNotInstalled(
+                    dependency=exceptions.DependencyNotInstalled.Dependency.orjson, dependant="orjson JSON engine"
+                ),
+                id="not_installed",
+            ),
+            pytest.param(
+                "foo",
+                {},
+                {},
+                None,
+                ValueError("Unknown JSON engine 'foo', available engines are: orjson, msgspec, json"),
+                id="unknown",
+            ),
+        ),
+        indirect=["exception"],
+    )
+    def test_setup(self, name, env, installed, result, exception):
+        with exception, patch.dict(os.environ, env, clear=True), patch(
+            "importlib.util.find_spec", side_effect=lambda x: Mock() if installed.get(x) else None
+        ):
+            engine = json_engines.setup(name)
+
+            assert isinstance(engine, result)
+            assert json_engines.engine is engine
+
+    def test_load(self):
+        json_engines.engine = None
+
+        engine = json_engines.load("json")
+
+        assert isinstance(engine, json_engines.StdlibJSONEngine)
+        assert json_engines.engine is None
+
+    @pytest.mark.parametrize(
+        ["current", "result"],
+        (
+            pytest.param(None, "global", id="global"),
+            pytest.param("current", "current", id="current"),
+        ),
+    )
+    def test_get(self, current, result):
+        engines = {"global": json_engines.StdlibJSONEngine(), "current": json_engines.StdlibJSONEngine()}
+        json_engines.engine = engines["global"]
+
+        token = json_engines.current.set(engines.get(current))  # type: ignore[arg-type]
+        try:
+            assert json_engines.get() is engines[result]
+        finally:
+            json_engines.current.reset(token)
+
+    def test_get_not_set_up(self):
+        json_engines.engine = None
+
+        with patch.dict(os.environ, {}, clear=True):
+            engine = json_engines.get()
+
+        assert isinstance(engine, json_engines.StdlibJSONEngine)
+        assert json_engines.engine is engine
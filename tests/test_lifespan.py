@@ -332,5 +332,6 @@ class TestCaseLifespan:
         await lifespan._shutdown(app)
 
         assert foo.await_args_list == [call()]
+        assert app.injector.release.call_args_list == [call()]
         if child_lifespan:
             assert lifespan.lifespan(app).__aexit__.await_args_list == [call(None, None, None)]
@@ -1,3 +1,4 @@
+import base64
 import typing as t
 from collections import namedtuple
 
@@ -9,7 +10,9 @@ import typesystem.fields
 from pytest import param
 
 from flama import schemas
+from flama.ddd import exceptions as ddd_exceptions
 from flama.pagination import paginator
+from flama.pagination.types import Cursor, CursorWindow, Page, PaginationWindow
 from tests.asserts import assert_recursive_contains
 
 
@@ -170,6 +173,26 @@ class TestCasePageNumberPagination:
                 {"meta": {"page_size": 10, "page": 1, "count": 25}, "data": [{"value": i} for i in range(10)]},
                 id="count",
             ),
+            param(
+                {"page": 0},
+                400,
+                {
+                    "detail": "Param 'page' must be greater than or equal to 1",
+                    "error": "HTTPException",
+                    "status_code": 400,
+                },
+                id="wrong_page",
+            ),
+            param(
+                {"page_size": 0},
+                400,
+                {
+                    "detail": "Param 'page_size' must be greater than or equal to 1",
+                    "error": "HTTPException",
+                    "status_code": 400,
+                },
+                id="wrong_page_size",
+            ),
         ),
     )
     async def test_params(self, client, params, status_code, expected):
@@ -177,6 +200,41 @@ class TestCasePageNumberPagination:
         assert response.status_code == status_code, response.json()
         assert response.json() == expected
 
+    @pytest.mark.parametrize(
+        ["params", "window", "expected"],
+        (
+            param(
+                {},
+                PaginationWindow(offset=0, limit=10, count=False),
+                {"meta": {"page_size": 10, "page": 1, "count": None}, "data": [{"value": i} for i in range(10)]},
+                id="default_params",
+            ),
+            param(
+                {"page": 4, "page_size": 5, "count": True},
+                PaginationWindow(offset=15, limit=5, count=True),
+                {"meta": {"page_size": 5, "page": 4, "count": 25}, "data": [{"value": i} for i in range(15, 20)]},
+                id="explicit_params",
+            ),
+        ),
+    )
+    async def test_window(self, app, client, output_schema, params, window, expected):
+        windows = []
+
+        @app.route("/page-number-window/", methods=["GET"], pagination="page_number")
+        async def page_number_window(
+            pagination: PaginationWindow, **kwargs
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            windows.append(pagination)
+            return Page(  # type: ignore[return-value]
+                data=[{"value": i} for i in range(25)][pagination.offset : pagination.offset + pagination.limit],
+                count=25 if pagination.count else None,
+            )
+
+        response = await client.get("/page-number-window/", params=params)
+        assert response.status_code == 200, response.json()
+        assert response.json() == expected
+        assert windows == [window]
+
 
 class TestCaseLimitOffsetPagination:
     @pytest.fixture(scope="function", autouse=True)
@@ -313,9 +371,340 @@ class TestCaseLimitOffsetPagination:
                 {"meta": {"limit": 10, "offset": 0, "count": 25}, "data": [{"value": i} for i in range(10)]},
                 id="count",
             ),
+            param(
+                {"limit": -1},
+                400,
+                {
+                    "detail": "Param 'limit' must be greater than or equal to 0",
+                    "error": "HTTPException",
+                    "status_code": 400,
+                },
+                id="wrong_limit",
+            ),
+            param(
+                {"offset": -1},
+                400,
+                {
+                    "detail": "Param 'offset' must be greater than or equal to 0",
+                    "error": "HTTPException",
+                    "status_code": 400,
+                },
+                id="wrong_offset",
+            ),
         ),
     )
     async def test_params(self, client, params, status_code, expected):
         response = await client.get("/limit-offset/", params=params)
         assert response.status_code == status_code, response.json()
         assert response.json() == expected
+
+    @pytest.mark.parametrize(
+        ["params", "window", "expected"],
+        (
+            param(
+                {},
+                PaginationWindow(offset=0, limit=10, count=False),
+                {"meta": {"limit": 10, "offset": 0, "count": None}, "data": [{"value": i} for i in range(10)]},
+                id="default_params",
+            ),
+            param(
+                {"limit": 20, "offset": 5, "count": True},
+                PaginationWindow(offset=5, limit=20, count=True),
+                {"meta": {"limit": 20, "offset": 5, "count": 25}, "data": [{"value": i} for i in range(5, 25)]},
+                id="explicit_params",
+            ),
+        ),
+    )
+    async def test_window(self, app, client, output_schema, params, window, expected):
+        windows = []
+
+        @app.route("/limit-offset-window/", methods=["GET"], pagination="limit_offset")
+        def limit_offset_window(
+            pagination: PaginationWindow, **kwargs
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            windows.append(pagination)
+            return Page(  # type: ignore[return-value]
+                data=[{"value": i} for i in range(25)][pagination.offset : pagination.offset + pagination.limit],
+                count=25 if pagination.count else None,
+            )
+
+        response = await client.get("/limit-offset-window/", params=params)
+        assert response.status_code == 200, response.json()
+        assert response.json() == expected
+        assert windows == [window]
+
+
+class TestCaseCursorPagination:
+    @pytest.fixture(scope="function", autouse=True)
+    def add_endpoints(self, app, output_schema):
+        @app.route("/cursor/", methods=["GET"], pagination="cursor")
+        def cursor(
+            **kwargs,
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            return [{"value": i} for i in range(25)]
+
+    def test_registered_schemas(self, app, output_schema):
+        schemas = app.schema.schema["components"]["schemas"]
+        name_prefix = output_schema.name.rsplit(".", 1)[0]
+
+        assert set(schemas.keys()) == {
+            f"{name_prefix}.OutputSchema",
+            f"{name_prefix}.CursorPaginatedOutputSchema",
+            "flama.CursorMeta",
+            "flama.APIError",
+        }
+
+    def test_invalid_view(self, output_schema):
+        with pytest.raises(TypeError, match=r"Paginated views must define \*\*kwargs param"):
+
+            @paginator._paginate_cursor
+            def invalid() -> t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(output_schema.schema)]:
+                ...
+
+    def test_invalid_response(self):
+        with pytest.raises(ValueError, match=r"Wrong schema type"):
+
+            @paginator._paginate_cursor
+            def invalid():
+                ...
+
+    def test_pagination_schema_parameters(self, app):
+        schema = app.schema.schema["paths"]["/cursor/"]["get"]
+        parameters = schema.get("parameters", [])
+
+        assert_recursive_contains(
+            {
+                "name": "count",
+                "in": "query",
+                "required": False,
+                "schema": {"anyOf": [{"type": "boolean"}, {"type": "null"}], "default": False},
+            },
+            parameters[0],
+        )
+        assert_recursive_contains(
+            {
+                "name": "cursor",
+                "in": "query",
+                "required": False,
+                "schema": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            },
+            parameters[1],
+        )
+        assert_recursive_contains(
+            {
+                "name": "limit",
+                "in": "query",
+                "required": False,
+                "schema": {"anyOf": [{"type": "integer"}, {"type": "null"}]},
+            },
+            parameters[2],
+        )
+
+    def test_pagination_schema_return(self, app, output_schema):
+        prefix, name = output_schema.name.rsplit(".", 1)
+        paginated_output_schema_name = f"{prefix}.CursorPaginated{name}"
+
+        response_schema = app.schema.schema["paths"]["/cursor/"]["get"]["responses"]["200"]
+        component_schema = app.schema.schema["components"]["schemas"][paginated_output_schema_name]
+
+        assert "data" in component_schema["properties"]
+        assert component_schema["properties"]["data"]["items"] == {"$ref": f"#/components/schemas/{output_schema.name}"}
+        assert component_schema["properties"]["data"]["type"] == "array"
+        assert set(component_schema["required"]) == {"meta", "data"}
+        assert component_schema["type"] == "object"
+
+        assert response_schema == {
+            "description": "Description not provided.",
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": f"#/components/schemas/{paginated_output_schema_name}"},
+                }
+            },
+        }
+
+    async def test_async_function(self, app, client, output_schema):
+        @app.route("/cursor-async/", methods=["GET"], pagination="cursor")
+        async def cursor_async(
+            **kwargs,
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            return [{"value": i} for i in range(25)]
+
+        response = await client.get("/cursor-async/")
+        assert response.status_code == 200, response.json()
+        assert response.json() == {
+            "meta": {"limit": 10, "next": Cursor((10,)).encode(), "prev": None, "count": None},
+            "data": [{"value": i} for i in range(10)],
+        }
+
+    @pytest.mark.parametrize(
+        "params,status_code,expected",
+        (
+            param(
+                {},
+                200,
+                {
+                    "meta": {"limit": 10, "next": Cursor((10,)).encode(), "prev": None, "count": None},
+                    "data": [{"value": i} for i in range(10)],
+                },
+                id="default_params",
+            ),
+            param(
+                {"limit": 5, "cursor": Cursor((5,)).encode()},
+                200,
+                {
+                    "meta": {"limit": 5, "next": Cursor((10,)).encode(), "prev": Cursor((0,)).encode(), "count": None},
+                    "data": [{"value": i} for i in range(5, 10)],
+                },
+                id="explicit_cursor_and_limit",
+            ),
+            param(
+                {"cursor": Cursor((20,)).encode(), "count": True},
+                200,
+                {
+                    "meta": {"limit": 10, "next": None, "prev": Cursor((10,)).encode(), "count": 25},
+                    "data": [{"value": i} for i in range(20, 25)],
+                },
+                id="last_page_and_count",
+            ),
+            param(
+                {"cursor": "foo"},
+                400,
+                {"detail": "Malformed cursor", "error": "HTTPException", "status_code": 400},
+                id="malformed_cursor",
+            ),
+            param(
+                {"cursor": Cursor(("foo",)).encode()},
+                400,
+                {"detail": "Malformed cursor", "error": "HTTPException", "status_code": 400},
+                id="wrong_cursor",
+            ),
+            param(
+                {"limit": 0},
+                400,
+                {
+                    "detail": "Param 'limit' must be greater than or equal to 1",
+                    "error": "HTTPException",
+                    "status_code": 400,
+                },
+                id="wrong_limit",
+            ),
+        ),
+    )
+    async def test_params(self, client, params, status_code, expected):
+        response = await client.get("/cursor/", params=params)
+        assert response.status_code == status_code, response.json()
+        assert response.json() == expected
+
+    @pytest.mark.parametrize(
+        ["params", "window", "expected"],
+        (
+            param(
+                {"limit": 2},
+                CursorWindow(limit=2, cursor=None, count=False),
+                {
+                    "meta": {"limit": 2, "next": Cursor((1,)).encode(), "prev": None, "count": None},
+                    "data": [{"value": 0}, {"value": 1}],
+                },
+                id="first_page",
+            ),
+            param(
+                {"limit": 2, "cursor": Cursor((1,)).encode(), "count": True},
+                CursorWindow(limit=2, cursor=Cursor((1,)), count=True),
+                {
+                    "meta": {
+                        "limit": 2,
+                        "next": Cursor((3,)).encode(),
+                        "prev": Cursor((2,), backwards=True).encode(),
+                        "count": 25,
+                    },
+                    "data": [{"value": 2}, {"value": 3}],
+                },
+                id="next_page",
+            ),
+            param(
+                {"limit": 2, "cursor": Cursor((2,), backwards=True).encode()},
+                CursorWindow(limit=2, cursor=Cursor((2,), backwards=True), count=False),
+                {
+                    "meta": {"limit": 2, "next": Cursor((1,)).encode(), "prev": None, "count": None},
+                    "data": [{"value": 0}, {"value": 1}],
+                },
+                id="prev_page",
+            ),
+        ),
+    )
+    async def test_window(self, app, client, output_schema, params, window, expected):
+        windows = []
+
+        @app.route("/cursor-window/", methods=["GET"], pagination="cursor")
+        async def cursor_window(
+            pagination: CursorWindow, **kwargs
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            windows.append(pagination)
+            keyset_params = pagination.keyset_params()
+            elements = [{"value": i} for i in range(25)]
+            if keyset_params["order_direction"] == "desc":
+                elements.reverse()
+            if keyset_params["keyset"] is not None:
+                (value,) = keyset_params["keyset"]
+                elements = [x for x in elements if (x["value"] < value if pagination.backwards else x["value"] > value)]
+
+            return pagination.page(  # type: ignore[return-value]
+                elements[: keyset_params["limit"]],
+                key=lambda x: (x["value"],),
+                count=25 if pagination.count else None,
+            )
+
+        response = await client.get("/cursor-window/", params=params)
+        assert response.status_code == 200, response.json()
+        assert response.json() == expected
+        assert windows == [window]
+
+    @pytest.mark.parametrize(["is_async"], (param(False, id="sync"), param(True, id="async")))
+    async def test_wrong_keyset(self, app, client, output_schema, is_async):
+        def cursor_keyset(
+            **kwargs,
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            raise ddd_exceptions.KeysetError("Malformed keyset")
+
+        async def cursor_keyset_async(
+            **kwargs,
+        ) -> t.Annotated[list[schemas.SchemaType], schemas.SchemaMetadata(output_schema.schema)]:
+            raise ddd_exceptions.KeysetError("Malformed keyset")
+
+        app.add_route(
+            "/cursor-keyset/", cursor_keyset_async if is_async else cursor_keyset, methods=["GET"], pagination="cursor"
+        )
+
+        response = await client.get("/cursor-keyset/", params={"cursor": Cursor(("foo", 1)).encode()})
+        assert response.status_code == 400, response.json()
+        assert response.json() == {"detail": "Malformed keyset", "error": "HTTPException", "status_code": 400}
+
+
+class TestCaseCursor:
+    @pytest.mark.parametrize(
+        ["cursor"],
+        (
+            param(Cursor((1,)), id="forward"),
+            param(Cursor(("foo", 1), backwards=True), id="backwards"),
+        ),
+    )
+    def test_encode_decode(self, cursor):
+        encoded = cursor.encode()
+
+        assert "=" not in encoded
+        assert Cursor.decode(encoded) == cursor
+
+    @pytest.mark.parametrize(
+        ["cursor"],
+        (
+            param("foo", id="not_base64"),
+            param("e30", id="missing_keys"),
+            param(base64.urlsafe_b64encode(b"[1]").decode(), id="not_object"),
+            param(base64.urlsafe_b64encode(b'{"values":"foo","backwards":false}').decode(), id="values_not_list"),
+            param(base64.urlsafe_b64encode(b'{"values":[1],"backwards":"foo"}').decode(), id="backwards_not_bool"),
+            param(base64.urlsafe_b64encode(b'{"values":[[1]],"backwards":false}').decode(), id="nested_values"),
+        ),
+    )
+    def test_decode_malformed(self, cursor):
+        with pytest.raises(ValueError, match="Malformed cursor"):
+            Cursor.decode(cursor)
@@ -1,14 +1,58 @@
+import typing as t
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
-from flama import endpoints, exceptions, types, url, websockets
+from flama import endpoints, exceptions, http, schemas, types, url, websockets
 from flama.applications import Flama
 from flama.client import Client
 from flama.endpoints import HTTPEndpoint, WebSocketEndpoint
 from flama.injection import Component, Components
 from flama.lifespan import Lifespan
-from flama.routing import BaseRoute, EndpointWrapper, Match, Mount, Route, Router, WebSocketRoute
+from flama.routing import (
+    BaseRoute,
+    EndpointWrapper,
+    Match,
+    Mount,
+    Route,
+    Router,
+    RouteResolution,
+    RoutesIndex,
+    WebSocketRoute,
+)
+
+
+class TestCaseEndpointWrapper:
+    @pytest.mark.parametrize(
+        ["schema", "expected_schema"],
+        (
+            pytest.param(True, True, id="schema"),
+            pytest.param(False, False, id="no_schema"),
+        ),
+    )
+    def test_response_schema(self, app, schema, expected_schema):
+        return_annotation = t.Annotated[schemas.SchemaType, schemas.SchemaMetadata(schemas.schemas.APIError)]
+
+        def foo() -> return_annotation if schema else dict:  # type: ignore[valid-type]
+            ...
+
+        wrapper = EndpointWrapper(foo, EndpointWrapper.type.http)
+
+        with patch.object(schemas.Schema, "from_type", wraps=schemas.Schema.from_type) as from_type_mock:
+            response_schema = wrapper.response_schema
+
+            assert wrapper.response_schema is response_schema
+            response = wrapper._build_api_response(
+                {"detail": "foo", "error": "ValueError", "status_code": 400, "headers": {}}
+            )
+
+        assert from_type_mock.call_count == 1
+        assert isinstance(response, http.APIResponse)
+        assert response.schema is response_schema
+        if expected_schema:
+            assert response_schema == schemas.Schema(schema=schemas.Schema.from_type(return_annotation).unique_schema)
+        else:
+            assert response_schema is None
 
 
 class TestCaseBaseRoute:
@@ -183,6 +227,32 @@ class TestCaseRoute:
         assert route.include_in_schema is False
         assert route.methods == expected_methods
 
+    @pytest.mark.parametrize(
+        ["endpoint", "handlers"],
+        (
+            pytest.param("function", ["foo"], id="function"),
+            pytest.param("endpoint", ["get", "post"], id="endpoint"),
+        ),
+        indirect=["endpoint"],
+    )
+    def test_build(self, endpoint, handlers):
+        app = Flama(schema=None, docs=None)
+        route = Route("/", endpoint)
+
+        with patch.object(app.injector, "compile_function", wraps=app.injector.compile_function) as compile_mock:
+            route.build(app)
+
+        assert {x.args[0].__name__ for x in compile_mock.call_args_list} == set(handlers)
+
+    def test_build_unresolved_handler(self):
+        def foo(x: object):
+            ...
+
+        app = Flama(schema=None, docs=None)
+
+        # Building does not fail, the error is raised when performing a request
+        app.add_route("/", foo)
+
     @pytest.mark.parametrize(
         ["scope_type", "handle_call"],
         (
@@ -546,6 +616,58 @@ class TestCaseMount:
         assert mount.routes == [route]
 
 
+class TestCaseRoutesIndex:
+    @pytest.fixture(scope="function")
+    def routes(self):
+        def foo():
+            ...
+
+        return [
+            Route("/", foo, name="root"),
+            Route("/foo/", foo, name="foo"),
+            Route("/foo/{x:int}/", foo, name="foo_int"),
+            Route("/foo/{x:uuid}/", foo, name="foo_uuid"),
+            Route("/foo/{x}/bar/", foo, name="foo_str_bar"),
+            Route("/foo/bar/", foo, methods=["POST"], name="foo_bar"),
+            Route("/float/{x:float}/", foo, name="float"),
+            Route("/file/{name}.json", foo, name="file"),
+            Route("/path/{x:path}", foo, name="path"),
+            WebSocketRoute("/foo/", foo, name="ws_foo"),
+            Mount("/mount", routes=[], name="mount"),
+            Mount("/{tenant}/nested", routes=[], name="nested_mount"),
+        ]
+
+    @pytest.fixture(scope="function")
+    def index(self, routes):
+        return RoutesIndex(routes)
+
+    def test_init(self, index, routes):
+        assert len(index) == len(routes)
+        assert index.routes == routes
+
+    @pytest.mark.parametrize(
+        ["path", "result"],
+        (
+            pytest.param("/", ["root"], id="root"),
+            pytest.param("/foo/", ["foo", "ws_foo"], id="static"),
+            pytest.param("/foo/1/", ["foo_int"], id="int"),
+            pytest.param("/foo/00000000-0000-0000-0000-000000000000/", ["foo_uuid"], id="uuid"),
+            pytest.param("/foo/bar/", ["foo_bar"], id="static_over_param"),
+            pytest.param("/foo/bar/bar/", ["foo_str_bar"], id="str"),
+            pytest.param("/foo/1/bar/", ["foo_str_bar"], id="str_int_value"),
+            pytest.param("/mount/foo/", ["mount"], id="mount"),
+            pytest.param("/mountfoo", ["mount"], id="mount_prefix"),
+            pytest.param("/bar/nested/foo/", ["nested_mount"], id="mount_param"),
+            pytest.param("/unknown/", [], id="not_found"),
+        ),
+    )
+    def test_candidates(self, index, path, result):
+        fallback = ["float", "file", "path"]
+
+        assert [x.name for x in index.candidates(path) if x.name not in fallback] == result
+        assert [x.name for x in index.candidates(path) if x.name in fallback] == fallback
+
+
 class TestCaseRouter:
     @pytest.fixture(scope="function")
     def app(self):
@@ -949,6 +1071,144 @@ class TestCaseRouter:
         with pytest.raises(exceptions.MethodNotAllowedException):
             route, route_scope = app.router.resolve_route(scope=asgi_scope)
 
+    @pytest.mark.parametrize(
+        ["path", "method", "exception"],
+        (
+            pytest.param("/foo/", "GET", None, id="route"),
+            pytest.param("/foo/1/", "GET", None, id="route_param"),
+            pytest.param("/foo/bar/", "GET", None, id="route_partial_then_full"),
+            pytest.param("/bar/", "POST", exceptions.MethodNotAllowedException("/bar/", "POST", {"PUT"}), id="partial"),
+            pytest.param("/router/foo/", "GET", None, id="mount"),
+            pytest.param("/router/bar/", "GET", exceptions.NotFoundException, id="mount_not_found"),
+            pytest.param("/baz/", "GET", exceptions.NotFoundException, id="not_found"),
+        ),
+        indirect=["exception"],
+    )
+    def test_resolve_route_compiled(self, path, method, exception, asgi_scope):
+        def foo():
+            ...
+
+        def routes():
+            return [
+                Route("/foo/", foo, methods=["GET", "PUT"]),
+                Route("/foo/{x:int}/", foo),
+                Route("/foo/{x}/", foo, methods=["DELETE"]),
+                Route("/foo/{x}/", foo, name="foo_str"),
+                Route("/bar/", foo, methods=["PUT"]),
+                Mount("/router", routes=[Route("/foo/", foo)]),
+            ]
+
+        app = Flama(routes=routes(), schema=None, docs=None)
+        compiled_app = Flama(routes=routes(), schema=None, docs=None, compiled_router=True)
+        asgi_scope["path"] = path
+        asgi_scope["method"] = method
+
+        assert compiled_app.router.compiled
+        assert compiled_app.routes[-1].app.compiled
+
+        with exception:
+            route, route_scope = app.router.resolve_route(types.Scope({**asgi_scope}))
+
+        with exception:
+            compiled_route, compiled_route_scope = compiled_app.router.resolve_route(types.Scope({**asgi_scope}))
+
+            assert compiled_route == route
+            assert compiled_route_scope["path_params"] == route_scope["path_params"]
+
+    def test_resolve_route_compiled_add_route(self, asgi_scope):
+        app = Flama(schema=None, docs=None, compiled_router=True)
+        asgi_scope["path"] = "/foo/"
+
+        with pytest.raises(exceptions.NotFoundException):
+            app.router.resolve_route(asgi_scope)
+
+        @app.route("/foo/")
+        def foo():
+            ...
+
+        route, _ = app.router.resolve_route(asgi_scope)
+
+        assert route.endpoint == foo
+
+    @pytest.mark.parametrize(
+        ["mutation"],
+        (
+            pytest.param(lambda router, route: setattr(router, "routes", [route]), id="replace"),
+            pytest.param(lambda router, route: router.routes.__setitem__(0, route), id="set_item"),
+            pytest.param(lambda router, route: router.routes.insert(0, route), id="insert"),
+        ),
+    )
+    def test_resolve_route_compiled_mutated_routes(self, mutation, asgi_scope):
+        app = Flama(schema=None, docs=None, compiled_router=True)
+        asgi_scope["path"] = "/foo/"
+
+        @app.route("/bar/")
+        def bar():
+            ...
+
+        with pytest.raises(exceptions.NotFoundException):
+            app.router.resolve_route(asgi_scope)
+
+        def foo():
+            ...
+
+        mutation(app.router, Route("/foo/", foo))
+
+        route, _ = app.router.resolve_route(asgi_scope)
+
+        assert route.endpoint == foo
+
+    def test_resolve_route_reuse_resolution(self, app, asgi_scope):
+        @app.route("/foo/")
+        async def foo():
+            return "foo"
+
+        @app.route("/bar/")
+        async def bar():
+            return "bar"
+
+        asgi_scope["path"] = "/foo/"
+        route, route_scope = app.router.resolve_route(asgi_scope)
+
+        with patch.object(app.router, "_match_route", wraps=app.router._match_route) as match_mock:
+            cached_route, cached_route_scope = app.router.resolve_route(asgi_scope)
+            assert match_mock.call_count == 0
+
+            asgi_scope["path"] = "/bar/"
+            other_route, _ = app.router.resolve_route(asgi_scope)
+            assert match_mock.call_count == 1
+
+        assert cached_route == route
+        assert cached_route_scope == route_scope
+        assert route_scope[RouteResolution.SCOPE_KEY].route == route
+        assert other_route.endpoint == bar
+
+    @pytest.mark.parametrize(
+        ["endpoint_type"],
+        (pytest.param("function", id="function"), pytest.param("endpoint", id="endpoint")),
+    )
+    async def test_request_resolves_route_once(self, endpoint_type, app):
+        if endpoint_type == "function":
+
+            @app.route("/foo/{x:int}/")
+            async def foo(x: int):
+                return {"x": x}
+
+        else:
+
+            @app.route("/foo/{x:int}/")
+            class FooEndpoint(HTTPEndpoint):
+                async def get(self, x: int):
+                    return {"x": x}
+
+        async with Client(app) as client:
+            with patch.object(app.router, "_match_route", wraps=app.router._match_route) as match_mock:
+                response = await client.get("/foo/1/")
+
+        assert response.status_code == 200
+        assert response.json() == {"x": 1}
+        assert match_mock.call_count == 1
+
     def test_resolve_route_not_found(self, app, asgi_scope):
         asgi_scope["path"] = "/foo/"
         asgi_scope["method"] = "GET"
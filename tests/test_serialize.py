@@ -1,14 +1,24 @@
 import datetime
+import importlib.util
 import json
+import os
+import struct
 import tempfile
 import uuid
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 import flama
-from flama.serialize.data_structures import Compression
+from flama import exceptions
+from flama.serialize.container import ModelContainer
+from flama.serialize.data_structures import Compression, FrameworkInfo, Metadata, ModelArtifact, ModelInfo
+from flama.serialize.serializers.sklearn import SKLearnSerializer
 from flama.serialize.types import Framework
 
+zstandard_installed = importlib.util.find_spec("zstandard") is not None
+
 
 class TestCaseSerialize:
     @pytest.fixture(scope="function")
@@ -17,6 +27,7 @@ class TestCaseSerialize:
             json.dump({"foo": "bar"}, tmp)
             yield tmp.name
 
+    @pytest.mark.parametrize("format_version", (pytest.param(1, id="v1"), pytest.param(2, id="v2")))
     @pytest.mark.parametrize(
         ("lib", "model", "serialized_model_class"),
         (
@@ -28,7 +39,7 @@ class TestCaseSerialize:
         ),
         indirect=["model", "serialized_model_class"],
     )
-    def test_serialize(self, lib, artifact, model, serialized_model_class):
+    def test_serialize(self, lib, artifact, model, serialized_model_class, format_version):
         id_ = uuid.uuid4()
         timestamp = datetime.datetime.utcnow()
         params = {"param": "1"}
@@ -46,6 +57,7 @@ class TestCaseSerialize:
                 metrics=metrics,
                 extra=extra,
                 artifacts={"foo.json": artifact},
+                format_version=format_version,
             )
 
             load_model = flama.load(tmp.name)
@@ -58,3 +70,187 @@ class TestCaseSerialize:
         assert load_model.meta.model.metrics == metrics
         assert load_model.meta.extra == extra
         assert "foo.json" in load_model.artifacts
+
+
+class TestCaseModelArtifact:
+    @pytest.fixture(scope="function")
+    def model_artifact(self):
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json") as artifact:
+            json.dump({"foo": "bar"}, artifact)
+            artifact.flush()
+
+            yield ModelArtifact(
+                model={"foo": [1, 2, 3]},
+                meta=Metadata(
+                    id=uuid.UUID("00000000-0000-0000-0000-000000000001"),
+                    timestamp=datetime.datetime(2023, 9, 20, 11, 30, 0),
+                    framework=FrameworkInfo(lib=Framework.sklearn, version="1.0.0"),
+                    model=ModelInfo(obj="dict", info=None, params={"param": 1}, metrics=None),
+                    extra={"foo": "bar"},
+                ),
+                artifacts={"foo.json": artifact.name},
+            )
+
+    @pytest.fixture(autouse=True)
+    def serializer_version(self):
+        with patch.object(SKLearnSerializer, "version", return_value="1.0.0"):
+            yield
+
+    @pytest.mark.parametrize(
+        ["format_version", "compression", "container"],
+        (
+            pytest.param(1, Compression.none, False, id="v1-none"),
+            pytest.param(1, Compression.standard, False, id="v1-standard"),
+            pytest.param(2, Compression.none, True, id="v2-none"),
+            pytest.param(
+                2,
+                Compression.fast,
+                True,
+                id="v2-fast",
+                marks=pytest.mark.skipif(not zstandard_installed, reason="zstandard not installed"),
+            ),
+        ),
+    )
+    def test_dump_load(self, model_artifact, format_version, compression, container):
+        with tempfile.NamedTemporaryFile(suffix=".flm") as tmp:
+            model_artifact.dump(tmp.name, compression, format_version=format_version)
+
+            assert ModelContainer.is_container(tmp.name) is container
+
+            loaded = ModelArtifact.load(tmp.name)
+
+        assert loaded.model == model_artifact.model
+        assert loaded.meta == model_artifact.meta
+        assert list(loaded.artifacts) == ["foo.json"]
+        with open(loaded.artifacts["foo.json"]) as f:
+            assert json.load(f) == {"foo": "bar"}
+
+    def test_dump_default_version(self, model_artifact):
+        with tempfile.NamedTemporaryFile(suffix=".flm") as tmp:
+            model_artifact.dump(tmp.name)
+
+            assert not ModelContainer.is_container(tmp.name)
+            assert ModelArtifact.load(tmp.name).model == model_artifact.model
+
+    def test_dump_default_compression_version_2(self, model_artifact):
+        with tempfile.NamedTemporaryFile(suffix=".flm") as tmp, patch("flama.serialize.container.zstandard", None):
+            model_artifact.dump(tmp.name, format_version=2)
+            container = ModelContainer(tmp.name)
+
+            assert all(member["compression"] is None for member in container.members.values())
+            assert ModelArtifact.load(tmp.name).model == model_artifact.model
+
+    def test_dump_raw_model(self, model_artifact):
+        with tempfile.NamedTemporaryFile(suffix=".flm") as tmp:
+            model_artifact.dump(tmp.name, Compression.none, format_version=2)
+            container = ModelContainer(tmp.name)
+
+            assert container.meta == model_artifact.meta.to_dict()
+            assert container.read("model") == SKLearnSerializer().dump(model_artifact.model)
+
+    def test_dump_wrong_version(self, model_artifact):
+        with pytest.raises(ValueError, match="Unknown Flama format version '3'"):
+            model_artifact.dump(os.devnull, format_version=3)
+
+    def test_load_without_artifacts(self, model_artifact):
+        with tempfile.NamedTemporaryFile(suffix=".flm") as tmp:
+            ModelArtifact(model=model_artifact.model, meta=model_artifact.meta).dump(tmp.name)
+
+            loaded = ModelArtifact.load(tmp.name)
+
+        assert loaded.model == model_artifact.model
+        assert loaded.artifacts is None
+
+    @pytest.mark.parametrize(
+        ["name"],
+        (
+            pytest.param("artifacts/../../foo.json", id="outside"),
+            pytest.param("artifacts/../model", id="model"),
+            pytest.param("artifacts/foo/../../../foo.json", id="nested"),
+        ),
+    )
+    def test_load_wrong_artifact_name(self, model_artifact, name):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "model.flm"
+            ModelContainer.write(
+                path,
+                model_artifact.meta.to_dict(),
+                {"model": SKLearnSerializer().dump(model_artifact.model), name: b"foo"},
+            )
+
+            extract_directory = Path(directory) / "model"
+            extract_directory.mkdir()
+
+            with patch("tempfile.mkdtemp", return_value=str(extract_directory)), pytest.raises(
+                ValueError, match="Wrong artifact name"
+            ):
+                ModelArtifact.load(path)
+
+            assert sorted(x.name for x in Path(directory).iterdir()) == ["model.flm"]
+
+
+class TestCaseModelContainer:
+    @pytest.fixture(scope="function")
+    def path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            yield Path(directory)
+
+    def test_write_read(self, path):
+        (path / "artifact").write_bytes(b"bar" * 10)
+
+        ModelContainer.write(path / "model.flm", {"foo": "bar"}, {"model": b"foo", "artifact": path / "artifact"})
+        container = ModelContainer(path / "model.flm")
+
+        assert container.meta == {"foo": "bar"}
+        assert container.members == {
+            "model": {"offset": 0, "size": 3, "raw_size": 3, "compression": None},
+            "artifact": {"offset": 3, "size": 30, "raw_size": 30, "compression": None},
+        }
+        assert container.read("model") == b"foo"
+        assert container.read("artifact") == b"bar" * 10
+
+        container.extract("artifact", path / "extracted" / "artifact")
+        assert (path / "extracted" / "artifact").read_bytes() == b"bar" * 10
+
+    @pytest.mark.skipif(not zstandard_installed, reason="zstandard not installed")
+    def test_write_read_compressed(self, path):
+        ModelContainer.write(path / "model.flm", {}, {"model": b"foo" * 100}, compression_level=3)
+        container = ModelContainer(path / "model.flm")
+
+        assert container.members["model"]["compression"] == "zstd"
+        assert container.members["model"]["size"] < 300
+        assert container.read("model") == b"foo" * 100
+
+        container.extract("model", path / "model")
+        assert (path / "model").read_bytes() == b"foo" * 100
+
+    @pytest.mark.skipif(zstandard_installed, reason="zstandard installed")
+    def test_write_compressed_not_installed(self, path):
+        with pytest.raises(exceptions.DependencyNotInstalled):
+            ModelContainer.write(path / "model.flm", {}, {"model": b"foo"}, compression_level=3)
+
+    @pytest.mark.parametrize(
+        ["content"],
+        (
+            pytest.param(b"", id="empty"),
+            pytest.param(b"foo", id="not_container"),
+            pytest.param(struct.pack("<8sHQ", ModelContainer.MAGIC, 3, 0), id="wrong_version"),
+        ),
+    )
+    def test_init_wrong_file(self, path, content):
+        (path / "model.flm").write_bytes(content)
+
+        with pytest.raises(ValueError, match="is not in Flama format v2"):
+            ModelContainer(path / "model.flm")
+
+    def test_read_truncated(self, path):
+        ModelContainer.write(path / "model.flm", {}, {"model": b"foo"})
+        with open(path / "model.flm", "r+b") as f:
+            f.truncate(os.path.getsize(path / "model.flm") - 1)
+        container = ModelContainer(path / "model.flm")
+
+        with pytest.raises(ValueError, match="is truncated"):
+            container.read("model")
+
+        with pytest.raises(ValueError, match="is truncated"):
+            container.extract("model", path / "model")
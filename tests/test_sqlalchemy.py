@@ -7,7 +7,14 @@ from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncTransactio
 from flama import Flama
 from flama.client import Client
 from flama.exceptions import ApplicationError, SQLAlchemyError
-from flama.sqlalchemy import ConnectionManager, MultipleConnectionManager, SingleConnectionManager, SQLAlchemyModule
+from flama.sqlalchemy import (
+    ConnectionManager,
+    LeastConnectionsPolicy,
+    MultipleConnectionManager,
+    RoundRobinPolicy,
+    SingleConnectionManager,
+    SQLAlchemyModule,
+)
 
 
 @pytest.fixture(scope="function")
@@ -55,6 +62,7 @@ class TestCaseSingleConnectionManager:
         first_connection = await connection_manager.open()
 
         assert connection_manager._connection_clients == 1
+        assert connection_manager.clients == 1
         assert connection_manager._connection == first_connection
 
         second_connection = await connection_manager.open()
@@ -140,6 +148,7 @@ class TestCaseMultipleConnectionManager:
         first_connection = await connection_manager.open()
 
         assert connection_manager._connections == {first_connection}
+        assert connection_manager.clients == 1
 
         second_connection = await connection_manager.open()
 
@@ -158,6 +167,27 @@ class TestCaseMultipleConnectionManager:
 
         assert connection_manager._connections == set()
 
+    @pytest.mark.parametrize(["read_only"], (pytest.param(False, id="read_write"), pytest.param(True, id="read_only")))
+    async def test_open_read_only(self, connection_manager, read_only):
+        connection = await connection_manager.open(read_only=read_only)
+
+        try:
+            options = connection.sync_connection.get_execution_options()
+            assert (options.get("isolation_level") == "AUTOCOMMIT") is read_only
+            assert options.get("postgresql_readonly", False) is (read_only and connection.dialect.name == "postgresql")
+            assert connection_manager.autocommit(connection) is read_only
+
+            if read_only:
+                await connection.execute(sqlalchemy.text("SELECT 1"))
+
+            transaction = await connection_manager.begin(connection)
+            assert connection.in_transaction()
+            assert connection.sync_connection.get_execution_options().get("isolation_level") != "AUTOCOMMIT"
+            assert not connection_manager.autocommit(connection)
+            await connection_manager.end(transaction)
+        finally:
+            await connection_manager.close(connection)
+
     @pytest.mark.parametrize(
         ["rollback", "commit_calls", "rollback_calls"],
         (
@@ -210,6 +240,21 @@ class TestCaseMultipleConnectionManager:
             assert connection_manager._transactions == {}
 
 
+class TestCaseRoundRobinPolicy:
+    def test_select(self):
+        managers = [Mock(spec=ConnectionManager), Mock(spec=ConnectionManager)]
+        policy = RoundRobinPolicy()
+
+        assert [policy.select(managers) for _ in range(3)] == [managers[0], managers[1], managers[0]]
+
+
+class TestCaseLeastConnectionsPolicy:
+    def test_select(self):
+        managers = [Mock(spec=ConnectionManager, clients=2), Mock(spec=ConnectionManager, clients=1)]
+
+        assert LeastConnectionsPolicy().select(managers) == managers[1]
+
+
 class TestCaseSQLAlchemyModule:
     @pytest.mark.parametrize(
         ["uri", "exception"],
@@ -233,6 +278,63 @@ class TestCaseSQLAlchemyModule:
             assert app.sqlalchemy._engine is None
             assert app.sqlalchemy._connection_manager is None
 
+    async def test_lifespan_cycle_replicas(self):
+        app = Flama(modules={SQLAlchemyModule("sqlite+aiosqlite://", replicas=["sqlite+aiosqlite://"] * 2)})
+
+        async with Client(app):
+            assert len(app.sqlalchemy._replica_managers) == 2
+            for engine, manager in app.sqlalchemy._replica_managers.items():
+                assert isinstance(engine, AsyncEngine)
+                assert engine is not app.sqlalchemy.engine
+                assert isinstance(manager, ConnectionManager)
+
+        assert app.sqlalchemy._replica_managers == {}
+
+    def test_init_wrong_replica_policy(self):
+        with pytest.raises(
+            ApplicationError,
+            match="Unknown replica policy 'foo', available policies are: round_robin, least_connections",
+        ):
+            SQLAlchemyModule("sqlite+aiosqlite://", replica_policy="foo")
+
+    @pytest.mark.parametrize(
+        ["replicas", "read_only", "replica"],
+        (
+            pytest.param(0, False, False, id="primary"),
+            pytest.param(0, True, False, id="read_only_no_replicas"),
+            pytest.param(2, False, False, id="read_write_with_replicas"),
+            pytest.param(2, True, True, id="read_only_with_replicas"),
+        ),
+    )
+    async def test_replica_routing(self, replicas, read_only, replica):
+        app = Flama(
+            modules={
+                SQLAlchemyModule(
+                    "sqlite+aiosqlite://",
+                    replicas=["sqlite+aiosqlite://"] * replicas,
+                    replica_policy="least_connections",
+                )
+            }
+        )
+
+        async with Client(app):
+            connections = [await app.sqlalchemy.open_connection(read_only=read_only) for _ in range(2)]
+            transactions = [await app.sqlalchemy.begin_transaction(c) for c in connections]
+
+            engines = {c.engine for c in connections}
+            if replica:
+                assert engines == set(app.sqlalchemy._replica_managers)
+                assert [m.clients for m in app.sqlalchemy._replica_managers.values()] == [1, 1]
+            else:
+                assert engines == {app.sqlalchemy.engine}
+
+            for connection, transaction in zip(connections, transactions):
+                await app.sqlalchemy.end_transaction(transaction)
+                await app.sqlalchemy.close_connection(connection)
+
+            assert app.sqlalchemy.connection_manager.clients == 0
+            assert [m.clients for m in app.sqlalchemy._replica_managers.values()] == [0] * replicas
+
     def test_engine_not_initialized(self, app):
         with pytest.raises(ApplicationError, match="SQLAlchemyModule not initialized"):
             app.sqlalchemy.engine
@@ -247,7 +349,31 @@ class TestCaseSQLAlchemyModule:
         with patch.object(app.sqlalchemy, "_connection_manager", connection_manager_mock):
             await app.sqlalchemy.open_connection()
 
-        assert connection_manager_mock.open.await_args_list == [call()]
+        assert connection_manager_mock.open.await_args_list == [call(read_only=False)]
+
+    async def test_open_connection_read_only(self, app):
+        connection_manager_mock = AsyncMock(spec=ConnectionManager)
+        replica_manager_mock = AsyncMock(spec=ConnectionManager)
+
+        with patch.multiple(
+            app.sqlalchemy,
+            _connection_manager=connection_manager_mock,
+            _replica_managers={Mock(spec=AsyncEngine): replica_manager_mock},
+        ):
+            await app.sqlalchemy.open_connection(read_only=True)
+
+        assert connection_manager_mock.open.await_args_list == []
+        assert replica_manager_mock.open.await_args_list == [call(read_only=True)]
+
+    async def test_autocommit(self, app):
+        connection_manager_mock = Mock(spec=ConnectionManager)
+        connection_manager_mock.autocommit.return_value = True
+        connection_mock = Mock(spec=AsyncConnection)
+
+        with patch.object(app.sqlalchemy, "_connection_manager", connection_manager_mock):
+            assert app.sqlalchemy.autocommit(connection_mock)
+
+        assert connection_manager_mock.autocommit.call_args_list == [call(connection_mock)]
 
     async def test_close_connection(self, app):
         connection_manager_mock = AsyncMock(spec=ConnectionManager)
@@ -1,9 +1,11 @@
 import datetime
 import typing
+from unittest.mock import patch
 
 import pytest
 
 from flama.injection.exceptions import ComponentNotFound
+from flama.schemas.data_structures import Schema
 
 
 class TestCaseParamsValidation:
@@ -229,6 +231,23 @@ class TestCaseParamsValidation:
         response = await client.get(url)
         assert response.json() == {"param": None}
 
+    @pytest.mark.parametrize(
+        ["url", "params"],
+        [
+            pytest.param("/int-path-param/1/", {}, id="path"),
+            pytest.param("/int-query-param/", {"param": 1}, id="query"),
+        ],
+    )
+    async def test_validation_schemas_reused(self, url, params, client):
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+
+        with patch.object(Schema, "build", wraps=Schema.build) as build_mock:
+            response = await client.get(url, params=params)
+            assert response.status_code == 200
+
+        assert build_mock.call_count == 0
+
     async def test_wrong_query_param(self, client):
         response = await client.get("/int-query-param/?param=foo")
         assert response.status_code == 400